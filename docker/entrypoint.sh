@@ -9,6 +9,12 @@ python pokedex/manage.py migrate --noinput
 echo "→ Collecting static files"
 python pokedex/manage.py collectstatic --noinput --clear || true
 
+# Dataset snapshot – ak je k dispozícii, naplní prázdnu DB bez crawlovania PokeAPI
+if [ -n "$POKEDEX_SNAPSHOT" ] && [ -f "$POKEDEX_SNAPSHOT" ]; then
+  echo "→ Importing dataset snapshot"
+  python pokedex/manage.py import_snapshot "$POKEDEX_SNAPSHOT" --if-empty --quiet || true
+fi
+
 echo "→ Collecting pokemon api data"
 python pokedex/manage.py sync_everything || true
 
@@ -99,4 +99,125 @@ LOGOUT_REDIRECT_URL = "pokemon:pokemon_list"
 # --- Email (dev) ---
 EMAIL_BACKEND = "django.core.mail.backends.console.EmailBackend"
 
+# --- PokeAPI client ---
+# In-process LRU in front of ApiResourceCache (see pokemon.services.api.memory).
+POKEAPI_MEMORY_CACHE = {
+    "ENABLED": os.getenv("POKEAPI_MEMORY_CACHE", "True").lower() in {"1", "true", "yes"},
+    "MAX_ENTRIES": 2048,
+    "MAX_BYTES": 32 * 1024 * 1024,
+    "TTL": 300,  # seconds
+}
+
+# Where cached API responses live: "db" (ApiResourceCache table), "django" (a CACHES
+# alias, OPTIONS {"CACHE": ...}) or "files" (sharded directory, OPTIONS {"PATH": ...}).
+POKEAPI_CACHE_BACKEND = {
+    "BACKEND": os.getenv("POKEAPI_CACHE_BACKEND", "db"),
+    "OPTIONS": {},
+}
+if POKEAPI_CACHE_BACKEND["BACKEND"] == "files":
+    POKEAPI_CACHE_BACKEND["OPTIONS"]["PATH"] = os.getenv("POKEAPI_CACHE_PATH", str(BASE_DIR / "var" / "api-cache"))
+
+# Cache lifetime (seconds) per resource type, on top of the defaults in
+# pokemon.services.api.policies (e.g. types/generations 30 days, index pages 6 hours).
+# Keys: "pokemon", "pokemon:encounters", "type:index", or wildcards like "*:index".
+POKEAPI_TTL_POLICIES = {}
+
+# Storage format for cached payloads: "json" (plain), "zlib" or "zstd" (compact).
+# Existing rows can be rewritten with `manage.py compact_api_cache`.
+POKEAPI_CACHE_CODEC = os.getenv("POKEAPI_CACHE_CODEC", "json")
+
+# Store only the payload fields the app reads (see pokemon.services.api.projections).
+POKEAPI_CACHE_PROJECTIONS = True
+
+# Serve expired API payloads immediately and revalidate them in the background.
+POKEAPI_STALE_WHILE_REVALIDATE = {
+    "ENABLED": os.getenv("POKEAPI_STALE_WHILE_REVALIDATE", "False").lower() in {"1", "true", "yes"},
+    "MAX_STALE": 7 * 24 * 3600,  # seconds past expiry
+    "WORKERS": 2,
+}
+
+# After an upstream fetch, fetch the resources its payload links to (species,
+# evolution chain, encounters, moves) in background threads; see
+# pokemon.services.api.prefetch.PREFETCH_RULES.
+POKEAPI_PREFETCH = {
+    "ENABLED": os.getenv("POKEAPI_PREFETCH", "False").lower() in {"1", "true", "yes"},
+    "WORKERS": 4,
+    "MAX_URLS": 24,  # per payload
+}
+
+# Queue cache writes and persist them in batches from a background thread
+# (flushed at exit). MAX_QUEUE bounds memory; when full, writes happen inline.
+POKEAPI_WRITE_BEHIND = {
+    "ENABLED": os.getenv("POKEAPI_WRITE_BEHIND", "False").lower() in {"1", "true", "yes"},
+    "MAX_QUEUE": 1000,
+    "BATCH_SIZE": 100,
+    "FLUSH_INTERVAL": 0.5,  # seconds
+}
+
+# Large projected responses are stream-parsed (needs the optional `ijson` package).
+POKEAPI_JSON_STREAMING = {
+    "ENABLED": True,
+    "MIN_BYTES": 256 * 1024,
+}
+
+# Seconds a 404/410 answer from PokeAPI is remembered (no upstream retries meanwhile).
+POKEAPI_NEGATIVE_TTL = 3600
+
+# Shared token bucket for all outbound PokeAPI requests. Set LEASE_FILE to a path
+# shared by workers/processes to make the budget global across processes.
+POKEAPI_RATE_LIMIT = {
+    "ENABLED": True,
+    "RATE": float(os.getenv("POKEAPI_RATE", "20")),  # requests per second
+    "BURST": int(os.getenv("POKEAPI_BURST", "20")),
+    "LEASE_FILE": os.getenv("POKEAPI_RATE_LEASE_FILE") or None,
+}
+
+# Per-host circuit breaker: when at least FAILURE_RATE of the last WINDOW calls failed
+# (errors/5xx), calls fail fast for RESET_TIMEOUT seconds and cached payloads are
+# served regardless of age; then a single probe request decides whether to close.
+POKEAPI_CIRCUIT_BREAKER = {
+    "ENABLED": True,
+    "WINDOW": 20,
+    "MIN_CALLS": 5,
+    "FAILURE_RATE": 0.5,
+    "RESET_TIMEOUT": 30.0,  # seconds
+}
+
+# Hedged requests for interactive lookups (`get_json(..., hedge=True)`): a request
+# slower than PERCENTILE of recent latencies is sent again and the first response
+# wins. ENABLED only sets the default for calls that don't choose (bulk sync).
+POKEAPI_HEDGING = {
+    "ENABLED": False,
+    "PERCENTILE": 95.0,
+    "MIN_DELAY": 0.05,  # seconds
+    "MAX_DELAY": 2.0,  # seconds
+}
+
+# Record upstream responses to / replay them from a gzip'd cassette directory
+# (MODE "off", "record" or "replay"), e.g. for offline, reproducible benchmarks.
+POKEAPI_CASSETTE = {
+    "MODE": os.getenv("POKEAPI_CASSETTE_MODE", "off"),
+    "PATH": os.getenv("POKEAPI_CASSETTE_PATH", str(BASE_DIR / "var" / "cassettes")),
+    "LATENCY": os.getenv("POKEAPI_CASSETTE_LATENCY", "0"),  # seconds per replayed response, or "recorded"
+}
+
+# Adaptive (AIMD) in-flight limit for bulk syncs: grows by INCREASE per healthy
+# window, is multiplied by DECREASE on 429/5xx/timeouts or when item latency
+# exceeds LATENCY_TOLERANCE × the best seen. --workers is only the starting point.
+POKEAPI_SYNC_CONCURRENCY = {
+    "ADAPTIVE": os.getenv("POKEAPI_SYNC_ADAPTIVE", "True").lower() in {"1", "true", "yes"},
+    "MIN": 1,
+    "MAX": int(os.getenv("POKEAPI_SYNC_MAX_WORKERS", "32")),
+    "INCREASE": 1.0,
+    "DECREASE": 0.5,
+    "LATENCY_TOLERANCE": 2.0,
+}
+
+# Limits enforced by `manage.py cache_maintenance` on ApiResourceCache.
+POKEAPI_CACHE_MAINTENANCE = {
+    "EXPIRED_GRACE": 30 * 24 * 3600,  # seconds past expiry before a row is deleted
+    "MAX_ENTRY_BYTES": 2 * 1024 * 1024,  # larger stored payloads are dropped
+    "MAX_TOTAL_BYTES": 256 * 1024 * 1024,  # LRU eviction budget for all payloads
+}
+
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
\ No newline at end of file
@@ -0,0 +1,102 @@
+from __future__ import annotations
+"""
+Management command: garbage-collect and report on the PokeAPI response cache.
+
+Steps (limits default to settings `POKEAPI_CACHE_MAINTENANCE`):
+1. delete rows expired longer than the grace period,
+2. delete rows whose stored payload exceeds the per-entry cap,
+3. evict least recently used rows until the total fits the byte budget,
+4. ANALYZE, plus VACUUM on SQLite.
+
+    python manage.py cache_maintenance --dry-run
+    python manage.py cache_maintenance --max-total-mb 64
+    python manage.py cache_maintenance --resource pokemon:encounters --max-total-mb 8
+"""
+
+from datetime import timedelta
+from typing import List, Set
+
+from django.core.management.base import BaseCommand
+
+from pokemon.services.api import cache as _cache
+from pokemon.services.api.backends import DatabaseBackend, get_backend
+from pokemon.services.api.maintenance import (
+    ResourceStats,
+    cache_report,
+    evict_expired,
+    evict_oversized,
+    evict_to_budget,
+    maintenance_conf,
+    optimize_database,
+)
+
+
+class Command(BaseCommand):
+    help = "Evict expired/oversized/least recently used API cache rows and report per-resource sizes."
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("--grace-days", type=float, default=None,
+                            help="Delete rows expired longer than this many days.")
+        parser.add_argument("--max-entry-kb", type=float, default=None,
+                            help="Delete rows whose stored payload is larger than this.")
+        parser.add_argument("--max-total-mb", type=float, default=None,
+                            help="LRU-evict rows until the whole cache fits this budget.")
+        parser.add_argument("--dry-run", action="store_true", help="Report what would be deleted.")
+        parser.add_argument("--no-vacuum", action="store_true", help="Skip VACUUM (ANALYZE still runs).")
+        parser.add_argument("--report-only", action="store_true", help="Print stats, delete nothing.")
+        parser.add_argument("--resource", default=None,
+                            help="Only rows of this resource type (e.g. 'pokemon', 'type:index').")
+
+    def _print_report(self, title: str, stats: List[ResourceStats]) -> None:
+        self.stdout.write(title)
+        for s in stats:
+            ttl = f"{s.ttl.total_seconds() / 3600:g}h" if s.ttl is not None else "-"
+            self.stdout.write(
+                f"  {s.resource:<28} rows={s.rows:<7} {s.bytes / 1024:>10.1f} KiB  expired={s.expired:<6} ttl={ttl}"
+            )
+        total = sum(s.bytes for s in stats)
+        self.stdout.write(f"  {'total':<28} rows={sum(s.rows for s in stats):<7} {total / 1024:>10.1f} KiB")
+
+    def handle(self, *args, **opts) -> None:
+        conf = maintenance_conf()
+        grace = timedelta(days=opts["grace_days"]) if opts["grace_days"] is not None \
+            else timedelta(seconds=float(conf["EXPIRED_GRACE"]))
+
+        backend = get_backend()
+        if backend.name != DatabaseBackend.name:
+            # Stats, size caps and LRU work on the ApiResourceCache table only.
+            if opts["report_only"] or opts["dry_run"]:
+                self.stdout.write(f"Nothing to report for the '{backend.name}' cache backend.")
+                return
+            removed = backend.purge_expired(_cache._now() - grace)
+            self.stdout.write(self.style.SUCCESS(
+                f"Purged {removed} expired entr{'y' if removed == 1 else 'ies'} from the '{backend.name}' backend."
+            ))
+            return
+
+        resource = opts["resource"]
+        self._print_report("Before:", cache_report(resource))
+        if opts["report_only"]:
+            return
+
+        max_entry = int(opts["max_entry_kb"] * 1024) if opts["max_entry_kb"] is not None \
+            else int(conf["MAX_ENTRY_BYTES"])
+        max_total = int(opts["max_total_mb"] * 1024 * 1024) if opts["max_total_mb"] is not None \
+            else int(conf["MAX_TOTAL_BYTES"])
+        dry = opts["dry_run"]
+
+        selected: Set[int] = set()  # so a dry run counts each row once, like a real run deletes it
+        expired = evict_expired(grace, resource=resource, dry_run=dry, selected=selected)
+        oversized = evict_oversized(max_entry, resource=resource, dry_run=dry, selected=selected)
+        lru = evict_to_budget(max_total, resource=resource, dry_run=dry, selected=selected)
+
+        verb = "Would delete" if dry else "Deleted"
+        self.stdout.write(f"{verb}: expired={expired} oversized={oversized} lru={lru}")
+        if dry:
+            return
+
+        ran = optimize_database(vacuum=not opts["no_vacuum"])
+        self._print_report("After:", cache_report(resource))
+        self.stdout.write(self.style.SUCCESS(
+            f"Cache maintenance done ({expired + oversized + lru} row(s) removed; {', '.join(ran)})."
+        ))
@@ -0,0 +1,115 @@
+from __future__ import annotations
+"""
+Management command: rewrite ApiResourceCache rows into another payload codec.
+
+Typical use after switching `POKEAPI_CACHE_CODEC` to "zlib":
+    python manage.py compact_api_cache --codec zlib
+
+With `--project`, rows stored before projections were introduced are trimmed
+to the fields the app reads as well (see `services.api.projections`).
+
+Reports the stored size and the time needed to decode all payloads before and
+after the rewrite, so the trade-off is visible on the real dataset. Both sides
+are decoded with the same JSON parser (`services.api.decoding`), so the
+difference is the codec's alone.
+"""
+
+import time
+from typing import List
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from pokemon.models import ApiResourceCache
+from pokemon.services.api import codec as payload_codec
+from pokemon.services.api.backends import DatabaseBackend, get_backend
+from pokemon.services.api.cache import NEGATIVE_STATUSES, PAYLOAD_FIELDS, read_payload, set_payload
+from pokemon.services.api.decoding import dumps, loads
+from pokemon.services.api.projections import project, projection_for
+
+
+def _stored_size(row: ApiResourceCache) -> int:
+    """Bytes the payload occupies in its current storage form."""
+    if row.codec:
+        return len(row.body or b"")
+    return len(dumps(row.payload))
+
+
+def _decode_seconds(row: ApiResourceCache) -> float:
+    """Time to turn the stored representation back into Python objects."""
+    if row.codec:
+        t0 = time.perf_counter()
+        payload_codec.decode(row.body, row.codec)
+        return time.perf_counter() - t0
+
+    data = dumps(row.payload)
+    t0 = time.perf_counter()
+    loads(data)
+    return time.perf_counter() - t0
+
+
+class Command(BaseCommand):
+    help = "Rewrite cached PokeAPI payloads into a (compact) storage codec and report size/decode time."
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("--codec", default=None,
+                            help="Target codec (default: settings POKEAPI_CACHE_CODEC). "
+                                 f"Available: {', '.join(payload_codec.available_codecs())}.")
+        parser.add_argument("--project", action="store_true",
+                            help="Also trim unprojected rows to the registered field projections.")
+        parser.add_argument("--batch-size", type=int, default=200, help="Rows per UPDATE transaction.")
+        parser.add_argument("--dry-run", action="store_true", help="Measure only, do not write.")
+
+    def handle(self, *args, **opts) -> None:
+        if get_backend().name != DatabaseBackend.name:
+            raise CommandError("compact_api_cache works on the database cache backend only.")
+        target = opts["codec"] or payload_codec.storage_codec()
+        if target not in payload_codec.available_codecs():
+            raise CommandError(
+                f"Codec {target!r} is not available (have: {', '.join(payload_codec.available_codecs())})."
+            )
+        stored = "" if target == payload_codec.JSON else target
+
+        rows_seen = rows_changed = 0
+        size_before = size_after = 0
+        decode_before = decode_after = 0.0
+
+        # Page by primary key: SQLite must not be written while a cursor over
+        # the same table is still open.
+        pks = list(
+            ApiResourceCache.objects.exclude(status_code__in=NEGATIVE_STATUSES)
+            .order_by("pk").values_list("pk", flat=True)
+        )
+        step = max(1, opts["batch_size"])
+        for start in range(0, len(pks), step):
+            changed: List[ApiResourceCache] = []
+            for row in ApiResourceCache.objects.filter(pk__in=pks[start:start + step]):
+                rows_seen += 1
+                size_before += _stored_size(row)
+                decode_before += _decode_seconds(row)
+
+                trim = opts["project"] and not row.projected and projection_for(row.url) is not None
+                if trim or row.codec != stored:
+                    payload = read_payload(row)
+                    if trim:
+                        payload = project(row.url, payload)
+                        row.projected = True
+                    set_payload(row, payload, target)
+                    changed.append(row)
+
+                size_after += _stored_size(row)
+                decode_after += _decode_seconds(row)
+
+            rows_changed += len(changed)
+            if changed and not opts["dry_run"]:
+                with transaction.atomic():
+                    ApiResourceCache.objects.bulk_update(changed, [*PAYLOAD_FIELDS, "projected"])
+
+        ratio = (size_after / size_before) if size_before else 1.0
+        verb = "Would rewrite" if opts["dry_run"] else "Rewrote"
+        self.stdout.write(
+            f"rows={rows_seen} changed={rows_changed}\n"
+            f"size:   {size_before / 1024:.1f} KiB → {size_after / 1024:.1f} KiB ({ratio:.1%})\n"
+            f"decode: {decode_before * 1000:.1f} ms → {decode_after * 1000:.1f} ms (all rows)"
+        )
+        self.stdout.write(self.style.SUCCESS(f"{verb} {rows_changed} row(s) to codec '{target}'."))
@@ -0,0 +1,30 @@
+from __future__ import annotations
+"""
+Management command: export the cached dataset into a snapshot file.
+
+Packs ApiResourceCache, PokemonCache (+ type/ability links),
+EvolutionChainCache and the taxonomy tables into one versioned file that
+`import_snapshot` can load into a fresh database without network access.
+"""
+
+from django.core.management.base import BaseCommand
+
+from pokemon.services.snapshot import export_snapshot
+
+
+class Command(BaseCommand):
+    help = "Export PokeAPI caches and taxonomies into a versioned snapshot file."
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("path", help="Output file (e.g. pokedex-snapshot.zip).")
+        parser.add_argument("--quiet", action="store_true", help="Only print the final summary.")
+
+    def handle(self, *args, **opts) -> None:
+        logger = None if opts["quiet"] else (lambda s: self.stdout.write(s))
+        manifest = export_snapshot(opts["path"], logger=logger)
+
+        total = sum(t["rows"] for t in manifest["tables"].values())
+        self.stdout.write(self.style.SUCCESS(
+            f"Snapshot v{manifest['version']} written to {opts['path']} "
+            f"({len(manifest['tables'])} tables, {total} rows)."
+        ))
@@ -0,0 +1,44 @@
+from __future__ import annotations
+"""
+Management command: load a snapshot file produced by `export_snapshot`.
+
+The file is verified (manifest, version, checksums) before any write; rows
+are bulk-inserted in one transaction. Intended for bootstrapping new nodes
+and test environments without crawling PokeAPI.
+"""
+
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from pokemon.services.snapshot import import_snapshot, SnapshotError
+from pokemon.services.snapshot.reader import is_empty
+
+
+class Command(BaseCommand):
+    help = "Import a dataset snapshot (bulk inserts, no network)."
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("path", help="Snapshot file created by export_snapshot.")
+        parser.add_argument("--replace", action="store_true",
+                            help="Delete existing cache/taxonomy rows before importing.")
+        parser.add_argument("--if-empty", action="store_true",
+                            help="Skip (successfully) when the tables already contain data.")
+        parser.add_argument("--quiet", action="store_true", help="Only print the final summary.")
+
+    def handle(self, *args, **opts) -> None:
+        if opts["if_empty"] and not opts["replace"] and not is_empty():
+            self.stdout.write(self.style.WARNING("Tables already populated; snapshot import skipped."))
+            return
+
+        logger = None if opts["quiet"] else (lambda s: self.stdout.write(s))
+        t0 = time.perf_counter()
+        try:
+            counts = import_snapshot(opts["path"], replace=opts["replace"], logger=logger)
+        except (SnapshotError, OSError) as e:
+            raise CommandError(f"Snapshot import failed: {e}") from e
+
+        elapsed = time.perf_counter() - t0
+        self.stdout.write(self.style.SUCCESS(
+            f"Imported {sum(counts.values())} rows from {opts['path']} in {elapsed:.1f}s."
+        ))
@@ -0,0 +1,59 @@
+from __future__ import annotations
+"""
+Management command: revalidate expired PokeAPI cache rows in bulk.
+
+Sends conditional requests (ETag / Last-Modified) for every expired row,
+concurrently, and applies all 304s of a batch with one bulk UPDATE.
+Meant for a nightly cron job:
+
+    python manage.py revalidate_cache --ahead-hours 6
+"""
+
+from datetime import timedelta
+from typing import Dict
+
+from django.core.management.base import BaseCommand, CommandError
+
+from pokemon.services.api.backends import get_backend
+from pokemon.services.api.revalidate import revalidate_expired
+
+
+class Command(BaseCommand):
+    help = "Revalidate expired API cache rows with concurrent conditional requests (304s bulk-applied)."
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("--ahead-hours", type=float, default=0.0,
+                            help="Also revalidate rows expiring within this many hours.")
+        parser.add_argument("--workers", type=int, default=8, help="Concurrent upstream requests.")
+        parser.add_argument("--batch-size", type=int, default=200, help="Rows per batch / bulk UPDATE.")
+        parser.add_argument("--limit", type=int, default=None, help="Revalidate at most N rows.")
+        parser.add_argument("--quiet", action="store_true", help="No per-batch progress lines.")
+
+    def handle(self, *args, **opts) -> None:
+        def progress(state: Dict[str, int]) -> None:
+            self.stdout.write(
+                f"[revalidate] {state['checked']}/{state['total']} "
+                f"304={state['not_modified']} 200={state['modified']} errors={state['errors']}"
+            )
+
+        backend = get_backend()
+        if not backend.can_enumerate:
+            raise CommandError(
+                f"The '{backend.name}' cache backend cannot list its entries, so it does not support "
+                "bulk revalidation (entries are revalidated when read)."
+            )
+
+        stats = revalidate_expired(
+            ahead=timedelta(hours=opts["ahead_hours"]),
+            workers=opts["workers"],
+            batch_size=opts["batch_size"],
+            limit=opts["limit"],
+            progress=None if opts["quiet"] else progress,
+        )
+
+        summary = (
+            f"Revalidated {stats['checked']} row(s): 304={stats['not_modified']} "
+            f"200={stats['modified']} errors={stats['errors']}"
+        )
+        style = self.style.ERROR if stats["errors"] else self.style.SUCCESS
+        self.stdout.write(style(summary))
@@ -18,6 +18,7 @@ from django.core.management.base import BaseCommand
 
 from pokemon.utils.progress import ProgressPrinter
 from pokemon.orchestration.runner import SyncRunner
+from pokemon.services.cache.core.constants import ASYNC_CONCURRENCY_DEFAULT
 from pokemon.services.cache.pokemon import sync_all_pokemon
 
 
@@ -27,12 +28,18 @@ class Command(BaseCommand):
     def add_arguments(self, parser) -> None:
         parser.add_argument("--workers", type=int, default=2, help="Parallel workers (I/O bound).")
         parser.add_argument("--batch-size", type=int, default=100, help="Index batch size for /pokemon.")
-        parser.add_argument("--sleep", type=float, default=0.1, help="Base sleep seconds between batches.")
+        parser.add_argument("--sleep", type=float, default=0.0,
+                            help="Extra base sleep seconds between batches (requests are already "
+                                 "paced by POKEAPI_RATE_LIMIT).")
         parser.add_argument("--refresh-all", action="store_true", help="Refresh even existing records.")
         parser.add_argument("--no-progress", action="store_true", help="Disable live progress output.")
         parser.add_argument("--quiet", action="store_true", help="Less verbose run headers.")
         parser.add_argument("--max-runs", type=int, default=5, help="Run up to N times while failures remain.")
         parser.add_argument("--target-fail", type=int, default=1, help="Stop early once failed <= target-fail.")
+        parser.add_argument("--async", dest="use_async", action="store_true",
+                            help="Run the passes on an asyncio event loop instead of worker threads.")
+        parser.add_argument("--concurrency", type=int, default=ASYNC_CONCURRENCY_DEFAULT,
+                            help="Requests kept in flight with --async.")
 
     def handle(self, *args, **opts) -> None:
         printer = ProgressPrinter(enabled=not opts["no_progress"])
@@ -47,7 +54,8 @@ class Command(BaseCommand):
         if not opts["quiet"]:
             self.stdout.write(self.style.WARNING(
                 f"Starting full Pokémon sync (workers={opts['workers']}, batch-size={opts['batch_size']}, "
-                f"sleep={opts['sleep']}, refresh_all={opts['refresh_all']})"
+                f"sleep={opts['sleep']}, refresh_all={opts['refresh_all']}, "
+                f"async={opts['use_async']}, concurrency={opts['concurrency']})"
             ))
 
         # Generic runner configured for the Pokémon service
@@ -56,7 +64,9 @@ class Command(BaseCommand):
             success_key="synced",               # service returns {'synced': ...}
             run_extra_kwargs={
                 # forward service warnings (e.g., missing taxonomy rows) to CLI
-                "logger": (lambda s: self.stdout.write(s + "\n"))
+                "logger": (lambda s: self.stdout.write(s + "\n")),
+                "async_mode": opts["use_async"],
+                "concurrency": opts["concurrency"],
             },
 
             workers=opts["workers"],
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.5 on 2026-10-18 02:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pokemon', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='apiresourcecache',
+            name='body',
+            field=models.BinaryField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='apiresourcecache',
+            name='codec',
+            field=models.CharField(blank=True, default='', max_length=16),
+        ),
+        migrations.AlterField(
+            model_name='apiresourcecache',
+            name='payload',
+            field=models.JSONField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.5 on 2026-10-18 02:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pokemon', '0002_api_cache_compact_payload'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='apiresourcecache',
+            name='projected',
+            field=models.BooleanField(default=False),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 5.2.5 on 2026-10-18 02:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pokemon', '0003_api_cache_projected'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='apiresourcecache',
+            name='accessed_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='apiresourcecache',
+            index=models.Index(fields=['accessed_at'], name='pokemon_api_accesse_69213e_idx'),
+        ),
+    ]
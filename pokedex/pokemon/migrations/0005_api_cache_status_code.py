@@ -0,0 +1,18 @@
+# Generated by Django 5.2.5 on 2026-10-18 03:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pokemon', '0004_api_cache_accessed_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='apiresourcecache',
+            name='status_code',
+            field=models.PositiveSmallIntegerField(default=200),
+        ),
+    ]
@@ -0,0 +1,52 @@
+# Generated by Django 5.2.5 on 2026-10-18 03:03
+
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from django.db import migrations, models
+
+
+def canonical_url(full_url):
+    """Frozen copy of `pokemon.services.api.urls.canonical_url` as of this migration."""
+    parts = urlsplit(full_url.strip())
+    host = (parts.hostname or "pokeapi.co").lower()
+    netloc = host if parts.port in (None, 80, 443) else f"{host}:{parts.port}"
+    segments = [seg for seg in parts.path.lower().split("/") if seg]
+    path = "/" + "/".join(segments) + "/" if segments else "/"
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit(("https", netloc, path, query, ""))
+
+
+def canonicalize_cache_urls(apps, schema_editor):
+    """Rewrite cache keys to `canonical_url`; of duplicates keep the newest row."""
+    ApiResourceCache = apps.get_model("pokemon", "ApiResourceCache")
+    rows = list(ApiResourceCache.objects.order_by("-fetched_at").values_list("pk", "url"))
+    kept = {}
+    for pk, url in rows:
+        key = canonical_url(url)
+        if key in kept:
+            ApiResourceCache.objects.filter(pk=pk).delete()
+        else:
+            kept[key] = (pk, url)
+    for key, (pk, url) in kept.items():
+        if key != url:
+            ApiResourceCache.objects.filter(pk=pk).update(url=key)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pokemon', '0005_api_cache_status_code'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ApiResourceAlias',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('alias', models.URLField(unique=True)),
+                ('target', models.URLField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+        migrations.RunPython(canonicalize_cache_urls, migrations.RunPython.noop),
+    ]
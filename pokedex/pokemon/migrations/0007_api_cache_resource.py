@@ -0,0 +1,49 @@
+# Generated by Django 5.2.5 on 2026-10-18 03:15
+
+from collections import defaultdict
+from urllib.parse import urlsplit
+
+from django.db import migrations, models
+
+
+def resource_of(url):
+    """Frozen copy of `pokemon.services.api.urls.resource_of` as of this migration."""
+    path = urlsplit(url).path.strip("/")
+    prefix = "api/v2/"
+    parts = (path[len(prefix):] if path.startswith(prefix) else path).split("/")
+    if len(parts) == 1:
+        return f"{parts[0]}:index"
+    if len(parts) > 2:
+        return f"{parts[0]}:{parts[-1]}"
+    return parts[0]
+
+
+def backfill_resource(apps, schema_editor):
+    """Derive `resource` from the URL of every existing row (one UPDATE per resource type)."""
+    ApiResourceCache = apps.get_model("pokemon", "ApiResourceCache")
+    by_resource = defaultdict(list)
+    for pk, url in ApiResourceCache.objects.values_list("pk", "url").iterator():
+        by_resource[resource_of(url)].append(pk)
+    for resource, pks in by_resource.items():
+        for start in range(0, len(pks), 500):
+            ApiResourceCache.objects.filter(pk__in=pks[start:start + 500]).update(resource=resource)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pokemon', '0006_api_resource_alias'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='apiresourcecache',
+            name='resource',
+            field=models.CharField(blank=True, default='', max_length=64),
+        ),
+        migrations.RunPython(backfill_resource, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='apiresourcecache',
+            index=models.Index(fields=['resource', 'expires_at'], name='pokemon_api_resourc_aae8e0_idx'),
+        ),
+    ]
@@ -1,7 +1,8 @@
 from .taxonomies import Type, Ability, Generation
-from .cache import ApiResourceCache
+from .cache import ApiResourceCache, ApiResourceAlias
 from .evolution_chain_cache import EvolutionChainCache
 from .pokemon_cache import PokemonCache
 
 
-__all__ = ["Type", "Ability", "Generation", "EvolutionChainCache", "ApiResourceCache", "PokemonCache"]
+__all__ = ["Type", "Ability", "Generation", "EvolutionChainCache", "ApiResourceCache", "ApiResourceAlias",
+           "PokemonCache"]
@@ -7,16 +7,55 @@ class ApiResourceCache(models.Model):
 
     Stores raw payload + ETag/Last-Modified validators.
     Used where no dedicated domain model exists.
+
+    The payload lives either in `payload` (plain JSON, `codec == ""`) or,
+    in compact form, as compressed bytes in `body` (`codec` names the format).
+    Read it via `pokemon.services.api.cache.read_payload`.
+    `projected` rows hold only the fields listed in `services.api.projections`.
+    Rows with a 404/410 `status_code` are negative entries (no payload) that
+    make lookups fail fast until they expire.
+    `resource` is the resource type of the URL ("pokemon", "type:index", …,
+    see `services.api.urls.resource_of`); TTL policies, stats and eviction
+    are per resource.
     """
     url = models.URLField(unique=True)
-    payload = models.JSONField()
+    resource = models.CharField(max_length=64, blank=True, default="")
+    payload = models.JSONField(null=True, blank=True)
+    body = models.BinaryField(null=True, blank=True)
+    codec = models.CharField(max_length=16, blank=True, default="")
+    projected = models.BooleanField(default=False)  # payload trimmed to the fields the app reads
+    status_code = models.PositiveSmallIntegerField(default=200)  # 404/410 → negative entry
     etag = models.CharField(max_length=128, blank=True, default="")
     last_modified = models.CharField(max_length=128, blank=True, default="")
     fetched_at = models.DateTimeField(auto_now=True)
     expires_at = models.DateTimeField(null=True, blank=True)
+    accessed_at = models.DateTimeField(null=True, blank=True)  # coarse last read, for LRU eviction
 
     class Meta:
         indexes = [
             models.Index(fields=["fetched_at"]),
             models.Index(fields=["expires_at"]),
-        ]
\ No newline at end of file
+            models.Index(fields=["accessed_at"]),
+            models.Index(fields=["resource", "expires_at"]),
+        ]
+
+    def save(self, *args, **kwargs):
+        if not self.resource:
+            from pokemon.services.api.urls import resource_of  # the api package imports models
+
+            self.resource = resource_of(self.url)
+        super().save(*args, **kwargs)
+
+
+class ApiResourceAlias(models.Model):
+    """
+    Maps a name-based PokeAPI URL (".../pokemon/pikachu/") to the canonical
+    ID-based URL (".../pokemon/25/") whose `ApiResourceCache` row holds the
+    payload, so both forms share one row and one upstream fetch.
+    """
+    alias = models.URLField(unique=True)
+    target = models.URLField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self) -> str:
+        return f"{self.alias} → {self.target}"
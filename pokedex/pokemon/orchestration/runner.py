@@ -4,7 +4,8 @@ SyncRunner — generic, small orchestrator for multi-pass bulk syncs.
 
 Responsibilities
 - Call a provided `run_fn(**kwargs) -> dict` repeatedly (multi-pass).
-- Tweak params between runs (fewer workers, slightly more sleep).
+- Tweak params between runs (fewer workers, slightly more sleep), or carry
+  over the live concurrency limit when the service reports one.
 - Stop early when failures drop under a target.
 - Aggregate simple totals across runs.
 
@@ -84,17 +85,23 @@ class SyncRunner:
         self.total_synced = 0
         self.total_skipped = 0
         self.last_failed: Optional[int] = None
+        self.last_limit: Optional[int] = None
 
     def _adaptive_params(self, run_index: int) -> Tuple[int, float]:
         """
         Compute run-specific params.
 
         Strategy:
-        - Slightly decrease workers over time (≈ every two runs).
-        - Slightly increase sleep every run.
+        - If the last pass reported an adaptive concurrency `limit` (AIMD
+          controller in the sync engine), start from it and keep the base sleep:
+          the controller already backs off under errors and latency.
+        - Otherwise slightly decrease workers over time (≈ every two runs)
+          and slightly increase sleep every run.
 
         `run_index` is 1-based.
         """
+        if self.last_limit:
+            return self.last_limit, self.base_sleep
         workers = max(1, self.base_workers - (run_index - 1) // 2)
         sleep_between = self.base_sleep + 0.1 * (run_index - 1)
         return workers, sleep_between
@@ -148,12 +155,14 @@ class SyncRunner:
             self.total_synced += success
             self.total_skipped += skipped
             self.last_failed = failed
+            self.last_limit = stats.get("limit") or None
 
             # Per-run summary
             self._log(
                 f"[run {run}] total={stats.get('total', 0)} "
                 f"{self.success_key}={success} skipped={skipped} "
                 f"failed={failed} elapsed={stats.get('elapsed', 0.0)}s"
+                + (f" limit={self.last_limit}" if self.last_limit else "")
             )
 
             if self.last_failed <= self.target_fail:
@@ -3,6 +3,7 @@ from typing import List, Dict, Optional
 from django.db.models import Q
 from pokemon.models import PokemonCache
 from pokemon.services.cache.pokemon import upsert_pokemon_from_api
+from pokemon.services.cache.pokemon.normalize import prefetch_pokemon_payloads
 
 __all__ = ["list_pokemon", "evo_display_from_ids"]
 
@@ -68,6 +69,7 @@ def evo_display_from_ids(
 
     if ensure_missing:
         missing = [sid for sid in species_ids if sid not in rows]
+        prefetch_pokemon_payloads(missing)
         for sid in missing:
             try:
                 upsert_pokemon_from_api(sid)
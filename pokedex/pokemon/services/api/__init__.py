@@ -1,7 +1,25 @@
 from .urls import url
-from .client import get_json
+from .circuit import CircuitOpenError, circuit_breaker
+from .client import get_json, get_json_many, FetchResult, CachedHTTPError
+from .aio import AsyncClient
+from .hedge import hedger
+from .memory import memory_cache
+from .ratelimit import rate_limiter
+from .singleflight import single_flight
+from .stale import stale_stats
 
 __all__ = [
     "url",
     "get_json",
+    "get_json_many",
+    "FetchResult",
+    "CachedHTTPError",
+    "AsyncClient",
+    "CircuitOpenError",
+    "circuit_breaker",
+    "hedger",
+    "memory_cache",
+    "rate_limiter",
+    "single_flight",
+    "stale_stats",
 ]
\ No newline at end of file
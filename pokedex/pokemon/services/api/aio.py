@@ -0,0 +1,294 @@
+from __future__ import annotations
+"""
+Asyncio PokeAPI client.
+
+`AsyncClient.get_json` has the cache semantics of `client.get_json` (memory
+cache, DB rows with TTL policies, ETag/Last-Modified revalidation, negative
+entries, name aliases, circuit breaker, shared rate limiter), but waits on the
+network without holding a thread, so one event loop can keep hundreds of
+requests in flight under the client's `concurrency` limit.
+
+- Network I/O uses `httpx.AsyncClient` (pinned in requirements.txt). While a
+  cassette is active (it hooks the `requests` transport), or in a stripped
+  environment without httpx, each upstream request goes through the blocking
+  `requests` session in a worker thread instead, i.e. at most the default
+  executor's threads at once.
+- Either way, cache rows are read and written through `sync_to_async`, i.e. on Django's
+  single sync thread, so the database sees one writer at a time.
+- Concurrent callers for the same URL on the loop share one request.
+
+Stale-while-revalidate, prefetch and hedging are not applied here: the client
+is meant for bulk syncs, which fetch every URL anyway.
+
+    async with AsyncClient(concurrency=200) as api:
+        payloads = await asyncio.gather(*(api.get_json(u) for u in urls))
+"""
+
+import asyncio
+import time
+from datetime import timedelta
+from typing import Any, Dict, Optional, Tuple
+
+import requests
+from asgiref.sync import sync_to_async
+from requests.structures import CaseInsensitiveDict
+
+from .cache import (
+    Entry,
+    conditional_headers,
+    is_fresh,
+    is_negative,
+    load_row,
+    payload_size,
+    read_payload,
+    resolve_keys,
+    touch_access,
+)
+from .cassette import OFF, cassette_conf
+from .circuit import CircuitOpenError, circuit_breaker, is_failure
+from .client import (
+    DEFAULT_TIMEOUT,
+    THROTTLED,
+    CachedHTTPError,
+    has_fallback,
+    store_response,
+)
+from .hedge import hedger
+from .memory import memory_cache
+from .policies import ttl_for
+from .ratelimit import rate_limit_conf, rate_limiter, retry_delay
+from .session import get_session
+from .urls import canonical_url, name_base_url
+
+try:
+    import httpx
+except ImportError:  # optional dependency
+    httpx = None
+
+CONCURRENCY_DEFAULT = 100  # upstream requests in flight per client
+TRANSPORT_RETRIES = 3  # connection-level retries (the sync session's adapter retries too)
+
+
+def _lookup(url: str, ttl: Optional[timedelta], full: bool) -> Tuple[str, Optional[Entry], timedelta, Any]:
+    """
+    Cache half of `get_json`, up to the network: returns
+    (cache key, row, ttl, payload); payload is None when upstream must be asked.
+    """
+    if name_base_url(url):
+        url = resolve_keys([url])[url]
+        cached = None if full else memory_cache.get(url)
+        if cached is not None:
+            return url, None, ttl, cached
+
+    ttl = ttl_for(url) if ttl is None else ttl
+    row = load_row(url)
+    if row is not None and is_negative(row) and is_fresh(row):
+        raise CachedHTTPError(url, row.status_code)
+
+    if row is not None and not (full and row.projected) and is_fresh(row):
+        touch_access([row])
+        payload = read_payload(row)
+        memory_cache.set(url, payload, row.expires_at, size=payload_size(row))
+        return url, row, ttl, payload
+
+    if has_fallback(row, full) and circuit_breaker.is_open(url):
+        return url, row, ttl, read_payload(row)
+    return url, row, ttl, None
+
+
+def _as_requests_response(resp: Any, url: str) -> requests.Response:
+    """Wrap a read httpx response so `store_response` can store it like a `requests` one."""
+    r = requests.Response()
+    r.status_code = resp.status_code
+    r.url = url
+    r.reason = resp.reason_phrase
+    # httpx already decoded the body; drop the header that says otherwise.
+    r.headers = CaseInsensitiveDict(
+        {k: v for k, v in resp.headers.items() if k.lower() != "content-encoding"}
+    )
+    r._content = resp.content
+    r._content_consumed = True
+    r.raw = None
+    return r
+
+
+def _blocking_get(url: str, timeout: float, headers: Dict[str, str]) -> requests.Response:
+    """GET through the `requests` session (cassettes included), reading the body in this thread."""
+    r = get_session().get(url, timeout=timeout, headers=headers, stream=True)
+    r.content  # noqa: B018 - read here, not on the sync thread that stores it
+    r.raw = None  # already consumed: `store_response` decodes `content`
+    return r
+
+
+class AsyncClient:
+    """
+    Async counterpart of `get_json` bound to one event loop (see module docstring).
+
+    Use as an async context manager, or call `aclose()` when done.
+
+    Counters
+    --------
+    requests  : upstream requests sent
+    threaded  : requests sent through the blocking session (no httpx / cassette)
+    joined    : callers that awaited another caller's request for the same URL
+    """
+
+    def __init__(
+        self,
+        concurrency: int = CONCURRENCY_DEFAULT,
+        timeout: float = DEFAULT_TIMEOUT,
+        *,
+        transport: Any = None,
+    ) -> None:
+        self.concurrency = max(1, int(concurrency))
+        self.timeout = timeout
+        self._slots = asyncio.Semaphore(self.concurrency)
+        self._flights: Dict[Any, asyncio.Future] = {}
+        self._http = None
+        if httpx is not None and str(cassette_conf()["MODE"] or OFF).lower() == OFF:
+            self._http = httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=self.concurrency,
+                                    max_keepalive_connections=self.concurrency),
+                transport=transport or httpx.AsyncHTTPTransport(retries=TRANSPORT_RETRIES),
+            )
+        self.requests = 0
+        self.threaded = 0
+        self.joined = 0
+
+    async def __aenter__(self) -> "AsyncClient":
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        if self._http is not None:
+            await self._http.aclose()
+
+    # ---------- public API ----------
+    async def get_json(
+        self,
+        url: str,
+        ttl: Optional[timedelta] = None,
+        timeout: Optional[float] = None,
+        extra_headers: Optional[Dict[str, str]] = None,
+        full: bool = False,
+    ) -> Any:
+        """
+        Fetch JSON for `url` like `client.get_json` (same cache keys, TTLs,
+        validators and errors), awaiting the network instead of blocking.
+        """
+        url = canonical_url(url)
+        timeout = self.timeout if timeout is None else timeout
+        cached = None if full else memory_cache.get(url)
+        if cached is not None:
+            return cached
+
+        key = (url, "full") if full else url
+        flight = self._flights.get(key)
+        if flight is not None:
+            self.joined += 1
+            return await asyncio.shield(flight)
+
+        flight = asyncio.get_running_loop().create_future()
+        self._flights[key] = flight
+        try:
+            payload = await self._fetch(url, ttl, timeout, extra_headers, full)
+        except asyncio.CancelledError:
+            flight.cancel()
+            raise
+        except Exception as e:
+            flight.set_exception(e)
+            flight.exception()  # joiners re-raise it; don't log it as unretrieved
+            raise
+        else:
+            flight.set_result(payload)
+        finally:
+            self._flights.pop(key, None)
+        return payload
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "transport": "httpx" if self._http is not None else "thread",
+            "concurrency": self.concurrency,
+            "requests": self.requests,
+            "threaded": self.threaded,
+            "joined": self.joined,
+        }
+
+    # ---------- internals ----------
+    async def _fetch(
+        self,
+        url: str,
+        ttl: Optional[timedelta],
+        timeout: float,
+        extra_headers: Optional[Dict[str, str]],
+        full: bool,
+    ) -> Any:
+        url, row, ttl, payload = await sync_to_async(_lookup)(url, ttl, full)
+        if payload is not None:
+            return payload
+
+        validators_row = None if (full and row and row.projected) else row
+        try:
+            r = await self._request(url, validators_row, timeout, extra_headers)
+        except CircuitOpenError:
+            if has_fallback(row, full):
+                return read_payload(row)
+            raise
+        return await sync_to_async(store_response)(url, row, r, ttl, full)
+
+    async def _request(
+        self,
+        url: str,
+        row: Optional[Entry],
+        timeout: float,
+        extra_headers: Optional[Dict[str, str]],
+    ) -> requests.Response:
+        """Conditional GET with the 429/503 handling of `client._request`."""
+        headers = conditional_headers(row)
+        if extra_headers:
+            headers.update(extra_headers)
+
+        retries = int(rate_limit_conf()["RETRIES_429"])
+        for _ in range(retries + 1):
+            r = await self._send(url, timeout, headers)
+            if r.status_code not in THROTTLED:
+                return r
+            rate_limiter.penalize(retry_delay(r.headers))
+        return r
+
+    async def _send(self, url: str, timeout: float, headers: Dict[str, str]) -> requests.Response:
+        """One upstream attempt: circuit breaker, rate limiter slot, GET, latency sample."""
+        circuit_breaker.before(url)
+        failed: Optional[bool] = None
+        try:
+            delay = rate_limiter.reserve()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            async with self._slots:
+                self.requests += 1
+                started = time.monotonic()
+                if self._http is None:
+                    self.threaded += 1
+                    try:
+                        r = await asyncio.to_thread(_blocking_get, url, timeout, headers)
+                    except requests.RequestException:
+                        failed = True
+                        raise
+                else:
+                    try:
+                        resp = await self._http.get(url, headers=headers, timeout=timeout)
+                    except httpx.HTTPError as e:
+                        failed = True
+                        raise requests.ConnectionError(f"{e!r} for url: {url}") from e
+                    r = _as_requests_response(resp, url)
+            hedger.observe(time.monotonic() - started)
+            failed = is_failure(r.status_code)
+            return r
+        finally:
+            if failed is None:
+                circuit_breaker.release(url)  # cancelled or a bug: free a half-open probe
+            else:
+                circuit_breaker.record(url, failed)
@@ -0,0 +1,63 @@
+from __future__ import annotations
+"""
+Storage backends for the PokeAPI response cache.
+
+Chosen with settings `POKEAPI_CACHE_BACKEND`:
+
+    POKEAPI_CACHE_BACKEND = {"BACKEND": "db"}                                   # default
+    POKEAPI_CACHE_BACKEND = {"BACKEND": "django", "OPTIONS": {"CACHE": "api"}}  # settings.CACHES alias
+    POKEAPI_CACHE_BACKEND = {"BACKEND": "files", "OPTIONS": {"PATH": "/var/cache/pokeapi"}}
+
+All backends share the freshness/ETag/projection logic of `services.api.cache`.
+"""
+
+import threading
+from typing import Any, Dict, Optional, Tuple, Type
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+
+from .base import NEGATIVE_STATUSES, CacheBackend, CacheEntry, entry_dict
+from .db import DatabaseBackend
+from .django_cache import DjangoCacheBackend
+from .files import FileBackend
+
+BACKENDS: Dict[str, Type[CacheBackend]] = {
+    DatabaseBackend.name: DatabaseBackend,
+    DjangoCacheBackend.name: DjangoCacheBackend,
+    FileBackend.name: FileBackend,
+}
+
+_lock = threading.Lock()
+_current: Optional[Tuple[str, CacheBackend]] = None
+
+
+def get_backend() -> CacheBackend:
+    """The configured backend (rebuilt when the setting changes, e.g. in tests)."""
+    global _current
+    conf: Dict[str, Any] = {"BACKEND": "db", "OPTIONS": {}, **getattr(settings, "POKEAPI_CACHE_BACKEND", {})}
+    signature = repr(sorted(conf.items()))
+    with _lock:
+        if _current is None or _current[0] != signature:
+            try:
+                cls = BACKENDS[conf["BACKEND"]]
+            except KeyError:
+                raise ImproperlyConfigured(
+                    f"Unknown POKEAPI_CACHE_BACKEND {conf['BACKEND']!r} (have: {', '.join(BACKENDS)})"
+                ) from None
+            options = {k.lower(): v for k, v in (conf["OPTIONS"] or {}).items()}
+            _current = (signature, cls(**options))
+        return _current[1]
+
+
+__all__ = [
+    "BACKENDS",
+    "CacheBackend",
+    "CacheEntry",
+    "DatabaseBackend",
+    "DjangoCacheBackend",
+    "FileBackend",
+    "NEGATIVE_STATUSES",
+    "entry_dict",
+    "get_backend",
+]
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, fields as dc_fields
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+# Upstream statuses cached as negative entries (the resource does not exist).
+NEGATIVE_STATUSES = (404, 410)
+
+
+@dataclass
+class CacheEntry:
+    """
+    One cached API response outside the database.
+
+    Attributes mirror `ApiResourceCache`, so the helpers in
+    `services.api.cache` work on either.
+    """
+    url: str
+    resource: str = ""
+    payload: Any = None
+    body: Optional[bytes] = None
+    codec: str = ""
+    projected: bool = False
+    status_code: int = 200
+    etag: str = ""
+    last_modified: str = ""
+    fetched_at: Optional[datetime] = None
+    expires_at: Optional[datetime] = None
+    accessed_at: Optional[datetime] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {f.name: getattr(self, f.name) for f in dc_fields(self)}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CacheEntry":
+        known = {f.name for f in dc_fields(cls)}
+        return cls(**{k: v for k, v in data.items() if k in known})
+
+
+def entry_dict(entry: Any) -> Dict[str, Any]:
+    """The `CacheEntry` attributes of `entry` (a `CacheEntry` or a model row)."""
+    if isinstance(entry, CacheEntry):
+        return entry.to_dict()
+    return {f.name: getattr(entry, f.name) for f in dc_fields(CacheEntry)}
+
+
+class CacheBackend(ABC):
+    """
+    Storage for cached API responses (payload + validators + expiry).
+
+    Entries are objects with the attributes of `CacheEntry`; which concrete
+    type a backend returns is up to it. Freshness, ETag and projection logic
+    lives in `services.api.cache` and is the same for every backend.
+
+    `can_enumerate` is False for stores that cannot list their entries
+    (e.g. Django caches): their `entries_expiring` is always empty, so bulk
+    revalidation has nothing to do there.
+    """
+
+    name = "base"
+    can_enumerate = True
+
+    def new(self, url: str) -> Any:
+        """An unsaved, empty entry for `url`."""
+        return CacheEntry(url=url)
+
+    @abstractmethod
+    def get(self, url: str) -> Optional[Any]:
+        """The entry for `url`, or None."""
+
+    def get_many(self, urls: Sequence[str]) -> Dict[str, Any]:
+        return {u: e for u in urls if (e := self.get(u)) is not None}
+
+    @abstractmethod
+    def save(self, entry: Any, fields: Optional[Sequence[str]] = None) -> None:
+        """Insert or update `entry`. `fields` (a hint) lists the attributes that changed."""
+
+    def save_many(self, entries: Iterable[Any], fields: Sequence[str]) -> None:
+        for entry in entries:
+            self.save(entry, fields)
+
+    @abstractmethod
+    def delete(self, url: str) -> None:
+        """Remove the entry for `url` (no-op when there is none)."""
+
+    @abstractmethod
+    def aliases(self, urls: Iterable[str]) -> Dict[str, str]:
+        """Known `alias → target` URL mappings among `urls`."""
+
+    @abstractmethod
+    def set_alias(self, alias: str, target: str) -> None:
+        """Serve `alias` from the entry of `target` from now on."""
+
+    @abstractmethod
+    def purge_expired(self, before: datetime) -> int:
+        """Delete entries that expired before `before`; return how many."""
+
+    @abstractmethod
+    def entries_expiring(self, before: datetime, limit: Optional[int] = None) -> List[str]:
+        """URLs of positive entries with `expires_at <= before`, soonest first."""
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from django.db import IntegrityError, transaction
+from django.db.models import TextField
+from django.db.models.functions import Cast, Length
+
+from pokemon.models import ApiResourceAlias, ApiResourceCache
+from .base import NEGATIVE_STATUSES, CacheBackend
+
+
+def _rows():
+    # `payload_size`: length of the stored JSON, so the memory cache can size
+    # a payload without encoding it again (see `cache.payload_size`).
+    return ApiResourceCache.objects.annotate(payload_size=Length(Cast("payload", output_field=TextField())))
+
+
+class DatabaseBackend(CacheBackend):
+    """
+    Default backend: `ApiResourceCache` rows in the main database.
+
+    Entries are model instances. Partial saves use `update_fields` and
+    batches use `bulk_update`; the `expires_at` / `accessed_at` indexes serve
+    maintenance and revalidation queries.
+    """
+
+    name = "db"
+
+    def new(self, url: str) -> ApiResourceCache:
+        return ApiResourceCache(url=url)
+
+    def get(self, url: str) -> Optional[ApiResourceCache]:
+        try:
+            return _rows().get(url=url)
+        except ApiResourceCache.DoesNotExist:
+            return None
+
+    def get_many(self, urls: Sequence[str]) -> Dict[str, ApiResourceCache]:
+        urls = list(urls)
+        if not urls:
+            return {}
+        return {row.url: row for row in _rows().filter(url__in=urls)}
+
+    def save(self, entry: ApiResourceCache, fields: Optional[Sequence[str]] = None) -> None:
+        if entry.pk is None:
+            try:
+                with transaction.atomic():
+                    entry.save(force_insert=True)
+                return
+            except IntegrityError:
+                # Another thread/process inserted the URL meanwhile → update that row.
+                entry.pk = ApiResourceCache.objects.filter(url=entry.url).values_list("pk", flat=True).first()
+                entry._state.adding = False
+                fields = None
+        if not fields:
+            entry.save()
+            return
+        updated = ApiResourceCache.objects.filter(pk=entry.pk).update(**{f: getattr(entry, f) for f in fields})
+        if not updated and "payload" in fields:
+            # Deleted meanwhile (eviction, alias cleanup): a new payload is stored
+            # again; a mere expiry/access bump has nothing left to update.
+            entry.pk = None
+            entry._state.adding = True
+            self.save(entry)
+
+    def save_many(self, entries: Iterable[ApiResourceCache], fields: Sequence[str]) -> None:
+        entries = list(entries)
+        if entries:
+            ApiResourceCache.objects.bulk_update(entries, list(fields), batch_size=500)
+
+    def delete(self, url: str) -> None:
+        ApiResourceCache.objects.filter(url=url).delete()
+
+    def aliases(self, urls: Iterable[str]) -> Dict[str, str]:
+        urls = list(urls)
+        if not urls:
+            return {}
+        return dict(ApiResourceAlias.objects.filter(alias__in=urls).values_list("alias", "target"))
+
+    def set_alias(self, alias: str, target: str) -> None:
+        ApiResourceAlias.objects.update_or_create(alias=alias, defaults={"target": target})
+
+    def purge_expired(self, before: datetime) -> int:
+        deleted, _ = ApiResourceCache.objects.filter(expires_at__lt=before).delete()
+        return deleted
+
+    def entries_expiring(self, before: datetime, limit: Optional[int] = None) -> List[str]:
+        qs = (
+            ApiResourceCache.objects
+            .filter(expires_at__lte=before)
+            .exclude(status_code__in=NEGATIVE_STATUSES)
+            .order_by("expires_at")
+            .values_list("url", flat=True)
+        )
+        return list(qs[:limit])
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import hashlib
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from django.core.cache import caches
+
+from .base import CacheBackend, CacheEntry, entry_dict
+
+
+def _key(prefix: str, url: str) -> str:
+    # Hashed: memcached keys are limited to 250 printable characters.
+    return f"{prefix}:{hashlib.sha1(url.encode('utf-8')).hexdigest()}"
+
+
+class DjangoCacheBackend(CacheBackend):
+    """
+    Entries in one of Django's `CACHES` (locmem, file-based, memcached, ...).
+
+    Options
+    -------
+    CACHE     : alias in `settings.CACHES` (default "default")
+    RETENTION : seconds an entry is kept after its last write, so expired
+                entries can still be revalidated with their validators
+                or served stale (default 30 days)
+    PREFIX    : key prefix (default "pokeapi")
+
+    The cache evicts by itself, so there is nothing to purge, and it cannot
+    be enumerated (`can_enumerate` is False: no bulk revalidation).
+    """
+
+    name = "django"
+    can_enumerate = False
+
+    def __init__(self, cache: str = "default", retention: int = 30 * 24 * 3600, prefix: str = "pokeapi") -> None:
+        self.alias = cache
+        self.retention = int(retention)
+        self.prefix = prefix
+
+    @property
+    def _cache(self):
+        return caches[self.alias]
+
+    def get(self, url: str) -> Optional[CacheEntry]:
+        data = self._cache.get(_key(self.prefix, url))
+        return CacheEntry.from_dict(data) if data else None
+
+    def get_many(self, urls: Sequence[str]) -> Dict[str, CacheEntry]:
+        keys = {_key(self.prefix, u): u for u in urls}
+        found = self._cache.get_many(list(keys))
+        return {keys[k]: CacheEntry.from_dict(v) for k, v in found.items() if v}
+
+    def save(self, entry: Any, fields: Optional[Sequence[str]] = None) -> None:
+        self._cache.set(_key(self.prefix, entry.url), entry_dict(entry), self.retention)
+
+    def save_many(self, entries: Iterable[Any], fields: Sequence[str]) -> None:
+        data = {_key(self.prefix, e.url): entry_dict(e) for e in entries}
+        if data:
+            self._cache.set_many(data, self.retention)
+
+    def delete(self, url: str) -> None:
+        self._cache.delete(_key(self.prefix, url))
+
+    def aliases(self, urls: Iterable[str]) -> Dict[str, str]:
+        keys = {_key(f"{self.prefix}:alias", u): u for u in urls}
+        found = self._cache.get_many(list(keys)) if keys else {}
+        return {keys[k]: target for k, target in found.items()}
+
+    def set_alias(self, alias: str, target: str) -> None:
+        self._cache.set(_key(f"{self.prefix}:alias", alias), target, None)
+
+    def purge_expired(self, before: datetime) -> int:
+        return 0  # entries age out through RETENTION / the cache's own eviction
+
+    def entries_expiring(self, before: datetime, limit: Optional[int] = None) -> List[str]:
+        return []  # cannot be enumerated; entries are revalidated when read
+
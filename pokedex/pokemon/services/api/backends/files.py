@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+import os
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
+
+from .base import NEGATIVE_STATUSES, CacheBackend, CacheEntry, entry_dict
+
+_SUFFIX = ".json"
+_DATETIME_FIELDS = ("fetched_at", "expires_at", "accessed_at")
+
+
+def _dump_entry(data: Dict[str, Any]) -> Dict[str, Any]:
+    """`entry_dict` → JSON-safe dict (ISO datetimes, base64 body)."""
+    out = dict(data)
+    for name in _DATETIME_FIELDS:
+        if out.get(name) is not None:
+            out[name] = out[name].isoformat()
+    if out.get("body") is not None:
+        out["body"] = base64.b64encode(bytes(out["body"])).decode("ascii")
+    return out
+
+
+def _load_entry(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Inverse of `_dump_entry`."""
+    for name in _DATETIME_FIELDS:
+        if data.get(name):
+            data[name] = datetime.fromisoformat(data[name])
+    if data.get("body") is not None:
+        data["body"] = base64.b64decode(data["body"])
+    return data
+
+
+class FileBackend(CacheBackend):
+    """
+    Entries as individual files in a sharded directory tree.
+
+    `<root>/ab/cd/abcd…(sha1 of the URL).json` holds the entry as plain JSON
+    (ISO datetimes, base64 body), like the cassette store, so the files are
+    portable and reading them never runs code. Writes go to a temp file that
+    is renamed into place, so readers never see partial files and concurrent
+    writers of one URL simply last-write-win.
+    Aliases live under `<root>/aliases/` the same way.
+
+    Options
+    -------
+    PATH : root directory (created on demand)
+    """
+
+    name = "files"
+
+    def __init__(self, path: str) -> None:
+        self.root = Path(path)
+
+    # ---------- paths ----------
+    def _path(self, url: str, kind: str = "entries") -> Path:
+        digest = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        return self.root / kind / digest[:2] / digest[2:4] / f"{digest}{_SUFFIX}"
+
+    def _read(self, path: Path) -> Optional[Any]:
+        try:
+            with open(path, "rb") as fh:
+                return json.loads(fh.read())
+        except FileNotFoundError:
+            return None
+        except ValueError:
+            return None  # torn/corrupt file → treat as a miss
+
+    def _read_entry(self, path: Path) -> Optional[Dict[str, Any]]:
+        data = self._read(path)
+        return _load_entry(data) if isinstance(data, dict) else None
+
+    def _write(self, path: Path, data: Any) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                fh.write(json.dumps(data).encode("utf-8"))
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    def _walk(self) -> Iterator[Path]:
+        yield from (self.root / "entries").glob(f"*/*/*{_SUFFIX}")
+
+    # ---------- backend API ----------
+    def get(self, url: str) -> Optional[CacheEntry]:
+        data = self._read_entry(self._path(url))
+        return CacheEntry.from_dict(data) if data else None
+
+    def save(self, entry: Any, fields: Optional[Sequence[str]] = None) -> None:
+        self._write(self._path(entry.url), _dump_entry(entry_dict(entry)))
+
+    def delete(self, url: str) -> None:
+        try:
+            os.unlink(self._path(url))
+        except FileNotFoundError:
+            pass
+
+    def aliases(self, urls: Iterable[str]) -> Dict[str, str]:
+        return {u: t for u in urls if (t := self._read(self._path(u, "aliases")))}
+
+    def set_alias(self, alias: str, target: str) -> None:
+        self._write(self._path(alias, "aliases"), target)
+
+    def purge_expired(self, before: datetime) -> int:
+        deleted = 0
+        for path in self._walk():
+            data = self._read_entry(path)
+            if data is None or (data.get("expires_at") and data["expires_at"] < before):
+                path.unlink(missing_ok=True)
+                deleted += 1
+        return deleted
+
+    def entries_expiring(self, before: datetime, limit: Optional[int] = None) -> List[str]:
+        due = []
+        for path in self._walk():
+            data = self._read_entry(path)
+            if not data or data.get("status_code") in NEGATIVE_STATUSES:
+                continue
+            if data.get("expires_at") and data["expires_at"] <= before:
+                due.append((data["expires_at"], data["url"]))
+        due.sort()
+        return [u for _, u in due[:limit]]
@@ -1,15 +1,147 @@
 from __future__ import annotations
 from datetime import timedelta
-from typing import Dict, Optional
+from typing import Any, Dict, Iterable, List, Optional, Union
 from django.utils import timezone
 from pokemon.models import ApiResourceCache
+from . import codec as payload_codec
+from .decoding import dumps, loads
+from .backends import NEGATIVE_STATUSES, CacheEntry, get_backend
+from .policies import ttl_for
+from .projections import projection_for, project
+from .urls import canonical_url, name_base_url, resource_of
+from .writebehind import write_behind, write_behind_enabled
+
+
+PAYLOAD_FIELDS = ["payload", "body", "codec"]
+
+# Everything a refresh rewrites (payload, validators, expiry, status).
+ROW_FIELDS = [
+    *PAYLOAD_FIELDS, "etag", "last_modified", "fetched_at", "expires_at", "projected", "status_code",
+    "accessed_at", "resource",
+]
+
+# `accessed_at` is only rewritten when older than this, so reads rarely write.
+ACCESS_RESOLUTION = timedelta(hours=1)
+
+# A cache entry: an `ApiResourceCache` row (db backend) or a `CacheEntry`.
+Entry = Union[ApiResourceCache, CacheEntry]
 
 
 def _now():
     return timezone.now()
 
 
-def is_fresh(row: ApiResourceCache, at: Optional[timezone.datetime] = None) -> bool:
+def _save(row: Entry, fields: Optional[List[str]] = None) -> None:
+    """Persist `row` now, or queue it when write-behind is enabled."""
+    if write_behind_enabled():
+        write_behind.submit(row, fields or ROW_FIELDS)
+    else:
+        get_backend().save(row, fields)
+
+
+def _save_many(rows: List[Entry], fields: List[str]) -> None:
+    if write_behind_enabled():
+        for row in rows:
+            write_behind.submit(row, fields)
+    else:
+        get_backend().save_many(rows, fields)
+
+
+def load_row(url: str) -> Optional[Entry]:
+    """
+    Return the cache entry for `url`, or None if it was never fetched.
+    Entries still queued for write-behind win over stored ones.
+    """
+    return write_behind.pending(url) or get_backend().get(url)
+
+
+def load_rows(urls: Iterable[str]) -> Dict[str, Entry]:
+    """
+    Return existing cache entries for `urls` keyed by URL (one query on the db backend).
+    """
+    urls = list(urls)
+    if not urls:
+        return {}
+    queued = {u: e for u in urls if (e := write_behind.pending(u)) is not None}
+    rest = [u for u in urls if u not in queued]
+    return {**(get_backend().get_many(rest) if rest else {}), **queued}
+
+
+def resolve_keys(urls: Iterable[str]) -> Dict[str, str]:
+    """
+    Map each URL to its cache key: the canonical URL, with a name-based
+    resource prefix replaced by its ID-based alias target when one is known
+    (".../pokemon/pikachu/encounters/" -> ".../pokemon/25/encounters/").
+    Uses at most one query.
+    """
+    canon = {u: canonical_url(u) for u in urls}
+    bases = {c: name_base_url(c) for c in canon.values()}
+    wanted = {b for b in bases.values() if b}
+    aliases = get_backend().aliases(wanted) if wanted else {}
+
+    keys: Dict[str, str] = {}
+    for u, c in canon.items():
+        base = bases[c]
+        keys[u] = aliases[base] + c[len(base):] if base in aliases else c
+    return keys
+
+
+def record_alias(alias: str, target: str) -> None:
+    """Remember that the name-based URL `alias` is the resource at `target`."""
+    get_backend().set_alias(alias, target)
+
+
+def delete_row(url: str) -> None:
+    """Drop the cache entry for `url`, including a queued write-behind entry."""
+    write_behind.discard(url)
+    get_backend().delete(url)
+
+
+def read_payload(row: Entry) -> Any:
+    """
+    Return the decoded payload of a cache row, whatever its storage codec.
+    """
+    if row.codec:
+        raw = payload_codec.decompress(row.body, row.codec)
+        row.payload_size = len(raw)
+        return loads(raw)
+    return row.payload
+
+
+def payload_size(row: Entry) -> Optional[int]:
+    """
+    JSON size of `row`'s payload if known without encoding it: the length of
+    the stored JSON (db backend), of the bytes last decompressed or compressed
+    for it, or of the response body it came from. None when unknown.
+    """
+    return getattr(row, "payload_size", None)
+
+
+def set_payload(row: Entry, payload: Any, codec: Optional[str] = None, size: Optional[int] = None) -> None:
+    """
+    Store `payload` on `row` (unsaved) using `codec` (default: settings).
+    Plain JSON goes to `payload`; binary codecs fill `body` and clear `payload`.
+    `size` is the payload's JSON size if the caller knows it (see `payload_size`).
+    """
+    codec = codec or payload_codec.storage_codec()
+    if codec == payload_codec.JSON:
+        row.payload, row.body, row.codec = payload, None, ""
+    else:
+        raw = dumps(payload)
+        row.payload, row.body, row.codec = None, payload_codec.compress(raw, codec), codec
+        size = len(raw)
+    row.payload_size = size
+
+
+def is_negative(row: Entry) -> bool:
+    """
+    Return True if the row records a permanent upstream error (404/410)
+    instead of a payload.
+    """
+    return row.status_code in NEGATIVE_STATUSES
+
+
+def is_fresh(row: Entry, at: Optional[timezone.datetime] = None) -> bool:
     """
     Return True if the cached row is still fresh with respect to `expires_at`.
     """
@@ -17,7 +149,7 @@ def is_fresh(row: ApiResourceCache, at: Optional[timezone.datetime] = None) -> b
     return not row.expires_at or row.expires_at > at
 
 
-def conditional_headers(row: Optional[ApiResourceCache]) -> Dict[str, str]:
+def conditional_headers(row: Optional[Entry]) -> Dict[str, str]:
     """
     Build conditional request headers (If-None-Match / If-Modified-Since)
     from cached validators, if available.
@@ -36,40 +168,97 @@ def conditional_headers(row: Optional[ApiResourceCache]) -> Dict[str, str]:
     return headers
 
 
-def bump_expiry(row: ApiResourceCache, ttl: timedelta) -> None:
+def touch_access(rows: Iterable[Entry]) -> None:
+    """
+    Record that `rows` were read (coarse LRU clock for cache eviction).
+    Rows touched within `ACCESS_RESOLUTION` are skipped; the rest are
+    written in one batch (a single UPDATE on the db backend).
+    """
+    now = _now()
+    stale = [r for r in rows if not r.accessed_at or now - r.accessed_at >= ACCESS_RESOLUTION]
+    if not stale:
+        return
+    for r in stale:
+        r.accessed_at = now
+    _save_many(stale, ["accessed_at"])
+
+
+def bump_expiry(row: Entry, ttl: timedelta) -> None:
     """
     Extend the cache row validity without mutating the payload/validators.
     """
     row.expires_at = _now() + ttl
-    row.save(update_fields=["expires_at"])
+    _save(row, ["expires_at"])
+
+
+def bump_expiry_many(rows: List[Entry], ttl: Optional[timedelta] = None) -> None:
+    """
+    Extend validity of several rows with one bulk UPDATE (e.g. after a batch of 304s).
+    Without `ttl`, each row gets the TTL policy of its resource type.
+    """
+    if not rows:
+        return
+    now = _now()
+    for row in rows:
+        row.expires_at = now + (ttl if ttl is not None else ttl_for(row.url))
+    _save_many(rows, ["expires_at"])
 
 
 def persist_row(
-    row: Optional[ApiResourceCache],
+    row: Optional[Entry],
     url: str,
     payload: dict,
     headers: Dict[str, str],
     ttl: timedelta,
-) -> ApiResourceCache:
+    *,
+    full: bool = False,
+    size: Optional[int] = None,
+) -> Entry:
     """
     Create or update the cache row with a new payload and HTTP validators.
+
+    Unless `full` is set, the payload is first trimmed with the projection
+    registered for the URL (see `services.api.projections`). It is then stored
+    with the configured codec (see `set_payload`). `size` is the length of the
+    response body; it is kept as the payload's size unless projection shrank it.
     """
     expires = _now() + ttl
     etag = headers.get("ETag", "")
     last_modified = headers.get("Last-Modified", "")
+    projected = not full and projection_for(url) is not None
+    if projected:
+        payload = project(url, payload)
 
-    if row:
-        row.payload = payload
-        row.etag = etag
-        row.last_modified = last_modified
-        row.expires_at = expires
-        row.save(update_fields=["payload", "etag", "last_modified", "expires_at"])
-        return row
-
-    return ApiResourceCache.objects.create(
-        url=url,
-        payload=payload,
-        etag=etag,
-        last_modified=last_modified,
-        expires_at=expires,
-    )
\ No newline at end of file
+    row = row or get_backend().new(url)
+    row.resource = resource_of(url)
+    set_payload(row, payload, size=None if projected else size)
+    row.etag = etag
+    row.last_modified = last_modified
+    row.fetched_at = row.accessed_at = _now()
+    row.expires_at = expires
+    row.projected = projected
+    row.status_code = 200
+    _save(row, ROW_FIELDS)
+    return row
+
+
+def persist_negative(
+    row: Optional[Entry],
+    url: str,
+    status_code: int,
+    ttl: timedelta,
+) -> Entry:
+    """
+    Record that `url` answered with a permanent error (see `NEGATIVE_STATUSES`).
+    Any cached payload and validators are dropped; the entry lives for `ttl`.
+    """
+    row = row or get_backend().new(url)
+    row.resource = resource_of(url)
+    set_payload(row, None, payload_codec.JSON)
+    row.etag = row.last_modified = ""
+    row.projected = False
+    row.status_code = status_code
+    row.fetched_at = row.accessed_at = _now()
+    row.expires_at = _now() + ttl
+    _save(row, ROW_FIELDS)
+    return row
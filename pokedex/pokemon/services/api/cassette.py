@@ -0,0 +1,155 @@
+from __future__ import annotations
+"""
+Record/replay transport for upstream PokeAPI requests.
+
+- record : requests go upstream as usual; every response (status, headers,
+           body, elapsed time) is also written to the cassette store.
+- replay : requests are answered from the store only (no network), with
+           optional injected latency; unknown URLs raise `CassetteMiss`.
+
+The store is a directory of gzip-compressed JSON files keyed by the canonical
+URL (`<root>/ab/abcd…(sha1).json.gz`), so a recorded crawl can be copied
+around and replayed by sync/view benchmarks offline and reproducibly:
+
+    POKEAPI_CASSETTE_MODE=record POKEAPI_CASSETTE_PATH=var/crawl python manage.py sync_all_pokemon
+    POKEAPI_CASSETTE_MODE=replay POKEAPI_CASSETTE_PATH=var/crawl python manage.py sync_all_pokemon
+"""
+
+import base64
+import gzip
+import hashlib
+import io
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+from urllib3.response import HTTPResponse
+
+from .urls import canonical_url
+
+OFF, RECORD, REPLAY = "off", "record", "replay"
+
+CASSETTE_DEFAULTS: Dict[str, Any] = {
+    "MODE": OFF,
+    "PATH": None,
+    "LATENCY": 0.0,  # seconds added per replayed response, or "recorded" (as measured)
+}
+
+# Recorded bodies are stored decoded; these headers would no longer describe them.
+_DROP_HEADERS = {"content-encoding", "transfer-encoding", "content-length", "connection"}
+
+_sleep = time.sleep
+
+
+class CassetteMiss(requests.ConnectionError):
+    """A replayed request whose URL was never recorded."""
+
+
+def cassette_conf() -> Dict[str, Any]:
+    return {**CASSETTE_DEFAULTS, **getattr(settings, "POKEAPI_CASSETTE", {})}
+
+
+class CassetteStore:
+    """Recorded responses on disk, one gzip'd JSON document per canonical URL."""
+
+    def __init__(self, path: str) -> None:
+        self.root = Path(path)
+
+    def _path(self, url: str) -> Path:
+        digest = hashlib.sha1(canonical_url(url).encode("utf-8")).hexdigest()
+        return self.root / digest[:2] / f"{digest}.json.gz"
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        try:
+            with gzip.open(self._path(url), "rb") as fh:
+                record = json.loads(fh.read())
+        except FileNotFoundError:
+            return None
+        record["body"] = base64.b64decode(record["body"])
+        return record
+
+    def put(self, url: str, status: int, headers: Dict[str, str], body: bytes, elapsed: float) -> Dict[str, Any]:
+        record = {
+            "url": canonical_url(url),
+            "status": status,
+            "headers": {k: v for k, v in headers.items() if k.lower() not in _DROP_HEADERS},
+            "elapsed": round(elapsed, 6),
+            "body": base64.b64encode(body).decode("ascii"),
+        }
+        path = self._path(url)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as raw, gzip.GzipFile(fileobj=raw, mode="wb") as fh:
+                fh.write(json.dumps(record).encode("utf-8"))
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+        return {**record, "body": body}
+
+
+class CassetteAdapter(HTTPAdapter):
+    """
+    Transport adapter that records upstream responses to, or replays them
+    from, a `CassetteStore`.
+
+    Both modes hand the caller a response rebuilt from the record, so
+    recorded and replayed runs see identical objects (decoded body,
+    `Content-Length`, streamable `raw`). Replay answers a conditional GET
+    whose `If-None-Match` equals the recorded ETag with a 304.
+    """
+
+    def __init__(self, store: CassetteStore, mode: str, latency: Any = 0.0, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.store = store
+        self.mode = mode
+        self.latency = latency
+
+    def send(self, request: requests.PreparedRequest, **kwargs: Any) -> requests.Response:
+        if self.mode == RECORD:
+            started = time.monotonic()
+            live = super().send(request, **kwargs)
+            body = live.content
+            record = self.store.put(request.url, live.status_code, dict(live.headers), body,
+                                    time.monotonic() - started)
+            return self._response(request, record)
+
+        record = self.store.get(request.url)
+        if record is None:
+            raise CassetteMiss(f"No recorded response for {request.url}", request=request)
+        delay = record.get("elapsed", 0.0) if self.latency == "recorded" else float(self.latency or 0.0)
+        if delay > 0:
+            _sleep(delay)
+        etag = record["headers"].get("ETag")
+        if etag and request.headers.get("If-None-Match") == etag:
+            record = {**record, "status": 304, "body": b""}
+        return self._response(request, record)
+
+    def _response(self, request: requests.PreparedRequest, record: Dict[str, Any]) -> requests.Response:
+        body = record["body"]
+        raw = HTTPResponse(
+            body=io.BytesIO(body),
+            headers={**record["headers"], "Content-Length": str(len(body))},
+            status=record["status"],
+            preload_content=False,
+            decode_content=False,
+        )
+        return self.build_response(request, raw)
+
+
+def cassette_adapter(**adapter_kwargs: Any) -> Optional[CassetteAdapter]:
+    """The adapter configured by settings `POKEAPI_CASSETTE`, or None when off."""
+    conf = cassette_conf()
+    mode = str(conf["MODE"] or OFF).lower()
+    if mode == OFF:
+        return None
+    if mode not in (RECORD, REPLAY) or not conf["PATH"]:
+        raise ValueError(f"POKEAPI_CASSETTE needs MODE record/replay and a PATH (got {mode!r}, {conf['PATH']!r})")
+    return CassetteAdapter(CassetteStore(conf["PATH"]), mode, conf["LATENCY"], **adapter_kwargs)
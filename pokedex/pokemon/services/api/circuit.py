@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+from urllib.parse import urlsplit
+
+import requests
+from django.conf import settings
+
+
+CIRCUIT_DEFAULTS: Dict[str, Any] = {
+    "ENABLED": True,
+    "WINDOW": 20,  # most recent calls per host the failure rate is computed over
+    "MIN_CALLS": 5,  # calls needed in the window before the circuit may open
+    "FAILURE_RATE": 0.5,  # share of failed calls that opens the circuit
+    "RESET_TIMEOUT": 30.0,  # seconds open before a single probe is let through
+}
+
+CLOSED, OPEN, HALF_OPEN = "closed", "open", "half-open"
+
+_clock = time.monotonic
+
+
+class CircuitOpenError(requests.ConnectionError):
+    """
+    Raised instead of contacting a host whose circuit is open. A
+    `ConnectionError`, so callers handling network failures handle it too.
+    """
+
+    def __init__(self, host: str, retry_in: float) -> None:
+        super().__init__(f"Circuit open for {host}; retry in {retry_in:.1f}s")
+        self.host = host
+        self.retry_in = retry_in
+
+
+class _Circuit:
+    __slots__ = ("state", "outcomes", "opened_at", "probing")
+
+    def __init__(self, window: int) -> None:
+        self.state = CLOSED
+        self.outcomes: Deque[bool] = deque(maxlen=window)  # True = failure
+        self.opened_at = 0.0
+        self.probing = False
+
+
+class CircuitBreaker:
+    """
+    Per-host circuit breaker for upstream requests.
+
+    Each host keeps the outcomes of its last `window` calls. Once at least
+    `min_calls` are recorded and the failed share reaches `failure_rate`, the
+    circuit opens: `before()` raises `CircuitOpenError` without any network
+    I/O, so no thread waits on a dead upstream. After `reset_timeout` seconds
+    the circuit is half-open and exactly one caller is let through as a probe;
+    its success closes the circuit, its failure re-opens it. Every call let
+    through must end in `record()` or, without an outcome, `release()`.
+
+    Failures are connection errors/timeouts and 5xx answers; anything else
+    (including 404/429) counts as a success — the host is up.
+
+    Counters
+    --------
+    opened   : transitions to open
+    rejected : calls failed fast while open/half-open
+    """
+
+    def __init__(
+        self,
+        window: int,
+        min_calls: int,
+        failure_rate: float,
+        reset_timeout: float,
+        *,
+        enabled: bool = True,
+    ) -> None:
+        self.window = max(1, int(window))
+        self.min_calls = max(1, int(min_calls))
+        self.failure_rate = float(failure_rate)
+        self.reset_timeout = float(reset_timeout)
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._circuits: Dict[str, _Circuit] = {}
+        self.opened = 0
+        self.rejected = 0
+
+    # ---------- public API ----------
+    def before(self, url: str) -> None:
+        """Raise `CircuitOpenError` unless a request to `url`'s host may be sent now."""
+        if not self.enabled:
+            return
+        host = _host(url)
+        with self._lock:
+            c = self._circuits.get(host)
+            if c is None or c.state == CLOSED:
+                return
+            now = _clock()
+            if c.state == OPEN and now - c.opened_at >= self.reset_timeout:
+                c.state = HALF_OPEN
+            if c.state == HALF_OPEN and not c.probing:
+                c.probing = True  # this caller is the probe
+                return
+            self.rejected += 1
+            retry_in = max(0.0, c.opened_at + self.reset_timeout - now)
+        raise CircuitOpenError(host, retry_in)
+
+    def record(self, url: str, failed: bool) -> None:
+        """Record the outcome of a request that `before()` let through."""
+        if not self.enabled:
+            return
+        host = _host(url)
+        with self._lock:
+            c = self._circuits.setdefault(host, _Circuit(self.window))
+            if c.state != CLOSED:
+                c.probing = False
+                if failed:
+                    self._open(c)
+                else:
+                    c.state = CLOSED
+                    c.outcomes.clear()
+                return
+            c.outcomes.append(failed)
+            if len(c.outcomes) >= self.min_calls and \
+                    sum(c.outcomes) / len(c.outcomes) >= self.failure_rate:
+                self._open(c)
+
+    def release(self, url: str) -> None:
+        """
+        End a request that `before()` let through without an outcome (it
+        raised something other than a network error, or was cancelled). Its
+        host's health is unknown, so nothing is recorded; a half-open circuit
+        lets the next caller probe instead.
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            c = self._circuits.get(_host(url))
+            if c is not None and c.state == HALF_OPEN:
+                c.probing = False
+
+    def is_open(self, url: str) -> bool:
+        """True while calls to `url`'s host fail fast (open, or half-open with a probe out)."""
+        if not self.enabled:
+            return False
+        with self._lock:
+            c = self._circuits.get(_host(url))
+            if c is None or c.state == CLOSED:
+                return False
+            if c.state == HALF_OPEN:
+                return c.probing
+            return _clock() - c.opened_at < self.reset_timeout
+
+    def reset(self) -> None:
+        with self._lock:
+            self._circuits.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "hosts": {h: c.state for h, c in self._circuits.items()},
+                "opened": self.opened,
+                "rejected": self.rejected,
+            }
+
+    # ---------- internals ----------
+    def _open(self, c: _Circuit) -> None:
+        # caller holds self._lock
+        c.state = OPEN
+        c.opened_at = _clock()
+        c.outcomes.clear()
+        self.opened += 1
+
+
+def _host(url: str) -> str:
+    return urlsplit(url).netloc.lower()
+
+
+def is_failure(status_code: Optional[int]) -> bool:
+    """True for outcomes that count against a host (no response, or a 5xx)."""
+    return status_code is None or status_code >= 500
+
+
+def circuit_conf() -> Dict[str, Any]:
+    return {**CIRCUIT_DEFAULTS, **getattr(settings, "POKEAPI_CIRCUIT_BREAKER", {})}
+
+
+def _build_from_settings() -> CircuitBreaker:
+    conf = circuit_conf()
+    return CircuitBreaker(
+        window=int(conf["WINDOW"]),
+        min_calls=int(conf["MIN_CALLS"]),
+        failure_rate=float(conf["FAILURE_RATE"]),
+        reset_timeout=float(conf["RESET_TIMEOUT"]),
+        enabled=bool(conf["ENABLED"]),
+    )
+
+
+circuit_breaker = _build_from_settings()
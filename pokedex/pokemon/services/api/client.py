@@ -1,62 +1,515 @@
 from __future__ import annotations
 
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
-from typing import Dict, Optional
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Sequence
+
+import requests
+from django.conf import settings
 
-from pokemon.models import ApiResourceCache
 from .session import get_session
-from .cache import is_fresh, conditional_headers, bump_expiry, persist_row
+from .cache import (
+    Entry,
+    load_row,
+    load_rows,
+    is_fresh,
+    is_negative,
+    conditional_headers,
+    delete_row,
+    bump_expiry,
+    bump_expiry_many,
+    NEGATIVE_STATUSES,
+    persist_negative,
+    persist_row,
+    payload_size,
+    read_payload,
+    record_alias,
+    resolve_keys,
+    touch_access,
+)
+from .circuit import CircuitOpenError, circuit_breaker, is_failure
+from .decoding import decode_response_sized
+from .hedge import hedger, hedging_enabled
+from .memory import memory_cache
+from .policies import DEFAULT_TTL, ttl_for
+from .prefetch import schedule_prefetch
+from .ratelimit import rate_limit_conf, rate_limiter, retry_delay
+from .singleflight import single_flight
+from .stale import can_serve_stale, schedule_revalidation
+from .urls import canonical_url, id_url_for, name_base_url
 
 
-DEFAULT_TTL = timedelta(hours=24)
+NEGATIVE_TTL = timedelta(hours=1)  # default lifetime of cached 404/410 answers
 DEFAULT_TIMEOUT = 10.0  # seconds
+FETCH_WORKERS = 8  # concurrent upstream requests for `get_json_many`
+THROTTLED = (429, 503)  # statuses that make the shared rate limiter back off
+
+
+class FetchResult(NamedTuple):
+    """Outcome for one URL of `get_json_many` (exactly one of data/error is set)."""
+    url: str
+    data: Any = None
+    error: Optional[BaseException] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class CachedHTTPError(requests.HTTPError):
+    """
+    Raised for a URL with a live negative cache entry (404/410) without
+    contacting upstream. `response` is a bare `requests.Response` carrying
+    the recorded status code, so callers can treat it like any HTTPError.
+    """
+
+    def __init__(self, url: str, status_code: int) -> None:
+        response = requests.Response()
+        response.status_code = status_code
+        response.url = url
+        super().__init__(f"{status_code} Client Error (cached) for url: {url}", response=response)
+        self.url = url
+        self.status_code = status_code
+
+
+def negative_ttl() -> timedelta:
+    """Lifetime of negative entries (settings `POKEAPI_NEGATIVE_TTL`, seconds)."""
+    seconds = getattr(settings, "POKEAPI_NEGATIVE_TTL", None)
+    return NEGATIVE_TTL if seconds is None else timedelta(seconds=float(seconds))
+
+
+_pool: Optional[ThreadPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def _fetch_pool() -> ThreadPoolExecutor:
+    """
+    Long-lived executor for upstream requests. Its threads keep their
+    thread-local sessions (and thus pooled connections) between batches.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ThreadPoolExecutor(max_workers=FETCH_WORKERS, thread_name_prefix="pokeapi-fetch")
+        return _pool
+
+
+def _send(url: str, timeout: float, headers: Dict[str, str]) -> requests.Response:
+    """One upstream attempt: circuit breaker, rate limiter, GET, latency sample."""
+    circuit_breaker.before(url)
+    failed: Optional[bool] = None
+    try:
+        rate_limiter.acquire()
+        started = time.monotonic()
+        try:
+            r = get_session().get(url, timeout=timeout, headers=headers, stream=True)
+        except requests.RequestException:
+            failed = True
+            raise
+        hedger.observe(time.monotonic() - started)
+        failed = is_failure(r.status_code)
+        return r
+    finally:
+        if failed is None:
+            circuit_breaker.release(url)  # never leave a half-open probe outstanding
+        else:
+            circuit_breaker.record(url, failed)
+
+
+def _request(
+    url: str,
+    row: Optional[Entry],
+    timeout: float,
+    extra_headers: Optional[Dict[str, str]],
+    hedge: bool = False,
+) -> requests.Response:
+    """
+    Issue the (conditional) GET for `url`. Network only, no DB access.
+
+    Every attempt first takes a slot from the shared `rate_limiter`. A 429/503
+    pauses the limiter for all callers (Retry-After, else a default delay) and
+    is retried up to `RETRIES_429` times; the last response is returned as is.
+
+    The body is not read here (`stream=True`): only 200 bodies are needed, and
+    `decode_response` may parse them incrementally. Other responses are closed
+    right away so their connection returns to the pool.
+
+    Each attempt is gated by the per-host `circuit_breaker` and reports its
+    outcome to it; an open circuit raises `CircuitOpenError` without I/O.
+
+    With `hedge`, an attempt slower than the recent latency percentile is
+    duplicated and the first response wins (see `services.api.hedge`).
+    """
+    headers = conditional_headers(row)
+    if extra_headers:
+        headers.update(extra_headers)
+
+    retries = int(rate_limit_conf()["RETRIES_429"])
+    for _ in range(retries + 1):
+        if hedge:
+            r = hedger.call(lambda: _send(url, timeout, headers))
+        else:
+            r = _send(url, timeout, headers)
+        if r.status_code != 200:
+            r.close()
+        if r.status_code not in THROTTLED:
+            return r
+        rate_limiter.penalize(retry_delay(r.headers))
+    return r
+
+
+def store_response(
+    url: str,
+    row: Optional[Entry],
+    r: requests.Response,
+    ttl: timedelta,
+    full: bool = False,
+) -> Any:
+    """
+    Store an upstream answer for `url` (cached as `row`, if any) and return
+    the payload to serve: a 304 extends the row by `ttl`, a 404/410 becomes a
+    negative entry and raises, a 200 replaces the payload and validators.
+
+    Shared by every transport (`get_json`, `get_json_many`, `AsyncClient`).
+    """
+    # Not modified → extend TTL and return cached
+    if r.status_code == 304 and row:
+        bump_expiry(row, ttl)
+        payload = read_payload(row)
+        memory_cache.set(url, payload, row.expires_at, size=payload_size(row))
+        return payload
+
+    # The resource does not exist → remember that for a short while.
+    if r.status_code in NEGATIVE_STATUSES:
+        persist_negative(row, url, r.status_code, negative_ttl())
+        memory_cache.delete(url)
+        r.raise_for_status()
+        raise requests.HTTPError(f"{r.status_code} Client Error for url: {url}", response=r)
+
+    r.raise_for_status()
+    data, size = decode_response_sized(r, url, full=full)
+
+    # Fetched by name → store under the ID-based URL and remember the alias.
+    target = id_url_for(url, data)
+    if target:
+        record_alias(url, target)
+        if row is not None:
+            delete_row(row.url)  # keyed by the name URL (written before aliases existed)
+        row = load_row(target)
+
+    saved = persist_row(row, target or url, data, r.headers, ttl, full=full, size=size)
+    payload = read_payload(saved)  # projected unless `full`
+    memory_cache.set(saved.url, payload, saved.expires_at, size=payload_size(saved))
+    if target:
+        memory_cache.set(url, payload, saved.expires_at, size=payload_size(saved))
+    return payload
+
+
+class Revalidated(NamedTuple):
+    """Outcome counts of `revalidate_entries`."""
+    not_modified: int = 0
+    modified: int = 0
+    errors: int = 0
+
+
+def revalidate_entries(
+    rows: Sequence[Entry],
+    *,
+    ttl: Optional[timedelta] = None,
+    timeout: float = DEFAULT_TIMEOUT,
+    pool: Optional[ThreadPoolExecutor] = None,
+) -> Revalidated:
+    """
+    Revalidate cached `rows` upstream regardless of their age.
+
+    Conditional GETs run concurrently on `pool` (default: the shared fetch
+    pool); the answers are stored in the calling thread: all 304s with one
+    bulk UPDATE (extended by `ttl`, default the URL's TTL policy), other
+    answers via `store_response`. Failures are counted, their rows left as is.
+    """
+    pool = pool or _fetch_pool()
+    futures = [(row, pool.submit(_request, row.url, row, timeout, None)) for row in rows]
+
+    not_modified: List[Entry] = []
+    modified = errors = 0
+    for row, fut in futures:
+        try:
+            r = fut.result()
+            if r.status_code == 304:
+                not_modified.append(row)
+            else:
+                store_response(row.url, row, r, ttl if ttl is not None else ttl_for(row.url))
+                modified += 1
+        except Exception:  # noqa: BLE001 — counted, row stays expired
+            errors += 1
+
+    bump_expiry_many(not_modified, ttl)
+    return Revalidated(len(not_modified), modified, errors)
+
+
+def _refresh(
+    url: str,
+    row: Optional[Entry],
+    ttl: timedelta,
+    timeout: float,
+    extra_headers: Optional[Dict[str, str]],
+    full: bool = False,
+    hedge: bool = False,
+) -> Any:
+    """Revalidate/fetch `url` upstream (runs as the single-flight leader)."""
+    # A flight for this URL may have completed between our cache check and
+    # becoming leader; don't fetch (and insert) the same row twice.
+    cached = None if full else memory_cache.get(url)
+    if cached is not None:
+        return cached
+
+    # A projected row can't satisfy a full request, so its validators must not
+    # be sent (a 304 would hand back the trimmed payload).
+    validators_row = None if (full and row and row.projected) else row
+    r = _request(url, validators_row, timeout, extra_headers, hedge)
+    return store_response(url, row, r, ttl, full)
+
+
+def has_fallback(row: Optional[Entry], full: bool = False) -> bool:
+    """True if `row` holds a payload to serve, whatever its age, while upstream is down."""
+    return row is not None and not is_negative(row) and not (full and row.projected)
+
+
+def _revalidate_later(
+    url: str,
+    ttl: timedelta,
+    timeout: float,
+    extra_headers: Optional[Dict[str, str]],
+) -> None:
+    """Queue a background conditional GET for a stale row we just served."""
+    def _job() -> Any:
+        return single_flight.do(url, lambda: _refresh(url, load_row(url), ttl, timeout, extra_headers))
+
+    schedule_revalidation(url, _job)
 
 
 def get_json(
     url: str,
-    ttl: timedelta = DEFAULT_TTL,
+    ttl: Optional[timedelta] = None,
     timeout: float = DEFAULT_TIMEOUT,
     extra_headers: Optional[Dict[str, str]] = None,
+    allow_stale: Optional[bool] = None,
+    full: bool = False,
+    hedge: Optional[bool] = None,
 ) -> dict:
     """
     Fetch JSON for `url` using a DB-backed cache with TTL and HTTP validators.
 
     Behavior
     --------
+    0) If the in-process memory cache holds a live entry, return it
+       (no DB query, no JSON decode).
     1) If a cache row exists and is fresh, return it.
     2) Otherwise, issue a conditional GET (ETag/Last-Modified when available).
        - 304 → bump expiry and return cached payload.
        - 200 → replace payload and validators, return new payload.
+       Concurrent callers for the same URL share a single upstream request.
+    3) 404/410 answers are cached as negative entries for `negative_ttl()`;
+       until they expire the URL raises `CachedHTTPError` without a request.
+    4) Stale-while-revalidate (settings `POKEAPI_STALE_WHILE_REVALIDATE`, or
+       `allow_stale` per call): an expired row within `MAX_STALE` is returned
+       immediately and revalidated in the background instead.
+    5) While the circuit breaker for the host is open (see `services.api.circuit`),
+       any cached payload is returned regardless of its age; without one,
+       `CircuitOpenError` is raised at once.
+    6) Prefetch (settings `POKEAPI_PREFETCH`): after an upstream fetch, URLs
+       linked from the payload (species, evolution chain, moves, …) are fetched
+       in the background, see `services.api.prefetch`.
+    7) Hedging (`hedge=True`, default settings `POKEAPI_HEDGING`): an upstream
+       request slower than the recent latency percentile is sent a second
+       time and the first response wins. Meant for the interactive path.
+
+    Entries live for `ttl`; by default for the TTL policy of the URL's
+    resource type (settings `POKEAPI_TTL_POLICIES`, see `services.api.policies`).
+
+    Cache keys are `canonical_url(url)`; a name-based URL (".../pokemon/pikachu/")
+    shares the row of its ID-based form once the alias is known
+    (`ApiResourceAlias`, recorded on the first fetch by name).
+
+    Payloads are trimmed to the fields the app reads (see
+    `services.api.projections`); pass `full=True` to get and store the whole
+    upstream document.
+
+    Payloads served from the memory cache are shared; treat them as read-only.
 
     Raises
     ------
     requests.HTTPError
         For non-2xx/304 responses (after retries at the adapter level).
+    CachedHTTPError
+        (an HTTPError) for URLs with a live negative entry.
+    CircuitOpenError
+        (a ConnectionError) when upstream is considered down and nothing is cached.
     json.JSONDecodeError
         If a 200 response does not contain valid JSON.
     """
-    row: Optional[ApiResourceCache]
+    url = canonical_url(url)
+    cached = None if full else memory_cache.get(url)
+    if cached is not None:
+        return cached
+
+    if name_base_url(url):
+        url = resolve_keys([url])[url]
+        cached = None if full else memory_cache.get(url)
+        if cached is not None:
+            return cached
+
+    ttl = ttl_for(url) if ttl is None else ttl
+    row = load_row(url)
+    if row is not None and is_negative(row) and is_fresh(row):
+        raise CachedHTTPError(url, row.status_code)
+
+    usable = row is not None and not (full and row.projected)
+    if usable and is_fresh(row):
+        touch_access([row])
+        payload = read_payload(row)
+        memory_cache.set(url, payload, row.expires_at, size=payload_size(row))
+        return payload
 
+    if usable and can_serve_stale(row, allow_stale):
+        touch_access([row])
+        _revalidate_later(url, ttl, timeout, extra_headers)
+        return read_payload(row)
+
+    # Upstream is down: degrade to whatever is cached instead of waiting on it.
+    if has_fallback(row, full) and circuit_breaker.is_open(url):
+        return read_payload(row)
+
+    # Only one upstream request per URL is in flight in this process;
+    # concurrent callers wait for (and share) the leader's result.
+    key = (url, "full") if full else url
     try:
-        row = ApiResourceCache.objects.get(url=url)
-        if is_fresh(row):
-            return row.payload
+        payload = single_flight.do(
+            key, lambda: _refresh(url, row, ttl, timeout, extra_headers, full, hedging_enabled(hedge))
+        )
+    except CircuitOpenError:
+        if has_fallback(row, full):
+            return read_payload(row)
+        raise
+    schedule_prefetch(url, payload, get_json)
+    return payload
 
-    except ApiResourceCache.DoesNotExist:
-        row = None
 
-    headers = conditional_headers(row)
-    if extra_headers:
-        headers.update(extra_headers)
+def get_json_many(
+    urls: Iterable[str],
+    ttl: Optional[timedelta] = None,
+    timeout: float = DEFAULT_TIMEOUT,
+    extra_headers: Optional[Dict[str, str]] = None,
+    allow_stale: Optional[bool] = None,
+    hedge: Optional[bool] = None,
+) -> List[FetchResult]:
+    """
+    Batch variant of `get_json` with the same cache semantics.
 
-    r = get_session().get(url, timeout=timeout, headers=headers)
+    - Memory-cache hits are served directly.
+    - Remaining URLs are looked up with a single `url__in` query.
+    - Stale/missing URLs are requested concurrently; 304s are bumped with one
+      bulk UPDATE, 200s are persisted in the calling thread.
+    - URLs already being fetched by another caller are awaited, not re-requested.
+    - Stale rows are served and revalidated in the background, as in `get_json`.
+    - While the host's circuit is open, cached payloads are served regardless of age.
+    - Payloads fetched upstream queue prefetches of their linked URLs, as in `get_json`.
+    - Upstream requests are hedged with `hedge=True` (default settings
+      `POKEAPI_HEDGING`), as in `get_json`.
 
-    # Not modified → extend TTL and return cached
-    if r.status_code == 304 and row:
-        bump_expiry(row, ttl)
-        return row.payload
+    Returns one `FetchResult` per input URL, in input order (duplicates allowed).
+    Errors are reported per URL instead of raised.
+    """
+    urls = list(urls)
+    canon = {u: canonical_url(u) for u in urls}
+    results: Dict[str, FetchResult] = {}  # by cache key
 
-    r.raise_for_status()
-    data = r.json()
-    saved = persist_row(row, url, data, r.headers, ttl)
-    return saved.payload
\ No newline at end of file
+    def _from_memory(keys: Iterable[str]) -> List[str]:
+        missing: List[str] = []
+        for k in dict.fromkeys(keys):
+            cached = None if k in results else memory_cache.get(k)
+            if cached is not None:
+                results[k] = FetchResult(k, cached)
+            elif k not in results:
+                missing.append(k)
+        return missing
+
+    # Name-based URLs are looked up under their ID-based key when the alias is known.
+    keys = resolve_keys([c for c in _from_memory(canon.values()) if name_base_url(c)])
+    pending = _from_memory(keys.get(c, c) for c in canon.values())
+
+    rows = load_rows(pending)
+    misses: List[str] = []
+    served: List[Entry] = []
+    for u in pending:
+        row = rows.get(u)
+        if row and is_negative(row) and is_fresh(row):
+            results[u] = FetchResult(u, error=CachedHTTPError(u, row.status_code))
+        elif row and is_fresh(row):
+            payload = read_payload(row)
+            memory_cache.set(u, payload, row.expires_at, size=payload_size(row))
+            results[u] = FetchResult(u, payload)
+            served.append(row)
+        elif row and can_serve_stale(row, allow_stale):
+            _revalidate_later(u, ttl if ttl is not None else ttl_for(u), timeout, extra_headers)
+            results[u] = FetchResult(u, read_payload(row))
+            served.append(row)
+        elif has_fallback(row) and circuit_breaker.is_open(u):
+            results[u] = FetchResult(u, read_payload(row))
+        else:
+            misses.append(u)
+    touch_access(served)
+
+    # Lead the flights nobody else is running; join the rest.
+    led: Dict[str, Any] = {}
+    joined: Dict[str, Any] = {}
+    for u in misses:
+        call, leader = single_flight.begin(u)
+        (led if leader else joined)[u] = call
+
+    pool = _fetch_pool()
+    hedged = hedging_enabled(hedge)
+    futures = {u: pool.submit(_request, u, rows.get(u), timeout, extra_headers, hedged) for u in led}
+
+    not_modified: List[Entry] = []
+    try:
+        for u, fut in futures.items():
+            row = rows.get(u)
+            try:
+                r = fut.result()
+                if r.status_code == 304 and row:
+                    not_modified.append(row)
+                    results[u] = FetchResult(u, read_payload(row))
+                else:
+                    payload = store_response(u, row, r, ttl if ttl is not None else ttl_for(u))
+                    results[u] = FetchResult(u, payload)
+
+            except CircuitOpenError as e:
+                results[u] = FetchResult(u, read_payload(row)) if has_fallback(row) else FetchResult(u, error=e)
+            except Exception as e:  # noqa: BLE001
+                results[u] = FetchResult(u, error=e)
+            else:
+                if r.status_code == 200:
+                    schedule_prefetch(u, results[u].data, get_json)
+
+        bump_expiry_many(not_modified, ttl)
+        for row in not_modified:
+            memory_cache.set(row.url, results[row.url].data, row.expires_at, size=payload_size(row))
+
+    finally:
+        for u, call in led.items():
+            res = results.get(u)
+            if res is None:
+                single_flight.finish(u, call, error=RuntimeError(f"batch fetch aborted for {u}"))
+            else:
+                single_flight.finish(u, call, result=res.data, error=res.error)
+
+    for u, call in joined.items():
+        try:
+            results[u] = FetchResult(u, call.wait())
+        except Exception as e:  # noqa: BLE001
+            results[u] = FetchResult(u, error=e)
+
+    return [results[keys.get(canon[u], canon[u])]._replace(url=u) for u in urls]
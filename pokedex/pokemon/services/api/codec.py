@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import zlib
+from typing import Any, Callable, Dict, Tuple
+
+from django.conf import settings
+
+from .decoding import dumps as _dumps, loads as _loads
+
+try:  # optional dependency
+    import zstandard
+except ImportError:  # pragma: no cover - depends on the environment
+    zstandard = None
+
+
+JSON = "json"  # stored as-is in the `payload` JSON column
+ZLIB = "zlib"  # compact JSON, zlib-compressed into `body`
+ZSTD = "zstd"  # compact JSON, zstd-compressed into `body` (needs `zstandard`)
+
+ZLIB_LEVEL = 6
+ZSTD_LEVEL = 10
+
+
+def _zstd_compress(data: bytes) -> bytes:
+    return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(data)
+
+
+def _zstd_decompress(data: bytes) -> bytes:
+    return zstandard.ZstdDecompressor().decompress(data)
+
+
+_CODECS: Dict[str, Tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]]] = {
+    ZLIB: (lambda b: zlib.compress(b, ZLIB_LEVEL), zlib.decompress),
+}
+if zstandard is not None:
+    _CODECS[ZSTD] = (_zstd_compress, _zstd_decompress)
+
+
+def available_codecs() -> Tuple[str, ...]:
+    """Codec names usable in this environment (`json` is always available)."""
+    return (JSON, *_CODECS)
+
+
+def storage_codec() -> str:
+    """Codec for newly written rows (settings `POKEAPI_CACHE_CODEC`, default `json`)."""
+    return getattr(settings, "POKEAPI_CACHE_CODEC", JSON) or JSON
+
+
+def _codec(codec: str) -> Tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]]:
+    try:
+        return _CODECS[codec]
+    except KeyError:
+        raise ValueError(f"Unknown or unavailable payload codec: {codec!r}") from None
+
+
+def compress(raw: bytes, codec: str) -> bytes:
+    """Compress compact JSON bytes with a binary codec."""
+    return _codec(codec)[0](raw)
+
+
+def decompress(data: bytes, codec: str) -> bytes:
+    """Inverse of `compress`: the compact JSON bytes."""
+    return _codec(codec)[1](bytes(data))
+
+
+def encode(payload: Any, codec: str) -> bytes:
+    """Serialize and compress `payload` with a binary codec."""
+    return compress(_dumps(payload), codec)
+
+
+def decode(data: bytes, codec: str) -> Any:
+    """Inverse of `encode`."""
+    return _loads(decompress(data, codec))
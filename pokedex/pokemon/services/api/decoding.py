@@ -0,0 +1,153 @@
+from __future__ import annotations
+"""
+JSON (de)serialization for PokeAPI payloads.
+
+- `loads` / `dumps` use `orjson` (several times faster than the stdlib and
+  works on bytes directly), falling back to `json` if it is missing.
+- `decode_response` turns a 200 response into Python objects. Large bodies
+  of projected resources are stream-parsed with `ijson`
+  straight from the socket, and subtrees outside the projection are skipped
+  during the parse instead of being materialized and thrown away.
+
+Settings `POKEAPI_JSON_STREAMING` (`ENABLED`, `MIN_BYTES`) control streaming.
+"""
+
+import json
+from typing import Any, Dict, Iterator, Tuple
+
+from django.conf import settings
+
+from .projections import KEEP, PROJECTIONS, Spec, projection_for
+
+try:  # pinned in requirements.txt; degrade gracefully without it
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+try:  # pinned in requirements.txt; degrade gracefully without it
+    import ijson
+except ImportError:  # pragma: no cover - depends on the environment
+    ijson = None
+
+
+STREAMING_DEFAULTS: Dict[str, Any] = {
+    "ENABLED": True,
+    "MIN_BYTES": 256 * 1024,  # smaller (or unknown-size) bodies are decoded in one go
+}
+
+BACKEND = "orjson" if orjson is not None else "json"
+
+
+def loads(data: bytes | str) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(payload: Any) -> bytes:
+    """Compact UTF-8 JSON."""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def _streaming_conf() -> Dict[str, Any]:
+    return {**STREAMING_DEFAULTS, **getattr(settings, "POKEAPI_JSON_STREAMING", {})}
+
+
+def _should_stream(r, url: str, full: bool) -> bool:
+    if ijson is None or full or getattr(r, "raw", None) is None:
+        return False
+    conf = _streaming_conf()
+    if not conf["ENABLED"] or projection_for(url) is None:
+        return False
+    try:
+        size = int(r.headers.get("Content-Length", ""))
+    except ValueError:
+        return False
+    return size >= int(conf["MIN_BYTES"])
+
+
+def decode_response(r, url: str, *, full: bool = False) -> Any:
+    """
+    Decode the JSON body of `r` (a `requests.Response` opened with
+    `stream=True`). When streamed, the result is already projected.
+    """
+    return decode_response_sized(r, url, full=full)[0]
+
+
+def decode_response_sized(r, url: str, *, full: bool = False) -> Tuple[Any, int]:
+    """`decode_response`, plus the number of (decompressed) body bytes parsed."""
+    if not _should_stream(r, url, full):
+        body = r.content
+        return loads(body), len(body)
+
+    r.raw.decode_content = True  # let urllib3 undo gzip/deflate
+    fp = _CountingReader(r.raw)
+    try:
+        return stream_project(fp, PROJECTIONS[projection_for(url)]), fp.count
+    finally:
+        r.close()
+
+
+# ---------- streaming ----------
+_Event = Tuple[str, Any]
+
+
+class _CountingReader:
+    """File-like wrapper counting the bytes read through it."""
+
+    def __init__(self, fp) -> None:
+        self.fp = fp
+        self.count = 0
+
+    def read(self, n: int = -1) -> bytes:
+        data = self.fp.read(n)
+        self.count += len(data)
+        return data
+
+
+def stream_project(fp, spec: Spec) -> Any:
+    """Parse JSON from the file-like `fp`, keeping only what `spec` selects."""
+    events = ijson.basic_parse(fp, use_float=True)
+    event, value = next(events)
+    return _build(events, event, value, spec)
+
+
+def _build(events: Iterator[_Event], event: str, value: Any, spec: Spec) -> Any:
+    """Materialize the value starting at (`event`, `value`) under `spec`."""
+    if event == "start_map":
+        obj: Dict[str, Any] = {}
+        for ev, key in events:
+            if ev == "end_map":
+                return obj
+            ev, val = next(events)  # ev was "map_key"
+            if spec is KEEP:
+                obj[key] = _build(events, ev, val, KEEP)
+            elif key in spec:
+                obj[key] = _build(events, ev, val, spec[key])
+            else:
+                _skip(events, ev)
+        return obj
+    if event == "start_array":
+        items = []
+        for ev, val in events:
+            if ev == "end_array":
+                return items
+            items.append(_build(events, ev, val, spec))
+        return items
+    return value
+
+
+def _skip(events: Iterator[_Event], event: str) -> None:
+    """Consume the value starting at `event` without building it."""
+    if event not in ("start_map", "start_array"):
+        return
+    depth = 1
+    for ev, _ in events:
+        if ev in ("start_map", "start_array"):
+            depth += 1
+        elif ev in ("end_map", "end_array"):
+            depth -= 1
+            if depth == 0:
+                return
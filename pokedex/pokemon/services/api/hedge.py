@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import threading
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from concurrent.futures import TimeoutError as FutureTimeout
+from typing import Any, Callable, Deque, Dict, Optional
+
+from django.conf import settings
+
+
+HEDGING_DEFAULTS: Dict[str, Any] = {
+    "ENABLED": False,  # default for `get_json(hedge=None)`; interactive callers opt in per call
+    "PERCENTILE": 95.0,  # hedge once a request is slower than this share of recent ones
+    "MIN_DELAY": 0.05,  # seconds; floor for the hedge delay
+    "MAX_DELAY": 2.0,  # seconds; ceiling (and the delay until enough samples exist)
+    "WINDOW": 200,  # recent latencies kept
+    "MIN_SAMPLES": 20,  # samples needed before the percentile is trusted
+    "WORKERS": 8,  # threads running hedged requests
+}
+
+
+class LatencyTracker:
+    """Sliding window of recent upstream latencies (seconds)."""
+
+    def __init__(self, window: int) -> None:
+        self._samples: Deque[float] = deque(maxlen=max(1, int(window)))
+        self._lock = threading.Lock()
+
+    def observe(self, seconds: float) -> None:
+        with self._lock:
+            self._samples.append(seconds)
+
+    def percentile(self, pct: float) -> Optional[float]:
+        """Nearest-rank percentile of the window; None without samples."""
+        with self._lock:
+            samples = sorted(self._samples)
+        if not samples:
+            return None
+        rank = min(len(samples) - 1, max(0, int(round(pct / 100.0 * len(samples))) - 1))
+        return samples[rank]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._samples)
+
+
+class Hedger:
+    """
+    Issues a second, identical request when the first one is slow.
+
+    `call(fn)` runs `fn` (one upstream request returning a response) in a
+    worker thread. If it hasn't finished after `delay()` — the `percentile`
+    of recent latencies, clamped to [`min_delay`, `max_delay`] — `fn` is
+    started a second time and the first successful response wins. The loser
+    is cancelled if it hasn't started yet; otherwise its response is closed
+    as soon as it arrives (an in-flight HTTP request can't be aborted).
+
+    Counters
+    --------
+    calls      : hedgeable requests
+    hedged     : hedges fired (second request issued)
+    hedge_wins : hedges whose response arrived first
+    """
+
+    def __init__(
+        self,
+        percentile: float,
+        min_delay: float,
+        max_delay: float,
+        window: int,
+        min_samples: int,
+        workers: int,
+    ) -> None:
+        self.percentile = float(percentile)
+        self.min_delay = float(min_delay)
+        self.max_delay = float(max_delay)
+        self.min_samples = int(min_samples)
+        self.workers = max(2, int(workers))
+        self.latency = LatencyTracker(window)
+        self._lock = threading.Lock()
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self.calls = self.hedged = self.hedge_wins = 0
+
+    # ---------- public API ----------
+    def observe(self, seconds: float) -> None:
+        """Record the latency of any upstream request (hedged or not)."""
+        self.latency.observe(seconds)
+
+    def delay(self) -> float:
+        """Seconds to wait for the first response before hedging."""
+        p = self.latency.percentile(self.percentile) if len(self.latency) >= self.min_samples else None
+        return self.max_delay if p is None else min(self.max_delay, max(self.min_delay, p))
+
+    def call(self, fn: Callable[[], Any]) -> Any:
+        pool = self._executor()
+        with self._lock:
+            self.calls += 1
+        first = pool.submit(fn)
+        try:
+            return first.result(timeout=self.delay())
+        except FutureTimeout:
+            pass
+
+        with self._lock:
+            self.hedged += 1
+        second = pool.submit(fn)
+        pending = {first, second}
+        error: Optional[BaseException] = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for fut in (f for f in (first, second) if f in done):
+                if fut.exception() is not None:
+                    error = error or fut.exception()
+                    continue
+                for loser in pending:
+                    _discard(loser)
+                if fut is second:
+                    with self._lock:
+                        self.hedge_wins += 1
+                return fut.result()
+        raise error
+
+    def stats(self) -> Dict[str, Any]:
+        p = self.latency.percentile(self.percentile)
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "hedged": self.hedged,
+                "hedge_wins": self.hedge_wins,
+                "hedge_rate": round(self.hedged / self.calls, 4) if self.calls else 0.0,
+                "delay_ms": round(self.delay() * 1000, 1),
+                f"p{self.percentile:g}_ms": None if p is None else round(p * 1000, 1),
+            }
+
+    # ---------- internals ----------
+    def _executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="pokeapi-hedge")
+            return self._pool
+
+
+def _discard(fut: Future) -> None:
+    """Cancel a losing request, or close its response once it arrives."""
+    if fut.cancel():
+        return
+
+    def _close(f: Future) -> None:
+        if not f.cancelled() and f.exception() is None:
+            f.result().close()
+
+    fut.add_done_callback(_close)
+
+
+def hedging_conf() -> Dict[str, Any]:
+    return {**HEDGING_DEFAULTS, **getattr(settings, "POKEAPI_HEDGING", {})}
+
+
+def hedging_enabled(hedge: Optional[bool] = None) -> bool:
+    """`hedge` per call, or the settings default when None."""
+    return bool(hedging_conf()["ENABLED"]) if hedge is None else hedge
+
+
+def _build_from_settings() -> Hedger:
+    conf = hedging_conf()
+    return Hedger(
+        percentile=float(conf["PERCENTILE"]),
+        min_delay=float(conf["MIN_DELAY"]),
+        max_delay=float(conf["MAX_DELAY"]),
+        window=int(conf["WINDOW"]),
+        min_samples=int(conf["MIN_SAMPLES"]),
+        workers=int(conf["WORKERS"]),
+    )
+
+
+hedger = _build_from_settings()
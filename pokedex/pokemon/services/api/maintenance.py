@@ -0,0 +1,162 @@
+from __future__ import annotations
+"""
+Housekeeping for the persistent PokeAPI cache (`ApiResourceCache`).
+
+- `cache_report`      : rows / stored bytes / expired rows per resource type
+- `evict_expired`     : delete rows expired longer than a grace period
+- `evict_oversized`   : delete rows whose stored payload exceeds a size cap
+- `evict_to_budget`   : delete least recently used rows until the total fits
+- `optimize_database` : ANALYZE (and VACUUM on SQLite) after large deletes
+
+Sizes are measured in the database (length of the JSON text plus the
+compressed body), so no payload is loaded into Python. Every step can be
+limited to one resource type (the indexed `resource` column).
+
+A dry run deletes nothing, so later steps would see (and count again) the
+rows earlier steps picked; pass the same `selected` set to every step to
+skip those, as a real run would.
+"""
+
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from django.conf import settings
+from django.db import connection
+from django.db.models import Count, F, IntegerField, Q, QuerySet, Sum, TextField, Value
+from django.db.models.functions import Cast, Coalesce, Length
+
+from pokemon.models import ApiResourceCache
+from . import cache as _cache
+from .memory import memory_cache
+from .policies import ttl_for_resource
+
+
+MAINTENANCE_DEFAULTS: Dict[str, Any] = {
+    "EXPIRED_GRACE": 30 * 24 * 3600,  # seconds
+    "MAX_ENTRY_BYTES": 2 * 1024 * 1024,
+    "MAX_TOTAL_BYTES": 256 * 1024 * 1024,
+}
+
+DELETE_BATCH = 500
+
+
+@dataclass
+class ResourceStats:
+    resource: str
+    rows: int = 0
+    bytes: int = 0
+    expired: int = 0
+    ttl: Optional[timedelta] = None  # TTL policy of the resource type
+
+
+def maintenance_conf() -> Dict[str, Any]:
+    return {**MAINTENANCE_DEFAULTS, **getattr(settings, "POKEAPI_CACHE_MAINTENANCE", {})}
+
+
+def _rows(resource: Optional[str] = None) -> QuerySet:
+    qs = ApiResourceCache.objects.all()
+    return qs if resource is None else qs.filter(resource=resource)
+
+
+def with_size(qs: QuerySet | None = None) -> QuerySet:
+    """Annotate `stored_bytes` (JSON text length + compressed body length)."""
+    qs = ApiResourceCache.objects.all() if qs is None else qs
+    zero = Value(0, output_field=IntegerField())
+    return qs.annotate(
+        stored_bytes=Coalesce(Length(Cast("payload", TextField())), zero)
+        + Coalesce(Length("body"), zero)
+    )
+
+
+def cache_report(resource: Optional[str] = None) -> List[ResourceStats]:
+    """Per-resource statistics (one GROUP BY query), largest resources first."""
+    now = _cache._now()
+    grouped = (
+        with_size(_rows(resource))
+        .values("resource")
+        .annotate(
+            n=Count("pk"),
+            size=Sum("stored_bytes"),
+            n_expired=Count("pk", filter=Q(expires_at__lte=now)),
+        )
+        .order_by()
+    )
+    stats = [
+        ResourceStats(g["resource"], g["n"], g["size"] or 0, g["n_expired"], ttl_for_resource(g["resource"]))
+        for g in grouped
+    ]
+    return sorted(stats, key=lambda s: s.bytes, reverse=True)
+
+
+def _unselected(rows: Iterable[tuple], selected: Optional[Set[int]]) -> List[tuple]:
+    """`rows` (pk first) without those an earlier step already picked."""
+    return [r for r in rows if r[0] not in selected] if selected else list(rows)
+
+
+def _delete(rows: Iterable[tuple], dry_run: bool, selected: Optional[Set[int]] = None) -> int:
+    """
+    Delete `(pk, url)` pairs in batches and drop them from the memory cache.
+    Pairs in `selected` are skipped; the rest are added to it.
+    """
+    rows = _unselected(rows, selected)
+    if selected is not None:
+        selected.update(pk for pk, _ in rows)
+    if dry_run:
+        return len(rows)
+    for start in range(0, len(rows), DELETE_BATCH):
+        batch = rows[start:start + DELETE_BATCH]
+        ApiResourceCache.objects.filter(pk__in=[pk for pk, _ in batch]).delete()
+        for _, url in batch:
+            memory_cache.delete(url)
+    return len(rows)
+
+
+def evict_expired(grace: timedelta, *, resource: Optional[str] = None, dry_run: bool = False,
+                  selected: Optional[Set[int]] = None) -> int:
+    """Delete rows that expired more than `grace` ago."""
+    cutoff = _cache._now() - grace
+    qs = _rows(resource).filter(expires_at__lt=cutoff)
+    return _delete(qs.values_list("pk", "url"), dry_run, selected)
+
+
+def evict_oversized(max_bytes: int, *, resource: Optional[str] = None, dry_run: bool = False,
+                    selected: Optional[Set[int]] = None) -> int:
+    """Delete rows whose stored payload is larger than `max_bytes`."""
+    qs = with_size(_rows(resource)).filter(stored_bytes__gt=max_bytes)
+    return _delete(qs.values_list("pk", "url"), dry_run, selected)
+
+
+def evict_to_budget(max_total_bytes: int, *, resource: Optional[str] = None, dry_run: bool = False,
+                    selected: Optional[Set[int]] = None) -> int:
+    """
+    Delete least recently used rows until all payloads (of `resource`, if
+    given) fit `max_total_bytes`; rows in `selected` count as gone already.
+
+    Rows are ordered by `accessed_at` (never-read rows first), then by
+    `fetched_at`.
+    """
+    sizes = with_size(_rows(resource)).order_by(
+        F("accessed_at").asc(nulls_first=True), "fetched_at", "pk"
+    ).values_list("pk", "url", "stored_bytes")
+    rows = _unselected(sizes, selected)
+    total = sum(size or 0 for _, _, size in rows)
+
+    victims: List[tuple] = []
+    for pk, url, size in rows:
+        if total <= max_total_bytes:
+            break
+        victims.append((pk, url))
+        total -= size or 0
+    return _delete(victims, dry_run, selected)
+
+
+def optimize_database(*, vacuum: bool = True) -> List[str]:
+    """Refresh planner statistics; on SQLite also VACUUM to shrink the file."""
+    statements = ["ANALYZE"]
+    if vacuum and connection.vendor == "sqlite":
+        statements.append("VACUUM")
+    with connection.cursor() as cursor:
+        for sql in statements:
+            cursor.execute(sql)
+    return statements
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Any, Dict, NamedTuple, Optional
+
+from django.conf import settings
+
+from . import cache as _cache
+from .decoding import dumps
+
+
+MEMORY_CACHE_DEFAULTS: Dict[str, Any] = {
+    "ENABLED": True,
+    "MAX_ENTRIES": 2048,
+    "MAX_BYTES": 32 * 1024 * 1024,  # 32 MiB of serialized JSON
+    "TTL": 300,  # seconds; an entry never outlives its DB row's `expires_at`
+}
+
+
+class _Entry(NamedTuple):
+    payload: Any
+    size: int
+    expires_at: datetime
+
+
+def _sizeof(payload: Any) -> int:
+    """Approximate the footprint of a payload by its compact JSON length (encodes it)."""
+    return len(dumps(payload))
+
+
+class MemoryCache:
+    """
+    Bounded, thread-safe in-process LRU cache for decoded API payloads.
+
+    Sits in front of `ApiResourceCache` so hot URLs are served without a DB
+    round trip or JSON decode. Entries expire after `ttl` or at the DB row's
+    `expires_at`, whichever comes first. Both the number of entries and the
+    total serialized size are bounded; least recently used entries go first.
+
+    Payloads are shared between callers and must be treated as read-only.
+    """
+
+    def __init__(self, *, max_entries: int, max_bytes: int, ttl: timedelta, enabled: bool = True):
+        self.enabled = enabled
+        self.max_entries = max(0, max_entries)
+        self.max_bytes = max(0, max_bytes)
+        self.ttl = ttl
+
+        self._data: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached payload for `key`, or None on miss/expiry."""
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            if entry.expires_at <= _cache._now():
+                self._pop(key)
+                self.misses += 1
+                return None
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry.payload
+
+    def set(
+        self,
+        key: str,
+        payload: Any,
+        expires_at: Optional[datetime] = None,
+        size: Optional[int] = None,
+    ) -> None:
+        """
+        Store `payload` under `key`.
+
+        `expires_at` is the DB row's expiry; the entry is dropped at that time
+        or after the local TTL, whichever is earlier. Payloads larger than the
+        whole byte budget are not cached.
+
+        `size` is the payload's JSON size when the caller already knows it
+        (see `cache.payload_size`); only without it is the payload encoded to
+        measure it.
+        """
+        if not self.enabled or self.max_entries == 0:
+            return
+
+        size = _sizeof(payload) if size is None else size
+        if size > self.max_bytes:
+            self.delete(key)
+            return
+
+        local_expiry = _cache._now() + self.ttl
+        if expires_at is None or expires_at > local_expiry:
+            expires_at = local_expiry
+
+        with self._lock:
+            self._pop(key)
+            self._data[key] = _Entry(payload, size, expires_at)
+            self._bytes += size
+            self._shrink()
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._pop(key)
+
+    def clear(self) -> None:
+        """Drop all entries and reset counters."""
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Snapshot of size and hit/miss counters (e.g. for logging)."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._data),
+                "bytes": self._bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": (self.hits / lookups) if lookups else 0.0,
+            }
+
+    # ---------- internals (caller holds the lock) ----------
+    def _pop(self, key: str) -> None:
+        entry = self._data.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry.size
+
+    def _shrink(self) -> None:
+        while self._data and (len(self._data) > self.max_entries or self._bytes > self.max_bytes):
+            _, entry = self._data.popitem(last=False)
+            self._bytes -= entry.size
+            self.evictions += 1
+
+
+def _build_from_settings() -> MemoryCache:
+    conf = {**MEMORY_CACHE_DEFAULTS, **getattr(settings, "POKEAPI_MEMORY_CACHE", {})}
+    return MemoryCache(
+        max_entries=int(conf["MAX_ENTRIES"]),
+        max_bytes=int(conf["MAX_BYTES"]),
+        ttl=timedelta(seconds=float(conf["TTL"])),
+        enabled=bool(conf["ENABLED"]),
+    )
+
+
+memory_cache = _build_from_settings()
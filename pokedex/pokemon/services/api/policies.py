@@ -0,0 +1,58 @@
+from __future__ import annotations
+"""
+Per-resource TTL policies for cached PokeAPI payloads.
+
+Reference data (types, generations, evolution chains, …) practically never
+changes, so it is revalidated rarely; index pages change when new entries are
+added, so they expire sooner than the details they list. A policy is looked up
+by the resource type of the URL (`urls.resource_of`):
+
+1. the exact resource ("pokemon", "pokemon:encounters", "type:index"),
+2. a wildcard for its kind ("*:index", "*:encounters"),
+3. `DEFAULT_TTL`.
+
+Settings `POKEAPI_TTL_POLICIES` maps resources to seconds and extends/overrides
+`TTL_POLICY_DEFAULTS`.
+"""
+
+from datetime import timedelta
+from typing import Dict
+
+from django.conf import settings
+
+from .urls import resource_of
+
+DEFAULT_TTL = timedelta(hours=24)
+
+_DAY = 24 * 3600
+
+TTL_POLICY_DEFAULTS: Dict[str, float] = {
+    "type": 30 * _DAY,
+    "generation": 30 * _DAY,
+    "version-group": 30 * _DAY,
+    "evolution-chain": 30 * _DAY,
+    "ability": 7 * _DAY,
+    "move": 7 * _DAY,
+    "pokemon-species": 7 * _DAY,
+    "pokemon": 1 * _DAY,
+    "*:encounters": 7 * _DAY,
+    "*:index": 6 * 3600,
+}
+
+
+def ttl_policies() -> Dict[str, float]:
+    return {**TTL_POLICY_DEFAULTS, **getattr(settings, "POKEAPI_TTL_POLICIES", {})}
+
+
+def ttl_for_resource(resource: str) -> timedelta:
+    """TTL of the policy for a resource type (see module docstring), else `DEFAULT_TTL`."""
+    policies = ttl_policies()
+    seconds = policies.get(resource)
+    if seconds is None and ":" in resource:
+        seconds = policies.get("*:" + resource.split(":", 1)[1])
+    return DEFAULT_TTL if seconds is None else timedelta(seconds=float(seconds))
+
+
+def ttl_for(url: str) -> timedelta:
+    """TTL of the policy matching `url`'s resource type."""
+    return ttl_for_resource(resource_of(url))
@@ -0,0 +1,121 @@
+from __future__ import annotations
+"""
+Speculative prefetch of resources linked from a freshly fetched payload.
+
+A detail page walks pokemon → species → evolution chain / encounters / moves,
+each URL only known once the previous payload has arrived. With prefetching
+enabled, a payload fetched from upstream immediately queues background
+fetches of the URLs its `PREFETCH_RULES` point at, so the page's next lookups
+are cache hits.
+
+A rule maps a resource pattern (as in `projections`) to dotted paths of URL
+fields; a path crossing a list follows every item:
+
+    "pokemon/*": ["species.url", "moves.move.url"]
+
+Linked URLs must survive the projection of their payload (see
+`projections.PROJECTIONS`).
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set
+
+from django.conf import settings
+from django.db import connections
+
+from .projections import _matches
+from .urls import canonical_url, resource_path
+
+
+PREFETCH_DEFAULTS: Dict[str, Any] = {
+    "ENABLED": False,
+    "WORKERS": 4,  # background fetch threads
+    "MAX_URLS": 24,  # linked URLs queued per payload (rules are followed in order)
+}
+
+PREFETCH_RULES: Dict[str, List[str]] = {
+    "pokemon/*": ["species.url", "location_area_encounters", "moves.move.url"],
+    "pokemon-species/*": ["evolution_chain.url"],
+}
+
+_lock = threading.Lock()
+_pending: Set[str] = set()
+_pool: Optional[ThreadPoolExecutor] = None
+_counters = {"scheduled": 0, "failed": 0}
+
+
+def _conf() -> Dict[str, Any]:
+    return {**PREFETCH_DEFAULTS, **getattr(settings, "POKEAPI_PREFETCH", {})}
+
+
+def _executor() -> ThreadPoolExecutor:
+    global _pool
+    if _pool is None:
+        _pool = ThreadPoolExecutor(max_workers=int(_conf()["WORKERS"]), thread_name_prefix="pokeapi-prefetch")
+    return _pool
+
+
+def _walk(value: Any, keys: List[str]) -> Iterator[Any]:
+    if isinstance(value, list):
+        for item in value:
+            yield from _walk(item, keys)
+    elif not keys:
+        yield value
+    elif isinstance(value, dict) and keys[0] in value:
+        yield from _walk(value[keys[0]], keys[1:])
+
+
+def linked_urls(url: str, payload: Any, limit: Optional[int] = None) -> List[str]:
+    """
+    Return the canonical URLs the prefetch rules find in `payload` (fetched
+    from `url`), in rule order, without duplicates, at most `limit` of them.
+    """
+    path = resource_path(url)
+    paths = next((p for pattern, p in PREFETCH_RULES.items() if _matches(pattern, path)), [])
+    found: Dict[str, None] = {}
+    for dotted in paths:
+        for value in _walk(payload, dotted.split(".")):
+            if isinstance(value, str) and value.startswith(("http://", "https://")):
+                found[canonical_url(value)] = None
+    return list(found)[:limit]
+
+
+def schedule_prefetch(url: str, payload: Any, fetch: Callable[[str], Any]) -> int:
+    """
+    Queue `fetch(u)` in background threads for the URLs linked from `payload`.
+
+    Does nothing unless settings `POKEAPI_PREFETCH["ENABLED"]` is set. A URL
+    already queued is not queued again; `fetch` is expected to be a cached
+    lookup (a fresh entry makes it cheap). Returns the number of URLs queued.
+    """
+    conf = _conf()
+    if not conf["ENABLED"]:
+        return 0
+    urls = [u for u in linked_urls(url, payload, int(conf["MAX_URLS"])) if u != url]
+    with _lock:
+        urls = [u for u in urls if u not in _pending]
+        _pending.update(urls)
+        _counters["scheduled"] += len(urls)
+        pool = _executor() if urls else None
+
+    def _run(u: str) -> None:
+        try:
+            fetch(u)
+        except Exception:  # noqa: BLE001 — speculative; the real lookup will retry
+            with _lock:
+                _counters["failed"] += 1
+        finally:
+            with _lock:
+                _pending.discard(u)
+            connections.close_all()
+
+    for u in urls:
+        pool.submit(_run, u)
+    return len(urls)
+
+
+def prefetch_stats() -> Dict[str, int]:
+    """Counters for queued/failed prefetches."""
+    with _lock:
+        return {**_counters, "pending": len(_pending)}
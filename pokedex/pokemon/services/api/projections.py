@@ -0,0 +1,110 @@
+from __future__ import annotations
+"""
+Declarative per-resource projections for cached PokeAPI payloads.
+
+Only the fields the app actually reads are stored. A projection spec maps a
+key either to `KEEP` (keep the whole subtree) or to a nested spec; a nested
+spec applied to a list is applied to each of its items.
+
+Keep these in sync with the readers:
+- pokemon/*         : cache/pokemon/normalize.py, cache/pokemon/upsert.py,
+                      detail/moves/iterators.py
+- pokemon-species/* : detail/species.py, detail/flavor.py,
+                      cache/pokemon/upsert.py, cache/evo/lookup.py
+- move/*            : detail/moves/annotate.py
+- linked URLs       : prefetch.py (PREFETCH_RULES)
+"""
+
+from typing import Any, Dict, Optional, Union
+
+from django.conf import settings
+
+from .urls import resource_path
+
+KEEP = True
+
+Spec = Union[bool, Dict[str, Any]]
+
+_NAME = {"name": KEEP}
+_NAMED_REF = {"name": KEEP, "url": KEEP}
+
+PROJECTIONS: Dict[str, Spec] = {
+    "pokemon/*": {
+        "id": KEEP,
+        "name": KEEP,
+        "height": KEEP,
+        "weight": KEEP,
+        "species": KEEP,
+        "location_area_encounters": KEEP,
+        "stats": {"base_stat": KEEP, "stat": _NAME},
+        "types": {"slot": KEEP, "type": _NAMED_REF},
+        "abilities": {"slot": KEEP, "is_hidden": KEEP, "ability": _NAMED_REF},
+        "moves": {
+            "move": _NAMED_REF,
+            "version_group_details": {
+                "level_learned_at": KEEP,
+                "move_learn_method": _NAME,
+                "version_group": _NAME,
+            },
+        },
+    },
+    "pokemon-species/*": {
+        "id": KEEP,
+        "name": KEEP,
+        "is_legendary": KEEP,
+        "is_mythical": KEEP,
+        "capture_rate": KEEP,
+        "base_happiness": KEEP,
+        "gender_rate": KEEP,
+        "generation": _NAMED_REF,
+        "evolution_chain": KEEP,
+        "growth_rate": _NAME,
+        "color": _NAME,
+        "shape": _NAME,
+        "habitat": _NAME,
+        "egg_groups": _NAME,
+        "genera": {"genus": KEEP, "language": _NAME},
+        "flavor_text_entries": {"flavor_text": KEEP, "language": _NAME, "version": _NAME},
+        "varieties": {"is_default": KEEP, "pokemon": _NAMED_REF},
+    },
+    "move/*": {
+        "id": KEEP,
+        "name": KEEP,
+        "power": KEEP,
+        "accuracy": KEEP,
+        "pp": KEEP,
+        "type": _NAMED_REF,
+        "damage_class": _NAMED_REF,
+    },
+}
+
+
+def _matches(pattern: str, path: str) -> bool:
+    """Segment-wise match; `*` matches exactly one path segment."""
+    p_parts = pattern.split("/")
+    parts = path.split("/")
+    return len(p_parts) == len(parts) and all(p in ("*", s) for p, s in zip(p_parts, parts))
+
+
+def projection_for(url: str) -> Optional[str]:
+    """Return the PROJECTIONS key that applies to `url`, or None to keep everything."""
+    if not getattr(settings, "POKEAPI_CACHE_PROJECTIONS", True):
+        return None
+    path = resource_path(url)
+    return next((pattern for pattern in PROJECTIONS if _matches(pattern, path)), None)
+
+
+def _project(value: Any, spec: Spec) -> Any:
+    if spec is KEEP:
+        return value
+    if isinstance(value, list):
+        return [_project(v, spec) for v in value]
+    if isinstance(value, dict):
+        return {k: _project(value[k], sub) for k, sub in spec.items() if k in value}
+    return value
+
+
+def project(url: str, payload: Any) -> Any:
+    """Apply the projection registered for `url` (if any) to `payload`."""
+    pattern = projection_for(url)
+    return payload if pattern is None else _project(payload, PROJECTIONS[pattern])
@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Iterator, Mapping, Optional
+
+from django.conf import settings
+
+try:  # POSIX only; without it the limiter is per-process
+    import fcntl
+except ImportError:  # pragma: no cover - depends on the platform
+    fcntl = None
+
+
+RATE_LIMIT_DEFAULTS: Dict[str, Any] = {
+    "ENABLED": True,
+    "RATE": 20.0,  # sustained requests per second (all threads/processes together)
+    "BURST": 20,  # requests allowed back-to-back after an idle period
+    "LEASE_FILE": None,  # path of a state file shared by processes (None → this process only)
+    "DEFAULT_RETRY_AFTER": 5.0,  # seconds to pause on a 429 without Retry-After
+    "MAX_RETRY_AFTER": 120.0,  # cap for server-provided delays
+    "SLOWDOWN": 60.0,  # seconds at half rate after a 429
+    "RETRIES_429": 3,  # times one request is retried after a 429/503
+}
+
+_clock = time.time
+_sleep = time.sleep
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a `Retry-After` header (delta-seconds or HTTP-date) into seconds.
+    Returns None if missing or malformed.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, when.timestamp() - datetime.now(timezone.utc).timestamp())
+
+
+class RateLimiter:
+    """
+    Token-bucket limiter for outbound requests, shared by all threads and,
+    with `lease_file`, by all processes using the same file.
+
+    Implemented as a GCRA (virtual scheduling): the whole state is the
+    theoretical arrival time of the next request plus the penalty windows, so
+    it fits in a small JSON file guarded by `fcntl.flock`. Callers reserve
+    a send slot under the lock and sleep outside of it.
+
+    `penalize(seconds)` is called on 429/Retry-After: nobody sends before the
+    delay has passed, and the rate is halved for `slowdown` seconds after.
+
+    Counters
+    --------
+    acquired  : requests let through
+    waited    : total seconds callers slept
+    penalties : 429/Retry-After signals received
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int,
+        *,
+        lease_file: Optional[str] = None,
+        slowdown: float = 60.0,
+        enabled: bool = True,
+    ) -> None:
+        self.rate = float(rate)
+        self.burst = max(1, int(burst))
+        self.lease_file = lease_file if fcntl is not None else None
+        self.slowdown = float(slowdown)
+        self.enabled = enabled and self.rate > 0
+        self._lock = threading.Lock()
+        self._state = {"tat": 0.0, "blocked_until": 0.0, "slow_until": 0.0}
+        self.acquired = 0
+        self.waited = 0.0
+        self.penalties = 0
+
+    # ---------- public API ----------
+    def reserve(self) -> float:
+        """
+        Take the next send slot without waiting for it. Returns the seconds
+        the caller must wait before sending (callers that can't block a thread,
+        e.g. the asyncio client, sleep on their own).
+        """
+        if not self.enabled:
+            return 0.0
+        with self._shared_state() as state:
+            now = _clock()
+            interval = 1.0 / self.rate
+            if now < state["slow_until"]:
+                interval *= 2
+            tolerance = (self.burst - 1) * interval
+
+            tat = max(state["tat"], now)
+            send_at = max(now, tat - tolerance, state["blocked_until"])
+            state["tat"] = max(tat, send_at) + interval
+
+        delay = max(0.0, send_at - now)
+        with self._lock:
+            self.acquired += 1
+            self.waited += delay
+        return delay
+
+    def acquire(self) -> float:
+        """Block until a request may be sent. Returns the seconds waited."""
+        delay = self.reserve()
+        if delay > 0:
+            _sleep(delay)
+        return delay
+
+    def penalize(self, seconds: float) -> None:
+        """Pause all senders for `seconds`, then run at half rate for a while."""
+        if not self.enabled:
+            return
+        with self._shared_state() as state:
+            until = _clock() + max(0.0, seconds)
+            state["blocked_until"] = max(state["blocked_until"], until)
+            state["slow_until"] = max(state["slow_until"], until + self.slowdown)
+        with self._lock:
+            self.penalties += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "rate": self.rate,
+                "burst": self.burst,
+                "acquired": self.acquired,
+                "waited": round(self.waited, 3),
+                "penalties": self.penalties,
+                "shared": self.lease_file is not None,
+            }
+
+    # ---------- internals ----------
+    @contextmanager
+    def _shared_state(self) -> Iterator[Dict[str, float]]:
+        """Yield the limiter state under the thread lock (and the file lease)."""
+        with self._lock:
+            if self.lease_file is None:
+                yield self._state
+                return
+
+            fd = os.open(self.lease_file, os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+                raw = os.read(fd, 4096)
+                try:
+                    state = {**self._state, **json.loads(raw)} if raw else dict(self._state)
+                except ValueError:
+                    state = dict(self._state)
+                yield state
+                data = json.dumps(state).encode()
+                os.lseek(fd, 0, os.SEEK_SET)
+                os.ftruncate(fd, 0)
+                os.write(fd, data)
+            finally:
+                os.close(fd)  # releases the flock
+
+
+def rate_limit_conf() -> Dict[str, Any]:
+    return {**RATE_LIMIT_DEFAULTS, **getattr(settings, "POKEAPI_RATE_LIMIT", {})}
+
+
+def retry_delay(headers: Mapping[str, str], conf: Optional[Dict[str, Any]] = None) -> float:
+    """Seconds to back off for a throttled response (Retry-After, else the default)."""
+    conf = conf or rate_limit_conf()
+    delay = parse_retry_after(headers.get("Retry-After"))
+    if delay is None:
+        delay = float(conf["DEFAULT_RETRY_AFTER"])
+    return min(delay, float(conf["MAX_RETRY_AFTER"]))
+
+
+def _build_from_settings() -> RateLimiter:
+    conf = rate_limit_conf()
+    return RateLimiter(
+        rate=float(conf["RATE"]),
+        burst=int(conf["BURST"]),
+        lease_file=conf["LEASE_FILE"],
+        slowdown=float(conf["SLOWDOWN"]),
+        enabled=bool(conf["ENABLED"]),
+    )
+
+
+rate_limiter = _build_from_settings()
@@ -0,0 +1,57 @@
+from __future__ import annotations
+"""
+Bulk revalidation of expired API cache entries.
+
+Instead of waiting for a request to touch each expired row, walk them via the
+`expires_at` index and send conditional GETs (If-None-Match /
+If-Modified-Since) concurrently. All 304s of a batch are applied with one
+bulk UPDATE; 200s replace the payload as in `get_json`.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from typing import Callable, Dict, Optional
+
+from . import cache as _cache
+from .backends import get_backend
+from .client import DEFAULT_TIMEOUT, revalidate_entries
+
+
+def revalidate_expired(
+    *,
+    ahead: timedelta = timedelta(0),
+    ttl: Optional[timedelta] = None,
+    timeout: float = DEFAULT_TIMEOUT,
+    workers: int = 8,
+    batch_size: int = 200,
+    limit: Optional[int] = None,
+    progress: Optional[Callable[[Dict[str, int]], None]] = None,
+) -> Dict[str, int]:
+    """
+    Revalidate rows that are expired (or expire within `ahead`).
+
+    Entries are extended by `ttl`, by default by the TTL policy of their
+    resource type. Negative (404/410) entries are left to expire lazily.
+    Needs a backend that can list entries by expiry (`can_enumerate`: db, files).
+
+    Returns
+    -------
+    dict: {"checked", "not_modified", "modified", "errors"}
+    """
+    cutoff = _cache._now() + ahead
+    due = get_backend().entries_expiring(cutoff, limit)
+
+    stats = {"checked": 0, "not_modified": 0, "modified": 0, "errors": 0}
+    step = max(1, batch_size)
+    with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="pokeapi-revalidate") as pool:
+        for start in range(0, len(due), step):
+            rows = list(_cache.load_rows(due[start:start + step]).values())
+            done = revalidate_entries(rows, ttl=ttl, timeout=timeout, pool=pool)
+            stats["checked"] += len(rows)
+            stats["not_modified"] += done.not_modified
+            stats["modified"] += done.modified
+            stats["errors"] += done.errors
+            if progress:
+                progress({**stats, "total": len(due)})
+
+    return stats
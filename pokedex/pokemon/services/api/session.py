@@ -5,6 +5,10 @@ import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+from .cassette import cassette_adapter
+
+CONNECT_RETRIES = 3  # like the async client's httpx transport, which retries only connects
+
 _tls = threading.local()
 
 
@@ -12,11 +16,18 @@ def get_session() -> requests.Session:
     """
     Return a thread-local `requests.Session` configured with:
     - Connection pooling (shared adapters for http/https).
-    - Conservative retries for common transient errors.
+    - Retries of failed connection attempts only (nothing reached PokeAPI).
+    - Record/replay of responses when settings `POKEAPI_CASSETTE` enable it
+      (see `services.api.cassette`).
 
     Notes
     -----
     `allowed_methods` must be an iterable of uppercased methods for urllib3.
+    Answers (5xx included) and read errors are not retried here: each
+    request the circuit breaker lets through must be one upstream call, so
+    it sees every failure and a failing host is not sent extra load. 429/503
+    are handled by the client through the shared rate limiter, and bulk
+    syncs retry whole items (see `services.cache.core.worker`).
     """
     s = getattr(_tls, "session", None)
 
@@ -24,13 +35,18 @@ def get_session() -> requests.Session:
         s = requests.Session()
 
         retry = Retry(
-            total=3,
+            total=None,
+            connect=CONNECT_RETRIES,
+            read=0,
+            status=0,
+            other=0,
             backoff_factor=0.2,
-            status_forcelist=(429, 500, 502, 503, 504),
             allowed_methods=frozenset({"GET", "HEAD"}),
+            respect_retry_after_header=False,
             raise_on_status=False,
         )
-        adapter = HTTPAdapter(max_retries=retry, pool_connections=50, pool_maxsize=50)
+        pooling = {"max_retries": retry, "pool_connections": 50, "pool_maxsize": 50}
+        adapter = cassette_adapter(**pooling) or HTTPAdapter(**pooling)
         s.mount("https://", adapter)
         s.mount("http://", adapter)
 
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+class _Call:
+    """One in-flight call; followers block on `event` until the leader finishes."""
+
+    def __init__(self) -> None:
+        self.event = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+    def wait(self) -> Any:
+        self.event.wait()
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent calls for the same key within a process.
+
+    The first caller for a key becomes the leader and does the work; callers
+    arriving while it runs wait and receive the leader's result (or exception).
+    Once the leader finishes, the key is released and the next call starts a
+    new flight.
+
+    Counters
+    --------
+    leaders   : calls that actually executed the work
+    coalesced : calls that waited for another caller's result
+    """
+
+    def __init__(self) -> None:
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+        self.leaders = 0
+        self.coalesced = 0
+
+    def begin(self, key: Hashable) -> Tuple[_Call, bool]:
+        """
+        Join the flight for `key`. Returns (call, is_leader).
+
+        A leader MUST eventually call `finish(key, call, ...)`; a follower
+        calls `call.wait()`.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                self.coalesced += 1
+                return call, False
+
+            call = _Call()
+            self._calls[key] = call
+            self.leaders += 1
+            return call, True
+
+    def finish(self, key: Hashable, call: _Call, result: Any = None,
+               error: Optional[BaseException] = None) -> None:
+        """Publish the leader's outcome and release `key`."""
+        with self._lock:
+            if self._calls.get(key) is call:
+                del self._calls[key]
+        call.result = result
+        call.error = error
+        call.event.set()
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """Run `fn` once per concurrent group of callers for `key`."""
+        call, leader = self.begin(key)
+        if not leader:
+            return call.wait()
+
+        try:
+            result = fn()
+        except BaseException as e:
+            self.finish(key, call, error=e)
+            raise
+
+        self.finish(key, call, result=result)
+        return result
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "leaders": self.leaders,
+                "coalesced": self.coalesced,
+                "in_flight": len(self._calls),
+            }
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self.leaders = self.coalesced = 0
+
+
+# Upstream fetches keyed by URL (shared by get_json and get_json_many).
+single_flight = SingleFlight()
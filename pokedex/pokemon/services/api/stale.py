@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from typing import Any, Callable, Dict, Optional, Set
+
+from django.conf import settings
+from django.db import connections
+
+from pokemon.models import ApiResourceCache
+from . import cache as _cache
+
+
+STALE_DEFAULTS: Dict[str, Any] = {
+    "ENABLED": False,
+    "MAX_STALE": 7 * 24 * 3600,  # seconds past `expires_at` a payload may still be served
+    "WORKERS": 2,  # background revalidation threads
+}
+
+_lock = threading.Lock()
+_pending: Set[str] = set()
+_pool: Optional[ThreadPoolExecutor] = None
+_counters = {"served_stale": 0, "scheduled": 0, "failed": 0}
+
+
+def _conf() -> Dict[str, Any]:
+    return {**STALE_DEFAULTS, **getattr(settings, "POKEAPI_STALE_WHILE_REVALIDATE", {})}
+
+
+def can_serve_stale(row: ApiResourceCache, allow_stale: Optional[bool] = None) -> bool:
+    """
+    Return True if an expired `row` may be served while it is revalidated
+    in the background.
+
+    `allow_stale` overrides the `ENABLED` setting for a single call
+    (None → use settings). Rows expired longer than `MAX_STALE` and negative
+    (404/410) entries never qualify.
+    """
+    conf = _conf()
+    enabled = conf["ENABLED"] if allow_stale is None else allow_stale
+    if not enabled or not row.expires_at or _cache.is_negative(row):
+        return False
+    return _cache._now() - row.expires_at <= timedelta(seconds=float(conf["MAX_STALE"]))
+
+
+def _executor() -> ThreadPoolExecutor:
+    global _pool
+    if _pool is None:
+        _pool = ThreadPoolExecutor(max_workers=int(_conf()["WORKERS"]), thread_name_prefix="pokeapi-swr")
+    return _pool
+
+
+def schedule_revalidation(url: str, fn: Callable[[], Any]) -> bool:
+    """
+    Run `fn` (a revalidation of `url`) in a background thread.
+
+    At most one revalidation per URL is queued at a time; returns False if
+    one is already pending. The worker closes its DB connections afterwards.
+    """
+    with _lock:
+        _counters["served_stale"] += 1
+        if url in _pending:
+            return False
+        _pending.add(url)
+        _counters["scheduled"] += 1
+        pool = _executor()
+
+    def _run() -> None:
+        try:
+            fn()
+        except Exception:  # noqa: BLE001 — the stale payload was already served
+            with _lock:
+                _counters["failed"] += 1
+        finally:
+            with _lock:
+                _pending.discard(url)
+            connections.close_all()
+
+    pool.submit(_run)
+    return True
+
+
+def stale_stats() -> Dict[str, int]:
+    """Counters for served-stale responses and background revalidations."""
+    with _lock:
+        return {**_counters, "pending": len(_pending)}
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+from typing import Any, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
 BASE = "https://pokeapi.co/api/v2"
 
 
@@ -11,4 +14,82 @@ def url(*parts: object) -> str:
     -------
     url("pokemon", 25) -> "https://pokeapi.co/api/v2/pokemon/25/"
     """
-    return "/".join([BASE.strip("/")] + [str(p).strip("/") for p in parts]) + "/"
\ No newline at end of file
+    return "/".join([BASE.strip("/")] + [str(p).strip("/") for p in parts]) + "/"
+
+
+def resource_path(full_url: str) -> str:
+    """
+    Return the resource path of a PokeAPI URL without the API prefix,
+    surrounding slashes or query string.
+
+    Example
+    -------
+    resource_path("https://pokeapi.co/api/v2/pokemon/25/") -> "pokemon/25"
+    """
+    path = urlsplit(full_url).path.strip("/")
+    prefix = urlsplit(BASE).path.strip("/") + "/"
+    return path[len(prefix):] if path.startswith(prefix) else path
+
+
+def resource_of(full_url: str) -> str:
+    """
+    Classify a PokeAPI URL by resource type (used for cache stats/policies).
+
+    Examples
+    --------
+    .../pokemon/25/            -> "pokemon"
+    .../pokemon/?limit=1       -> "pokemon:index"
+    .../pokemon/25/encounters  -> "pokemon:encounters"
+    """
+    parts = resource_path(full_url).split("/")
+    if len(parts) == 1:
+        return f"{parts[0]}:index"
+    if len(parts) > 2:
+        return f"{parts[0]}:{parts[-1]}"
+    return parts[0]
+
+
+def canonical_url(full_url: str) -> str:
+    """
+    Normalize a PokeAPI URL into the form used as cache key.
+
+    - https scheme, lowercase host, no default port, no fragment
+    - lowercase path, duplicate slashes collapsed, trailing slash
+    - query parameters sorted
+
+    Example
+    -------
+    canonical_url("http://PokeAPI.co/api/v2/pokemon?offset=0&limit=20")
+        -> "https://pokeapi.co/api/v2/pokemon/?limit=20&offset=0"
+    """
+    parts = urlsplit(full_url.strip())
+    host = (parts.hostname or urlsplit(BASE).hostname or "").lower()
+    netloc = host if parts.port in (None, 80, 443) else f"{host}:{parts.port}"
+    segments = [seg for seg in parts.path.lower().split("/") if seg]
+    path = "/" + "/".join(segments) + "/" if segments else "/"
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit(("https", netloc, path, query, ""))
+
+
+def name_base_url(full_url: str) -> Optional[str]:
+    """
+    For URLs addressing a resource by name, return the canonical URL of that
+    resource (e.g. ".../pokemon/pikachu/encounters" -> ".../pokemon/pikachu/");
+    None for ID-based and index URLs.
+    """
+    parts = resource_path(full_url).split("/")
+    if len(parts) < 2 or parts[1].isdigit():
+        return None
+    return canonical_url(url(parts[0], parts[1]))
+
+
+def id_url_for(full_url: str, payload: Any) -> Optional[str]:
+    """
+    Return the ID-based URL of a name-addressed resource, using the `id`
+    of its payload; None when `full_url` is not a name-based resource URL.
+    """
+    parts = resource_path(full_url).split("/")
+    if len(parts) != 2 or parts[1].isdigit() or not isinstance(payload, dict):
+        return None
+    pk = payload.get("id")
+    return canonical_url(url(parts[0], pk)) if isinstance(pk, int) else None
@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import atexit
+import threading
+import time
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+from django.conf import settings
+from django.db import connections, transaction
+
+from .backends import get_backend
+
+
+WRITE_BEHIND_DEFAULTS: Dict[str, Any] = {
+    "ENABLED": False,
+    "MAX_QUEUE": 1000,  # pending entries; beyond that writers persist inline
+    "BATCH_SIZE": 100,  # entries per transaction
+    "FLUSH_INTERVAL": 0.5,  # seconds the writer waits for a batch to fill up
+}
+
+
+def _conf() -> Dict[str, Any]:
+    return {**WRITE_BEHIND_DEFAULTS, **getattr(settings, "POKEAPI_WRITE_BEHIND", {})}
+
+
+class WriteBehind:
+    """
+    Background writer for cache entries.
+
+    `submit` records an entry (and the fields that changed) and returns at
+    once; a daemon thread writes pending entries in batches, one transaction
+    per batch. Pending writes for the same URL are coalesced (latest entry,
+    union of fields). Until an entry is written, `pending(url)` returns it, so
+    readers never miss a payload that is still queued.
+
+    The queue is bounded by `max_queue`: when full, `submit` writes inline.
+    `flush()` drains everything synchronously; it is registered with `atexit`.
+
+    Counters
+    --------
+    queued   : entries accepted for background writing
+    written  : entries written by `flush`/the writer thread
+    inline   : entries written synchronously because the queue was full
+    batches  : transactions committed
+    failed   : entries whose write raised (dropped; the cache refills itself)
+    """
+
+    def __init__(self, max_queue: int, batch_size: int, flush_interval: float) -> None:
+        self.max_queue = max(1, int(max_queue))
+        self.batch_size = max(1, int(batch_size))
+        self.flush_interval = float(flush_interval)
+        self._cond = threading.Condition()
+        self._pending: Dict[str, Tuple[Any, Set[str]]] = {}
+        self._inflight: Dict[str, Any] = {}
+        self._write_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self.queued = self.written = self.inline = self.batches = self.failed = 0
+
+    # ---------- public API ----------
+    def submit(self, entry: Any, fields: Sequence[str]) -> None:
+        with self._cond:
+            current = self._pending.get(entry.url)
+            if current is None and len(self._pending) >= self.max_queue:
+                self.inline += 1
+                full = True
+            else:
+                merged = set(fields) | (current[1] if current else set())
+                self._pending[entry.url] = (entry, merged)
+                self.queued += 1
+                full = False
+                self._ensure_thread()
+                if current is None and len(self._pending) in (1, self.batch_size):
+                    self._cond.notify()  # wake the writer: work arrived / a batch is full
+        if full:
+            get_backend().save(entry, fields)
+
+    def pending(self, url: str) -> Optional[Any]:
+        """The queued (not yet written) entry for `url`, if any."""
+        with self._cond:
+            item = self._pending.get(url)
+            return item[0] if item else self._inflight.get(url)
+
+    def discard(self, url: str) -> None:
+        """Forget a queued entry for `url` (it is being deleted)."""
+        with self._cond:
+            self._pending.pop(url, None)
+
+    def flush(self) -> None:
+        """Write everything pending now, in the calling thread."""
+        while self._write_batch():
+            pass
+
+    def stats(self) -> Dict[str, int]:
+        with self._cond:
+            return {
+                "pending": len(self._pending) + len(self._inflight),
+                "queued": self.queued,
+                "written": self.written,
+                "inline": self.inline,
+                "batches": self.batches,
+                "failed": self.failed,
+            }
+
+    # ---------- internals ----------
+    def _ensure_thread(self) -> None:
+        # caller holds self._cond
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="pokeapi-write-behind", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        try:
+            while True:
+                with self._cond:
+                    while not self._pending:
+                        self._cond.wait()
+                    deadline = time.monotonic() + self.flush_interval
+                    while len(self._pending) < self.batch_size:  # let a batch accumulate
+                        left = deadline - time.monotonic()
+                        if left <= 0 or not self._cond.wait(left):
+                            break
+                self._write_batch()
+        finally:
+            connections.close_all()
+
+    def _write_batch(self) -> bool:
+        """Write up to `batch_size` pending entries in one transaction. False if idle."""
+        with self._write_lock:
+            with self._cond:
+                urls = list(self._pending)[:self.batch_size]
+                batch: List[Tuple[Any, Set[str]]] = [self._pending.pop(u) for u in urls]
+                self._inflight.update({e.url: e for e, _ in batch})
+            if not batch:
+                return False
+
+            written = failed = 0
+            backend = get_backend()
+            try:
+                with transaction.atomic():
+                    for entry, fields in batch:
+                        try:
+                            with transaction.atomic():
+                                backend.save(entry, sorted(fields))
+                            written += 1
+                        except Exception:  # noqa: BLE001 — a cache write is never worth more than the batch
+                            failed += 1
+            finally:
+                with self._cond:
+                    for u in urls:
+                        self._inflight.pop(u, None)
+                    self.written += written
+                    self.failed += failed
+                    self.batches += 1
+            return True
+
+
+def _build_from_settings() -> WriteBehind:
+    conf = _conf()
+    return WriteBehind(
+        max_queue=int(conf["MAX_QUEUE"]),
+        batch_size=int(conf["BATCH_SIZE"]),
+        flush_interval=float(conf["FLUSH_INTERVAL"]),
+    )
+
+
+def write_behind_enabled() -> bool:
+    return bool(_conf()["ENABLED"])
+
+
+write_behind = _build_from_settings()
+atexit.register(write_behind.flush)
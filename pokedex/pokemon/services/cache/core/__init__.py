@@ -10,8 +10,11 @@ Submodules:
 - dbutils   : generic DB helpers (have/missing values)
 - indexing  : generic PokeAPI index iteration
 - progress  : progress reporting helpers
-- steps     : orchestration steps (enumerate, select_targets, run passes)
+- steps     : orchestration steps (enumerate, select_targets, run passes; streamed index pages)
+- async_steps : asyncio variants of the run passes
+- aimd      : adaptive (AIMD) in-flight limit for the passes
 - worker    : resilient runner + chunk submitter
+- writer    : single batched DB writer fed by the fetch workers
 """
 
 from .constants import (
@@ -20,20 +23,28 @@ from .constants import (
     SECOND_PASSES,
     UPSERT_ATTEMPTS,
     PROGRESS_EVERY_N,
+    ASYNC_CONCURRENCY_DEFAULT,
+    WRITE_BATCH_SIZE,
+    WRITE_QUEUE_SIZE,
     ProgressState,
     ProgressFn,
     LogFn,
 )
 from .dbutils import db_have_values, missing_after_chunk
-from .indexing import extract_ids_from_index, get_total_count, iter_index_ids
+from .indexing import IndexPages, extract_ids_from_index, index_pages, iter_index_ids
 from .progress import report, compute_metrics
 from .steps import (
-    enumerate_ids,
+    enumerate_pages,
     select_targets,
+    TargetStream,
     run_main_pass,
+    run_stream_pass,
     run_retry_passes,
 )
-from .worker import make_safe_runner, submit_chunk
+from .aimd import AimdController, aimd_controller
+from .async_steps import aiter_chunks, arun_main_pass, arun_stream_pass, arun_retry_passes
+from .worker import make_safe_runner, make_async_safe_runner, submit_chunk
+from .writer import BatchWriter
 
 __all__ = [
     # constants
@@ -42,6 +53,9 @@ __all__ = [
     "SECOND_PASSES",
     "UPSERT_ATTEMPTS",
     "PROGRESS_EVERY_N",
+    "ASYNC_CONCURRENCY_DEFAULT",
+    "WRITE_BATCH_SIZE",
+    "WRITE_QUEUE_SIZE",
     "ProgressState",
     "ProgressFn",
     "LogFn",
@@ -50,17 +64,30 @@ __all__ = [
     "missing_after_chunk",
     # indexing
     "extract_ids_from_index",
-    "get_total_count",
+    "IndexPages",
+    "index_pages",
     "iter_index_ids",
     # progress
     "report",
     "compute_metrics",
     # steps
-    "enumerate_ids",
+    "enumerate_pages",
     "select_targets",
+    "TargetStream",
     "run_main_pass",
+    "run_stream_pass",
     "run_retry_passes",
+    "aiter_chunks",
+    "arun_main_pass",
+    "arun_stream_pass",
+    "arun_retry_passes",
+    # aimd
+    "AimdController",
+    "aimd_controller",
     # worker
     "make_safe_runner",
+    "make_async_safe_runner",
     "submit_chunk",
+    # writer
+    "BatchWriter",
 ]
\ No newline at end of file
@@ -0,0 +1,216 @@
+from __future__ import annotations
+"""
+AIMD concurrency control for bulk syncs.
+
+The number of items a sync keeps in flight is a live limit instead of a fixed
+`--workers`/`--sleep` guess:
+
+- additive increase : after about one window of healthy completions
+                      (`limit` items, latency within `LATENCY_TOLERANCE` × the
+                      best latency seen), the limit grows by `INCREASE`;
+- multiplicative decrease : a 429/5xx answer, a timeout/connection error, a new
+                      rate-limiter penalty (Retry-After) or latency beyond the
+                      tolerance cuts it to `limit × DECREASE`, at most once per
+                      window so one burst of errors counts as one signal.
+
+Item latency includes the wait for the shared rate limiter, so once the limit
+exceeds what the request budget sustains, latency rises and the limit stops
+growing (Little's law), and the sync settles at the fastest sustainable rate.
+
+Settings `POKEAPI_SYNC_CONCURRENCY` (see `AIMD_DEFAULTS`).
+"""
+
+import asyncio
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+import requests
+from django.conf import settings
+
+from pokemon.services.api import rate_limiter
+
+AIMD_DEFAULTS: Dict[str, Any] = {
+    "ADAPTIVE": True,
+    "MIN": 1,
+    "MAX": 32,
+    "INCREASE": 1.0,  # items added per healthy window
+    "DECREASE": 0.5,  # factor applied on congestion
+    "LATENCY_TOLERANCE": 2.0,  # × best observed latency before it counts as congestion
+}
+
+_EWMA_ALPHA = 0.2
+
+_clock = time.monotonic
+
+
+def aimd_conf() -> Dict[str, Any]:
+    return {**AIMD_DEFAULTS, **getattr(settings, "POKEAPI_SYNC_CONCURRENCY", {})}
+
+
+def is_congestion(exc: BaseException) -> bool:
+    """True for errors that mean upstream is overloaded (429/5xx, timeouts, connection errors)."""
+    if isinstance(exc, requests.HTTPError):
+        status = getattr(exc.response, "status_code", None)
+        return status is None or status == 429 or status >= 500
+    return isinstance(exc, (requests.Timeout, requests.ConnectionError))
+
+
+class AimdController:
+    """
+    Live in-flight limit for the items of a sync (see module docstring).
+
+    Thread-pool passes run each item through `call`, asyncio passes through
+    `acall`; both wait while `limit` items are in flight and feed the item's
+    latency and outcome back into the limit.
+
+    Counters
+    --------
+    increases : additive steps taken
+    decreases : multiplicative cuts taken
+    signals   : congestion signals seen (including those inside a window)
+    """
+
+    def __init__(
+        self,
+        initial: int,
+        *,
+        min_limit: int = 1,
+        max_limit: int = 32,
+        increase: float = 1.0,
+        decrease: float = 0.5,
+        latency_tolerance: float = 2.0,
+    ) -> None:
+        self.min_limit = max(1, int(min_limit))
+        self.max_limit = max(self.min_limit, int(max_limit))
+        self.increase = float(increase)
+        self.decrease = float(decrease)
+        self.latency_tolerance = float(latency_tolerance)
+        self._limit = float(min(self.max_limit, max(self.min_limit, int(initial))))
+        self._cond = threading.Condition()
+        self._acond: Optional[asyncio.Condition] = None
+        self.in_flight = 0
+        self._ewma: Optional[float] = None
+        self._best: Optional[float] = None
+        self._since_cut = 0
+        self._acked = 0  # healthy completions since the last step
+        self._penalties = rate_limiter.penalties
+        self.increases = 0
+        self.decreases = 0
+        self.signals = 0
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    # ---------- gating ----------
+    def try_acquire(self) -> bool:
+        with self._cond:
+            if self.in_flight >= self.limit:
+                return False
+            self.in_flight += 1
+            return True
+
+    def acquire(self) -> None:
+        with self._cond:
+            while self.in_flight >= self.limit:
+                self._cond.wait()
+            self.in_flight += 1
+
+    def release(self, latency: float, *, congested: bool = False) -> None:
+        """Finish one item that took `latency` seconds and adjust the limit."""
+        with self._cond:
+            self.in_flight -= 1
+            self._update(latency, congested)
+            self._cond.notify_all()
+
+    def call(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """Run `fn(*args)` as one in-flight item (blocks while the limit is reached)."""
+        self.acquire()
+        started = _clock()
+        congested = False
+        try:
+            return fn(*args)
+        except Exception as e:
+            congested = is_congestion(e)
+            raise
+        finally:
+            self.release(_clock() - started, congested=congested)
+
+    async def acall(self, fn: Callable[..., Awaitable[Any]], *args: Any) -> Any:
+        """Async `call`: awaits a free slot instead of blocking a thread."""
+        if self._acond is None:
+            self._acond = asyncio.Condition()
+        cond = self._acond
+        async with cond:
+            await cond.wait_for(self.try_acquire)
+        started = _clock()
+        congested = False
+        try:
+            return await fn(*args)
+        except Exception as e:
+            congested = is_congestion(e)
+            raise
+        finally:
+            self.release(_clock() - started, congested=congested)
+            async with cond:
+                cond.notify_all()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            return {
+                "limit": self.limit,
+                "in_flight": self.in_flight,
+                "latency": None if self._ewma is None else round(self._ewma, 4),
+                "increases": self.increases,
+                "decreases": self.decreases,
+                "signals": self.signals,
+            }
+
+    # ---------- internals ----------
+    def _update(self, latency: float, congested: bool) -> None:
+        self._since_cut += 1
+        penalties = rate_limiter.penalties
+        if penalties > self._penalties:  # a 429/Retry-After was handled inside the client
+            self._penalties = penalties
+            congested = True
+
+        if not congested:
+            self._ewma = latency if self._ewma is None else (
+                (1 - _EWMA_ALPHA) * self._ewma + _EWMA_ALPHA * latency
+            )
+            self._best = self._ewma if self._best is None else min(self._best, self._ewma)
+            congested = self._ewma > self._best * self.latency_tolerance
+
+        if congested:
+            self.signals += 1
+            if self._since_cut >= self._limit:  # one cut per window
+                self._limit = max(float(self.min_limit), self._limit * self.decrease)
+                self._since_cut = 0
+                self._acked = 0
+                self.decreases += 1
+            return
+
+        self._acked += 1
+        if self._acked >= self.limit and self._limit < self.max_limit:  # one step per window
+            self._acked = 0
+            self._limit = min(float(self.max_limit), self._limit + self.increase)
+            self.increases += 1
+
+
+def aimd_controller(initial: int, max_limit: Optional[int] = None) -> Optional[AimdController]:
+    """
+    Controller configured by settings, starting at `initial` and capped at
+    `max_limit` (default settings MAX); None when not ADAPTIVE.
+    """
+    conf = aimd_conf()
+    if not conf["ADAPTIVE"]:
+        return None
+    return AimdController(
+        initial,
+        min_limit=int(conf["MIN"]),
+        max_limit=int(conf["MAX"] if max_limit is None else max_limit),
+        increase=float(conf["INCREASE"]),
+        decrease=float(conf["DECREASE"]),
+        latency_tolerance=float(conf["LATENCY_TOLERANCE"]),
+    )
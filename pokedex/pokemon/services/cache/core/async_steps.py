@@ -0,0 +1,236 @@
+from __future__ import annotations
+"""
+Asyncio variants of the sync passes in `steps`.
+
+Same inputs, outputs and progress payloads as `run_main_pass` /
+`run_stream_pass` / `run_retry_passes`, but items are coroutines
+(`make_async_safe_runner`) kept in flight under a concurrency limit instead of
+a thread pool, so hundreds of upstream requests can overlap without hundreds
+of threads. DB accounting callbacks are plain sync functions and run via
+`sync_to_async`; a blocking chunk stream (`TargetStream`) is read ahead from a
+worker thread by `aiter_chunks`.
+"""
+
+import asyncio
+from typing import (
+    Any, AsyncIterable, AsyncIterator, Awaitable, Callable, Iterable, List, Optional, Sequence, Set, Tuple,
+)
+
+from asgiref.sync import sync_to_async
+
+from .aimd import AimdController
+from .steps import ProgressFn, _report
+
+AsyncRunner = Callable[[int], Awaitable[bool]]
+
+CHUNK_PREFETCH = 2  # chunks of a blocking stream read ahead of the pass
+
+_END = object()
+
+
+def _bounded(run_one: AsyncRunner, concurrency: int) -> AsyncRunner:
+    slots = asyncio.Semaphore(max(1, concurrency))
+
+    async def _run(item_id: int) -> bool:
+        async with slots:
+            return await run_one(item_id)
+
+    return _run
+
+
+async def aiter_chunks(chunks: Iterable[Sequence[int]], prefetch: int = CHUNK_PREFETCH) -> AsyncIterator[List[int]]:
+    """
+    Iterate a blocking chunk stream (e.g. a `TargetStream` over index pages)
+    on the event loop: a task pulls it from a worker thread into a bounded
+    asyncio queue, so later pages arrive while earlier chunks are in flight.
+    Errors raised by the stream are re-raised here.
+    """
+    queue: "asyncio.Queue[Any]" = asyncio.Queue(maxsize=max(1, prefetch))
+    it = iter(chunks)
+
+    async def _fill() -> None:
+        try:
+            while True:
+                chunk = await asyncio.to_thread(next, it, _END)
+                await queue.put(chunk)
+                if chunk is _END:
+                    return
+        except Exception as e:  # noqa: BLE001 — handed to the consumer
+            await queue.put(e)
+
+    filler = asyncio.create_task(_fill())
+    try:
+        while True:
+            item = await queue.get()
+            if item is _END:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield list(item)
+    finally:
+        filler.cancel()
+
+
+async def _regroup(chunks: AsyncIterable[Sequence[int]], size: int) -> AsyncIterator[List[int]]:
+    buf: List[int] = []
+    async for chunk in chunks:
+        buf.extend(chunk)
+        while len(buf) >= size:
+            yield buf[:size]
+            buf = buf[size:]
+    if buf:
+        yield buf
+
+
+async def _list_chunks(targets: List[int], size: int) -> AsyncIterator[List[int]]:
+    for start in range(0, len(targets), size):
+        yield targets[start:start + size]
+
+
+async def arun_main_pass(
+    targets: List[int],
+    *,
+    concurrency: int,
+    batch_size: int,
+    sleep_between_batches: float,
+    run_one: AsyncRunner,
+    progress: ProgressFn,
+    metric_key: str,  # e.g. "synced" or "ok"
+    progress_every_n: int,
+    missing_after_chunk: Callable[[Sequence[int]], Set[int]],
+    t0: float,
+    controller: Optional[AimdController] = None,
+) -> Tuple[int, List[int], int]:
+    """
+    Execute the main pass with up to `concurrency` items in flight and
+    return (good_count, failed_ids, done_count).
+
+    Chunks hold at least `concurrency` items so the limit can be reached;
+    the exact DB accounting runs after each chunk, as in `run_main_pass`.
+    An AIMD `controller` (gating the runners) adapts the in-flight count
+    below `concurrency`; its live `limit` is reported with the progress.
+    """
+    if not targets:
+        return 0, [], 0
+
+    return await arun_stream_pass(
+        _list_chunks(targets, batch_size),
+        total=len(targets),
+        concurrency=concurrency,
+        batch_size=batch_size,
+        sleep_between_batches=sleep_between_batches,
+        run_one=run_one,
+        progress=progress,
+        metric_key=metric_key,
+        progress_every_n=progress_every_n,
+        missing_after_chunk=missing_after_chunk,
+        t0=t0,
+        controller=controller,
+    )
+
+
+async def arun_stream_pass(
+    chunks: AsyncIterable[Sequence[int]],
+    *,
+    total: int,
+    concurrency: int,
+    batch_size: int,
+    sleep_between_batches: float,
+    run_one: AsyncRunner,
+    progress: ProgressFn,
+    metric_key: str,  # e.g. "synced" or "ok"
+    progress_every_n: int,
+    missing_after_chunk: Callable[[Sequence[int]], Set[int]],
+    t0: float,
+    skipped: Callable[[], int] = lambda: 0,
+    controller: Optional[AimdController] = None,
+) -> Tuple[int, List[int], int]:
+    """
+    Async `run_stream_pass`: main pass over chunks that may still be arriving
+    (e.g. `aiter_chunks(TargetStream(...))`); returns (good_count, failed_ids, done_count).
+
+    Incoming chunks are regrouped to at least `concurrency` items; `total`
+    is an estimate for progress reporting and `skipped` returns how many of
+    it were left out so far.
+    """
+    run = _bounded(run_one, concurrency)
+    missing = sync_to_async(missing_after_chunk)
+    chunk_size = max(batch_size, concurrency)
+
+    done = 0
+    good = 0
+    failed_ids: List[int] = []
+    batches = max(1, (total + chunk_size - 1) // chunk_size)
+
+    bi = 0
+    async for chunk in _regroup(chunks, chunk_size):
+        bi += 1
+        optimistic = 0
+        for fut in asyncio.as_completed([run(i) for i in chunk]):
+            if await fut:
+                optimistic += 1
+            done += 1
+
+            if progress and (done % progress_every_n == 0):
+                _report(progress, phase="sync", total=total, done=done,
+                        good=good + optimistic, failed=len(failed_ids),
+                        skipped=skipped(), batch=bi, batches=batches, t0=t0,
+                        metric_key=metric_key, controller=controller)
+
+        missing_now = await missing(chunk)
+        good += len(chunk) - len(missing_now)
+        if missing_now:
+            failed_ids.extend(list(missing_now))
+
+        if sleep_between_batches:
+            await asyncio.sleep(sleep_between_batches)
+
+        _report(progress, phase="sync", total=total, done=done,
+                good=good, failed=len(failed_ids), skipped=skipped(),
+                batch=bi, batches=batches, t0=t0, metric_key=metric_key,
+                controller=controller)
+
+    return good, failed_ids, done
+
+
+async def arun_retry_passes(
+    failed_ids: List[int],
+    *,
+    concurrency: int,
+    rounds: int,
+    run_one_retry: AsyncRunner,
+    have_in_db: Callable[[Sequence[int]], Set[int]],
+    progress: ProgressFn,
+    metric_key: str,  # e.g. "synced" or "ok"
+    t0: float,
+    controller: Optional[AimdController] = None,
+) -> Tuple[int, List[int]]:
+    """
+    Run N retry rounds at half the concurrency; return (additional_good, remaining_ids).
+    """
+    run = _bounded(run_one_retry, max(1, concurrency // 2))
+    have = sync_to_async(have_in_db)
+    add_good = 0
+    remaining = list(failed_ids)
+
+    for round_idx in range(1, rounds + 1):
+        if not remaining:
+            break
+
+        retry_ids = remaining
+        remaining = []
+
+        for fut in asyncio.as_completed([run(i) for i in retry_ids]):
+            if await fut:
+                add_good += 1
+
+        still_missing = set(retry_ids) - await have(retry_ids)
+        if still_missing:
+            remaining.extend(list(still_missing))
+
+        _report(progress, phase=f"retry-{round_idx}", total=len(retry_ids),
+                done=len(retry_ids), good=len(retry_ids) - len(still_missing),
+                failed=len(still_missing), skipped=0, batch=round_idx,
+                batches=rounds, t0=t0, metric_key=metric_key, controller=controller)
+
+    return add_good, remaining
@@ -6,6 +6,9 @@ MAX_WORKERS_DEFAULT = 6
 SECOND_PASSES = 2
 UPSERT_ATTEMPTS = 4
 PROGRESS_EVERY_N = 10  # evo can override with a smaller value if desired
+ASYNC_CONCURRENCY_DEFAULT = 100  # requests in flight for the asyncio passes
+WRITE_BATCH_SIZE = 200  # upserts committed per transaction by the sync writer
+WRITE_QUEUE_SIZE = 500  # fetched records waiting for the writer (backpressure)
 
 ProgressState = Dict[str, Any]
 ProgressFn = Optional[Callable[[ProgressState], None]]
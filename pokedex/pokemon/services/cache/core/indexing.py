@@ -1,28 +1,96 @@
 from __future__ import annotations
-from typing import Iterable, List, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import closing
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple
+from django.db import connections
 from pokemon.services.api import get_json, url
 
+INDEX_PAGE_WORKERS = 4  # concurrent index page requests
+
 
 def extract_ids_from_index(results: Sequence[dict]) -> List[int]:
     """Parse integer IDs from typical PokeAPI index result rows."""
     return [int(row["url"].rstrip("/").split("/")[-1]) for row in results]
 
 
-def get_total_count(resource: str) -> int:
-    """Cheap total count via `?limit=1` on a resource path (e.g., 'pokemon')."""
-    data = get_json(url(resource) + "?limit=1")
-    return int(data.get("count", 0) or 0)
+def _page_ids(resource: str, offset: int, limit: int) -> Tuple[int, List[int]]:
+    """One index page: (total count, IDs on the page)."""
+    data = get_json(url(resource) + f"?offset={offset}&limit={limit}")
+    return int(data.get("count", 0) or 0), extract_ids_from_index(data.get("results", []))
+
+
+def _page_task(resource: str, offset: int, limit: int) -> Tuple[int, List[int]]:
+    """`_page_ids` on an index worker thread; `get_json` opened its DB connection."""
+    try:
+        return _page_ids(resource, offset, limit)
+    finally:
+        connections.close_all()
+
+
+class IndexPages:
+    """
+    The `pages` of `index_pages`: yields the IDs of each page in index order.
+    `close()` (also called once exhausted or on error) cancels the pages not
+    fetched yet and releases the worker threads; call it when giving up early.
+    """
+
+    def __init__(self, first: List[int], futures: Sequence[Future] = (),
+                 executor: Optional[ThreadPoolExecutor] = None) -> None:
+        self._first: Optional[List[int]] = first or None
+        self._futures = iter(futures)
+        self._executor = executor
+
+    def __iter__(self) -> Iterator[List[int]]:
+        return self
+
+    def __next__(self) -> List[int]:
+        if self._first is not None:
+            page, self._first = self._first, None
+            return page
+        try:
+            for fut in self._futures:
+                _, ids = fut.result()
+                if ids:
+                    return ids
+                break
+        except BaseException:
+            self.close()
+            raise
+        self.close()
+        raise StopIteration
+
+    def close(self) -> None:
+        self._first = None
+        self._futures = iter(())
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+def index_pages(resource: str, batch_size: int) -> Tuple[int, IndexPages]:
+    """
+    Page a PokeAPI index endpoint as a stream; returns (count, pages).
+
+    The first page is fetched right away and carries `count` (no separate
+    `?limit=1` request). All remaining pages are then requested concurrently,
+    and `pages` yields the IDs of each page in index order as soon as it has
+    arrived, so callers can start working before the index is complete.
+    Close `pages` when stopping before the end.
+    """
+    count, first = _page_ids(resource, 0, batch_size)
+    offsets = range(batch_size, count, batch_size) if first else range(0)
+    if not offsets:
+        return count, IndexPages(first)
+
+    ex = ThreadPoolExecutor(max_workers=min(INDEX_PAGE_WORKERS, len(offsets)),
+                            thread_name_prefix="pokeapi-index")
+    futures = [ex.submit(_page_task, resource, offset, batch_size) for offset in offsets]
+    return count, IndexPages(first, futures, ex)
 
 
 def iter_index_ids(resource: str, batch_size: int) -> Iterable[int]:
-    """Yield all integer IDs by paging a PokeAPI index endpoint."""
-    count = get_total_count(resource)
-    offset = 0
-    while offset < count:
-        data = get_json(url(resource) + f"?offset={offset}&limit={batch_size}")
-        results = data.get("results", [])
-        if not results:
-            break
-        for item_id in extract_ids_from_index(results):
-            yield item_id
-        offset += batch_size
\ No newline at end of file
+    """Yield all integer IDs of a PokeAPI index endpoint (pages fetched concurrently)."""
+    _, pages = index_pages(resource, batch_size)
+    with closing(pages):
+        for ids in pages:
+            yield from ids
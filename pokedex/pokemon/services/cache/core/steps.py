@@ -1,22 +1,25 @@
 from __future__ import annotations
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Callable, Iterable, List, Sequence, Tuple, Set, Optional, Dict, Any
+from typing import Callable, Iterable, Iterator, List, Sequence, Tuple, Set, Optional, Dict, Any
+
+from .aimd import AimdController
 
 ProgressFn = Optional[Callable[[Dict[str, Any]], None]]
 
 
-def enumerate_ids(iter_ids: Callable[[int], Iterable[int]],
-                  batch_size: int,
-                  progress: ProgressFn) -> Tuple[List[int], float]:
+def enumerate_pages(index_pages: Callable[[int], Tuple[int, Iterable[List[int]]]],
+                    batch_size: int,
+                    progress: ProgressFn) -> Tuple[int, Iterable[List[int]], float]:
     """
-    Execute index paging callback and return (ids, perf_counter_start).
+    Start streaming index pages; return (count, pages, perf_counter_start).
+    Only the first page has been fetched when this returns.
     """
     t0 = time.perf_counter()
-    ids = list(iter_ids(batch_size=batch_size))
+    count, pages = index_pages(batch_size)
     if progress:
-        progress({"phase": "index", "total": len(ids), "done": len(ids)})
-    return ids, t0
+        progress({"phase": "index", "total": count, "done": 0})
+    return count, pages, t0
 
 
 def select_targets(all_ids: List[int],
@@ -29,6 +32,37 @@ def select_targets(all_ids: List[int],
     return targets, (len(all_ids) - len(targets))
 
 
+class TargetStream:
+    """
+    `select_targets` applied page by page to a stream of index pages:
+    iterating yields the non-empty target chunks, `skipped` counts the
+    IDs left out so far.
+    """
+
+    def __init__(self,
+                 pages: Iterable[List[int]],
+                 have_ids: Callable[[Sequence[int]], Set[int]],
+                 only_missing: bool) -> None:
+        self.pages = pages
+        self.have_ids = have_ids
+        self.only_missing = only_missing
+        self.skipped = 0
+
+    def close(self) -> None:
+        """Stop the underlying page stream (see `IndexPages.close`), if it can be stopped."""
+        close = getattr(self.pages, "close", None)
+        if close is not None:
+            close()
+
+    def __iter__(self) -> Iterator[List[int]]:
+        for page in self.pages:
+            existing = self.have_ids(page) if self.only_missing else set()
+            targets, skipped = select_targets(page, existing, self.only_missing)
+            self.skipped += skipped
+            if targets:
+                yield targets
+
+
 def run_main_pass(
     targets: List[int],
     *,
@@ -41,6 +75,7 @@ def run_main_pass(
     progress_every_n: int,
     missing_after_chunk: Callable[[Sequence[int]], Set[int]],
     t0: float,
+    controller: Optional[AimdController] = None,
 ) -> Tuple[int, List[int], int]:
     """
     Execute the main parallel pass and return (good_count, failed_ids, done_count).
@@ -48,14 +83,58 @@ def run_main_pass(
     if not targets:
         return 0, [], 0
 
+    batches = max(1, (len(targets) + batch_size - 1) // batch_size)
+    chunks = (targets[bi * batch_size : (bi + 1) * batch_size] for bi in range(batches))
+    return run_stream_pass(
+        chunks,
+        total=len(targets),
+        batches=batches,
+        workers=workers,
+        sleep_between_batches=sleep_between_batches,
+        submit_chunk=submit_chunk,
+        progress=progress,
+        metric_key=metric_key,
+        progress_every_n=progress_every_n,
+        missing_after_chunk=missing_after_chunk,
+        t0=t0,
+        controller=controller,
+    )
+
+
+def run_stream_pass(
+    chunks: Iterable[Sequence[int]],
+    *,
+    total: int,
+    batches: int,
+    workers: int,
+    sleep_between_batches: float,
+    submit_chunk: Callable[[ThreadPoolExecutor, Sequence[int]], Sequence],  # returns futures
+    progress: ProgressFn,
+    metric_key: str,  # e.g. "synced" or "ok"
+    progress_every_n: int,
+    missing_after_chunk: Callable[[Sequence[int]], Set[int]],
+    t0: float,
+    skipped: Callable[[], int] = lambda: 0,
+    controller: Optional[AimdController] = None,
+) -> Tuple[int, List[int], int]:
+    """
+    Main parallel pass over chunks that may still be arriving (e.g. a
+    `TargetStream` over `enumerate_pages`); returns (good_count, failed_ids, done_count).
+
+    `total`/`batches` are estimates for progress reporting; `skipped` returns
+    how many of `total` were left out so far.
+
+    With an AIMD `controller` (whose runners gate on it, see `make_safe_runner`),
+    its live limit decides how many of the pool's threads work at once; the
+    pool never exceeds `workers`. Progress payloads carry the live `limit`.
+    """
     done = 0
     good = 0
     failed_ids: List[int] = []
-    batches = max(1, (len(targets) + batch_size - 1) // batch_size)
 
-    with ThreadPoolExecutor(max_workers=workers) as ex:
-        for bi in range(batches):
-            chunk = targets[bi * batch_size : (bi + 1) * batch_size]
+    pool_size = min(workers, controller.max_limit) if controller is not None else workers
+    with ThreadPoolExecutor(max_workers=pool_size) as ex:
+        for bi, chunk in enumerate(chunks):
             futures = submit_chunk(ex, chunk)
 
             optimistic = 0
@@ -65,10 +144,10 @@ def run_main_pass(
                 done += 1
 
                 if progress and (done % progress_every_n == 0):
-                    _report(progress, phase="sync", total=len(targets), done=done,
+                    _report(progress, phase="sync", total=total, done=done,
                             good=good + optimistic, failed=len(failed_ids),
-                            skipped=0, batch=bi + 1, batches=batches, t0=t0,
-                            metric_key=metric_key)
+                            skipped=skipped(), batch=bi + 1, batches=batches, t0=t0,
+                            metric_key=metric_key, controller=controller)
 
             # exact DB accounting after the batch
             missing_now = missing_after_chunk(chunk)
@@ -79,9 +158,10 @@ def run_main_pass(
             if sleep_between_batches:
                 time.sleep(sleep_between_batches)
 
-            _report(progress, phase="sync", total=len(targets), done=done,
-                    good=good, failed=len(failed_ids), skipped=0,
-                    batch=bi + 1, batches=batches, t0=t0, metric_key=metric_key)
+            _report(progress, phase="sync", total=total, done=done,
+                    good=good, failed=len(failed_ids), skipped=skipped(),
+                    batch=bi + 1, batches=batches, t0=t0, metric_key=metric_key,
+                    controller=controller)
 
     return good, failed_ids, done
 
@@ -96,9 +176,12 @@ def run_retry_passes(
     progress: ProgressFn,
     metric_key: str,  # e.g. "synced" or "ok"
     t0: float,
+    controller: Optional[AimdController] = None,
 ) -> Tuple[int, List[int]]:
     """
     Run N smaller retry rounds; return (additional_good, remaining_ids).
+    Rounds use at most `workers // 2` threads; with a `controller`, its live
+    limit bounds them further.
     """
     add_good = 0
     remaining = list(failed_ids)
@@ -110,7 +193,10 @@ def run_retry_passes(
         retry_ids = remaining
         remaining = []
 
-        with ThreadPoolExecutor(max_workers=max(1, workers // 2)) as ex:
+        pool_size = max(1, workers // 2)
+        if controller is not None:
+            pool_size = min(pool_size, controller.max_limit)
+        with ThreadPoolExecutor(max_workers=pool_size) as ex:
             futures = submit_chunk_retry(ex, retry_ids)
             for fut in as_completed(futures):
                 if fut.result():
@@ -124,23 +210,24 @@ def run_retry_passes(
         _report(progress, phase=f"retry-{round_idx}", total=len(retry_ids),
                 done=len(retry_ids), good=len(retry_ids) - len(still_missing),
                 failed=len(still_missing), skipped=0, batch=round_idx,
-                batches=rounds, t0=t0, metric_key=metric_key)
+                batches=rounds, t0=t0, metric_key=metric_key, controller=controller)
 
     return add_good, remaining
 
 
 def _report(progress: ProgressFn, *, phase: str, total: int, done: int, good: int,
             failed: int, skipped: int, batch: int, batches: int, t0: float,
-            metric_key: str) -> None:
+            metric_key: str, controller: Optional[AimdController] = None) -> None:
     """
-    Internal progress reporter that emits `metric_key` with the `good` count.
+    Internal progress reporter that emits `metric_key` with the `good` count
+    (and the AIMD in-flight `limit` when a controller drives the pass).
     """
     if not progress:
         return
 
     elapsed = time.perf_counter() - t0
     rate = (done / elapsed) if elapsed > 0 else 0.0
-    remaining = max(0, total - done)
+    remaining = max(0, total - done - skipped)
     eta = (remaining / rate) if rate > 0 else 0.0
     payload = {
         "phase": phase,
@@ -154,4 +241,6 @@ def _report(progress: ProgressFn, *, phase: str, total: int, done: int, good: in
         "rate": rate,
         "eta": eta,
     }
+    if controller is not None:
+        payload["limit"] = controller.limit
     progress(payload)
\ No newline at end of file
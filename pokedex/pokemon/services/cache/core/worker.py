@@ -1,8 +1,13 @@
 from __future__ import annotations
+import asyncio
 import random
 import time
 from concurrent.futures import ThreadPoolExecutor
-from typing import Callable, Sequence, Any
+from typing import Awaitable, Callable, Optional, Sequence, Any
+
+from asgiref.sync import sync_to_async
+from pokemon.services.api import CircuitOpenError
+from .aimd import AimdController
 from .constants import LogFn
 
 
@@ -11,10 +16,13 @@ def make_safe_runner(
     *,
     attempts: int,
     logger: LogFn = None,
+    controller: Optional[AimdController] = None,
 ) -> Callable[[Any], bool]:  # noqa: ANN401
     """
     Build a resilient runner for a single ID:
     - retries with exponential backoff + tiny jitter
+    - gives up at once while the PokeAPI circuit breaker is open
+    - with a `controller`, each attempt waits for (and reports to) its in-flight limit
     - returns True/False
     - logs first failure and final give-up if logger is provided
     """
@@ -26,9 +34,17 @@ def make_safe_runner(
         last_err: Exception | None = None
         for i in range(attempts):
             try:
-                upsert_fn(item_id)
+                if controller is not None:
+                    controller.call(upsert_fn, item_id)
+                else:
+                    upsert_fn(item_id)
                 return True
 
+            except CircuitOpenError as e:
+                # upstream is down; retrying would only queue behind it
+                _log(f"[safe-runner] id={item_id} giving up after {i + 1} attempt(s), circuit open: {e}")
+                return False
+
             except Exception as e:  # noqa: BLE001
                 last_err = e
                 if i == 0:
@@ -42,6 +58,59 @@ def make_safe_runner(
     return _runner
 
 
+def make_async_safe_runner(
+    fetch_fn: Callable[[Any], Awaitable[Any]],  # noqa: ANN401
+    upsert_fn: Callable[[Any], Any],  # noqa: ANN401
+    *,
+    attempts: int,
+    logger: LogFn = None,
+    controller: Optional[AimdController] = None,
+) -> Callable[[Any], Awaitable[bool]]:  # noqa: ANN401
+    """
+    Async twin of `make_safe_runner` for the asyncio passes:
+    - awaits `fetch_fn(id)`, which warms the API cache with every payload
+      the upsert reads (through `services.api.aio.AsyncClient`)
+    - then runs the blocking `upsert_fn(id)` via `sync_to_async`; it is
+      served from the cache, so the DB thread never waits on the network
+    - same retries/backoff/give-up rules (and `controller` gating) as `make_safe_runner`
+    """
+    upsert = sync_to_async(upsert_fn)
+
+    async def _attempt(item_id: Any) -> None:  # noqa: ANN401
+        await fetch_fn(item_id)
+        await upsert(item_id)
+
+    def _log(msg: str) -> None:
+        if logger:
+            logger(msg)
+
+    async def _runner(item_id: Any) -> bool:  # noqa: ANN401
+        last_err: Exception | None = None
+        for i in range(attempts):
+            try:
+                if controller is not None:
+                    await controller.acall(_attempt, item_id)
+                else:
+                    await _attempt(item_id)
+                return True
+
+            except CircuitOpenError as e:
+                _log(f"[safe-runner] id={item_id} giving up after {i + 1} attempt(s), circuit open: {e}")
+                return False
+
+            except Exception as e:  # noqa: BLE001
+                last_err = e
+                if i == 0:
+                    _log(f"[safe-runner] id={item_id} first fail: {e!r}")
+                sleep_s = min(4.0, 0.5 * (2 ** i)) + random.uniform(0.0, 0.2)
+                await asyncio.sleep(sleep_s)
+
+        _log(f"[safe-runner] id={item_id} giving up after {attempts} attempts. last={last_err!r}")
+        return False
+
+    return _runner
+
+
 def submit_chunk(
     ex: ThreadPoolExecutor,
     ids: Sequence[Any],  # noqa: ANN401
@@ -0,0 +1,234 @@
+from __future__ import annotations
+"""
+Single batched DB writer for bulk syncs.
+
+Fetch workers (threads or coroutines) do the network I/O and normalization,
+then `submit` ready-to-write records into a bounded queue. One writer thread
+drains it and commits up to `batch_size` records per transaction, so:
+
+- no transaction is ever open while waiting on PokeAPI,
+- the domain tables the records go to see exactly one writer (the API cache
+  rows the fetchers store through `get_json` are still written from their
+  own threads, see `services.api.cache`),
+- a full queue blocks the fetchers (backpressure) instead of growing memory.
+
+With a set-based `batch_fn`, a whole batch is written in a few statements;
+if it raises, the batch falls back to `write_fn` per record. Each record is
+then written inside its own savepoint: a bad record is counted and logged
+without rolling back the rest of its batch. A batch that hits a database
+lock/operational error is retried as a whole.
+
+Sync passes call `flush()` (or wrap their DB accounting with `after_flush`)
+before checking which IDs made it into the database.
+"""
+
+import queue
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
+
+from django.db import OperationalError, connection, transaction
+
+from .constants import LogFn, WRITE_BATCH_SIZE, WRITE_QUEUE_SIZE
+
+WRITE_RETRIES = 3  # attempts per batch on OperationalError (e.g. "database is locked")
+
+_STOP = object()
+_FLUSH = object()
+
+T = TypeVar("T")
+
+
+class BatchWriter:
+    """
+    Bounded queue + one writer thread applying `batch_fn(records)` (or
+    `write_fn(record)` one by one) in batches (see module docstring). Use as a context manager; leaving it writes
+    everything still queued.
+
+    Counters
+    --------
+    written : records committed
+    failed  : records whose write raised (skipped, batch kept)
+    batches : transactions committed
+    fallbacks : batches `batch_fn` rejected, rewritten per record
+    """
+
+    def __init__(
+        self,
+        write_fn: Callable[[Any], Any],
+        *,
+        batch_size: int = WRITE_BATCH_SIZE,
+        max_queue: int = WRITE_QUEUE_SIZE,
+        flush_interval: float = 0.5,
+        batch_fn: Optional[Callable[[List[Any]], Any]] = None,
+        logger: LogFn = None,
+    ) -> None:
+        self.write_fn = write_fn
+        self.batch_fn = batch_fn
+        self.batch_size = max(1, int(batch_size))
+        self.flush_interval = float(flush_interval)
+        self.logger = logger
+        self._q: "queue.Queue[Any]" = queue.Queue(maxsize=max(1, int(max_queue)))
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self.written = 0
+        self.failed = 0
+        self.batches = 0
+        self.fallbacks = 0
+
+    # ---------- lifecycle ----------
+    def start(self) -> "BatchWriter":
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="pokeapi-sync-writer", daemon=True)
+            self._thread.start()
+        return self
+
+    def close(self) -> None:
+        """Write everything queued, then stop the writer thread."""
+        if self._thread is None:
+            return
+        self._put(_STOP)
+        self._thread.join()
+        self._thread = None
+
+    def __enter__(self) -> "BatchWriter":
+        return self.start()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    # ---------- public API ----------
+    def submit(self, record: Any) -> None:
+        """Queue one record for writing; blocks while the queue is full."""
+        self._put(record)
+
+    def flush(self) -> None:
+        """Block until every record submitted so far is committed (or failed)."""
+        if self._thread is None:
+            return
+        self._put(_FLUSH)
+        self._q.join()
+
+    def stage(self, fetch_fn: Callable[[Any], Any]) -> Callable[[Any], None]:
+        """Per-ID function for the fetch workers: `submit(fetch_fn(item_id))`."""
+        def _staged(item_id: Any) -> None:
+            self.submit(fetch_fn(item_id))
+        return _staged
+
+    def after_flush(self, fn: Callable[..., T]) -> Callable[..., T]:
+        """Wrap `fn` (e.g. a DB accounting helper) so it first waits for `flush()`."""
+        def _wrapped(*args: Any, **kwargs: Any) -> T:
+            self.flush()
+            return fn(*args, **kwargs)
+        return _wrapped
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "queued": self._q.qsize(),
+                "written": self.written,
+                "failed": self.failed,
+                "batches": self.batches,
+                "fallbacks": self.fallbacks,
+            }
+
+    # ---------- internals ----------
+    def _put(self, item: Any) -> None:
+        while True:
+            try:
+                self._q.put(item, timeout=1.0)
+                return
+            except queue.Full:
+                if self._thread is None or not self._thread.is_alive():
+                    raise RuntimeError("batch writer is not running")
+
+    def _log(self, msg: str) -> None:
+        if self.logger:
+            self.logger(msg)
+
+    def _run(self) -> None:
+        try:
+            stop = False
+            while not stop:
+                item = self._q.get()
+                taken = 1
+                batch: List[Any] = []
+                if item is _STOP:
+                    stop = True
+                elif item is not _FLUSH:
+                    batch.append(item)
+                    deadline = time.monotonic() + self.flush_interval
+                    while len(batch) < self.batch_size:
+                        try:
+                            item = self._q.get(timeout=max(0.0, deadline - time.monotonic()))
+                        except queue.Empty:
+                            break
+                        taken += 1
+                        if item is _STOP:
+                            stop = True
+                            break
+                        if item is _FLUSH:
+                            break
+                        batch.append(item)
+                try:
+                    if batch:
+                        self._write(batch)
+                finally:
+                    for _ in range(taken):
+                        self._q.task_done()
+        finally:
+            connection.close()  # the thread's own connection
+
+    def _write_set(self, batch: List[Any]) -> bool:
+        """Try `batch_fn` in a savepoint; False (rolled back) if it raised."""
+        try:
+            with transaction.atomic():
+                self.batch_fn(batch)
+            return True
+        except OperationalError:
+            raise
+        except Exception as e:  # noqa: BLE001
+            with self._lock:
+                self.fallbacks += 1
+            self._log(f"[writer] batch write failed, writing {len(batch)} records one by one: {e!r}")
+            return False
+
+    def _write_each(self, batch: List[Any]) -> Tuple[int, int]:
+        """`write_fn` per record, one savepoint each; returns (written, failed)."""
+        written = failed = 0
+        for record in batch:
+            try:
+                with transaction.atomic():
+                    self.write_fn(record)
+                written += 1
+            except OperationalError:
+                raise
+            except Exception as e:  # noqa: BLE001
+                failed += 1
+                self._log(f"[writer] dropped {record!r}: {e!r}")
+        return written, failed
+
+    def _write(self, batch: List[Any]) -> None:
+        for attempt in range(WRITE_RETRIES):
+            written = failed = 0
+            try:
+                with transaction.atomic():
+                    if self.batch_fn is not None and self._write_set(batch):
+                        written = len(batch)
+                    else:
+                        written, failed = self._write_each(batch)
+            except OperationalError as e:
+                if attempt == WRITE_RETRIES - 1:
+                    failed, written = len(batch), 0
+                    self._log(f"[writer] batch of {len(batch)} lost after {WRITE_RETRIES} attempts: {e!r}")
+                    break
+                time.sleep(min(2.0, 0.2 * (2 ** attempt)) + random.uniform(0.0, 0.1))
+                continue
+            with self._lock:
+                self.batches += 1
+            break
+
+        with self._lock:
+            self.written += written
+            self.failed += failed
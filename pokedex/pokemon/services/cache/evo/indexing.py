@@ -3,16 +3,16 @@ from __future__ import annotations
 Index enumeration helpers for the /evolution-chain endpoint.
 """
 
-from typing import Iterable
+from typing import Iterable, Iterator, List, Tuple
 from ..core.indexing import (
-    get_total_count as _get_total_count,
+    index_pages as _index_pages,
     iter_index_ids as _iter_index_ids,
 )
 
 
-def get_chain_count() -> int:
-    return _get_total_count("evolution-chain")
+def iter_chain_ids(batch_size: int) -> Iterable[int]:
+    return _iter_index_ids("evolution-chain", batch_size)
 
 
-def iter_chain_ids(batch_size: int) -> Iterable[int]:
-    return _iter_index_ids("evolution-chain", batch_size)
\ No newline at end of file
+def iter_chain_pages(batch_size: int) -> Tuple[int, Iterator[List[int]]]:
+    return _index_pages("evolution-chain", batch_size)
@@ -5,26 +5,40 @@ Bulk evolution-chain sync orchestrator composed from shared generic steps.
 - Enumerates /evolution-chain IDs.
 - Upserts chains in parallel (retry/backoff is handled in the worker).
 - Backfills PokemonCache.evolution_chain_id inside the upsert layer.
+- Workers only fetch; one `BatchWriter` thread commits chains in batches.
 """
 
+import asyncio
 import time
+from contextlib import closing
+from typing import List, Optional, Tuple
 
+from pokemon.services.api.aio import AsyncClient
+from ..core.aimd import AimdController, aimd_controller
+from ..core.writer import BatchWriter
+from ..core.async_steps import (
+    aiter_chunks as core_aiter_chunks,
+    arun_stream_pass as core_arun_stream_pass,
+    arun_retry_passes as core_arun_retry_passes,
+)
 from ..core.steps import (
-    enumerate_ids as core_enumerate_ids,
-    select_targets as core_select_targets,
-    run_main_pass as core_run_main_pass,
+    enumerate_pages as core_enumerate_pages,
+    TargetStream as core_TargetStream,
+    run_stream_pass as core_run_stream_pass,
     run_retry_passes as core_run_retry_passes,
 )
 from ..core.constants import (
     PAGE_SIZE_DEFAULT,
     MAX_WORKERS_DEFAULT,
     SECOND_PASSES,
+    ASYNC_CONCURRENCY_DEFAULT,
     ProgressFn,
     LogFn,
 )
-from .indexing import iter_chain_ids
+from .indexing import iter_chain_pages
 from .dbutils import db_have_chain_ids, missing_after_chunk
-from .worker import submit_chunk
+from .upsert import write_evo_chain
+from .worker import make_async_runner, submit_chunk
 
 
 PROGRESS_EVERY_N = 5
@@ -38,54 +52,161 @@ def sync_all_evo_chains(
     progress: ProgressFn = None,
     *,
     logger: LogFn = None,
+    async_mode: bool = False,
+    concurrency: int = ASYNC_CONCURRENCY_DEFAULT,
 ) -> dict:
     """
     Fetch/refresh all evolution chains into EvolutionChainCache.
 
+    With `async_mode`, the passes run on an event loop with up to
+    `concurrency` requests in flight instead of `workers` threads.
+    An AIMD controller (`core.aimd`, settings `POKEAPI_SYNC_CONCURRENCY`)
+    tunes the in-flight limit live; its final value is returned as "limit".
+
     Returns
     -------
-    dict: {"ok", "skipped", "failed", "total", "elapsed"}
+    dict: {"ok", "skipped", "failed", "total", "elapsed", "limit"}
     """
-    all_ids, t0 = core_enumerate_ids(iter_chain_ids, batch_size, progress)
-    total = len(all_ids)
-    if total == 0:
+    # 1) stream index pages (generic): the first page gives the count, the rest
+    #    arrive concurrently while earlier pages are already being upserted
+    count, pages, t0 = core_enumerate_pages(iter_chain_pages, batch_size, progress)
+    if count == 0:
         return {"ok": 0, "skipped": 0, "failed": 0, "total": 0, "elapsed": 0.0}
 
-    existing = db_have_chain_ids(all_ids)
-    targets, skipped = core_select_targets(all_ids, existing, only_missing)
-    if not targets:
-        elapsed = round(time.perf_counter() - t0, 2)
-        return {"ok": 0, "skipped": skipped, "failed": 0, "total": total, "elapsed": elapsed}
+    # 2) choose targets page by page (generic)
+    targets = core_TargetStream(pages, db_have_chain_ids, only_missing)
+
+    writer = BatchWriter(write_evo_chain, logger=logger)
+    if async_mode:
+        controller = aimd_controller(max(1, concurrency // 4), max_limit=concurrency)
+        with closing(targets), writer:  # closing: stop pending index fetches on error
+            ok, remaining = asyncio.run(_run_passes_async(
+                targets,
+                total=count,
+                concurrency=concurrency,
+                batch_size=batch_size,
+                sleep_between_batches=sleep_between_batches,
+                progress=progress,
+                logger=logger,
+                t0=t0,
+                writer=writer,
+                controller=controller,
+            ))
+    else:
+        controller = aimd_controller(workers, max_limit=workers)
+        with closing(targets), writer:
+            ok, remaining = _run_passes(
+                targets,
+                total=count,
+                workers=workers,
+                batch_size=batch_size,
+                sleep_between_batches=sleep_between_batches,
+                progress=progress,
+                logger=logger,
+                t0=t0,
+                writer=writer,
+                controller=controller,
+            )
+
+    elapsed = round(time.perf_counter() - t0, 2)
+    return {
+        "ok": ok,
+        "skipped": targets.skipped,
+        "failed": len(remaining),
+        "total": count,
+        "elapsed": elapsed,
+        "limit": controller.limit if controller is not None else None,
+    }
+
 
-    ok, failed_ids, _ = core_run_main_pass(
+def _run_passes(
+    targets: core_TargetStream,
+    *,
+    total: int,
+    workers: int,
+    batch_size: int,
+    sleep_between_batches: float,
+    progress: ProgressFn,
+    logger: LogFn,
+    t0: float,
+    writer: BatchWriter,
+    controller: Optional[AimdController] = None,
+) -> Tuple[int, List[int]]:
+    """Thread-pool passes; returns (ok, remaining_ids)."""
+    ok, failed_ids, _ = core_run_stream_pass(
         targets,
+        total=total,
+        batches=max(1, (total + batch_size - 1) // batch_size),
         workers=workers,
-        batch_size=batch_size,
         sleep_between_batches=sleep_between_batches,
-        submit_chunk=lambda ex, chunk: submit_chunk(ex, chunk, logger=logger),
+        submit_chunk=lambda ex, chunk: submit_chunk(
+            ex, chunk, logger=logger, controller=controller, writer=writer
+        ),
         progress=progress,
         metric_key="ok",
         progress_every_n=PROGRESS_EVERY_N,
-        missing_after_chunk=missing_after_chunk,
+        missing_after_chunk=writer.after_flush(missing_after_chunk),
         t0=t0,
+        skipped=lambda: targets.skipped,
+        controller=controller,
     )
 
     add_ok, remaining = core_run_retry_passes(
         failed_ids,
         workers=workers,
         rounds=SECOND_PASSES,
-        submit_chunk_retry=lambda ex, ids: submit_chunk(ex, ids, logger=logger),
-        have_in_db=db_have_chain_ids,
+        submit_chunk_retry=lambda ex, ids: submit_chunk(
+            ex, ids, logger=logger, controller=controller, writer=writer
+        ),
+        have_in_db=writer.after_flush(db_have_chain_ids),
         progress=progress,
         metric_key="ok",
         t0=t0,
+        controller=controller,
     )
+    return ok + add_ok, remaining
 
-    elapsed = round(time.perf_counter() - t0, 2)
-    return {
-        "ok": ok + add_ok,
-        "skipped": skipped,
-        "failed": len(remaining),
-        "total": total,
-        "elapsed": elapsed,
-    }
\ No newline at end of file
+
+async def _run_passes_async(
+    targets: core_TargetStream,
+    *,
+    total: int,
+    concurrency: int,
+    batch_size: int,
+    sleep_between_batches: float,
+    progress: ProgressFn,
+    logger: LogFn,
+    t0: float,
+    writer: BatchWriter,
+    controller: Optional[AimdController] = None,
+) -> Tuple[int, List[int]]:
+    """Asyncio passes sharing one `AsyncClient`; returns (ok, remaining_ids)."""
+    async with AsyncClient(concurrency=concurrency) as api:
+        ok, failed_ids, _ = await core_arun_stream_pass(
+            core_aiter_chunks(targets),  # index pages keep arriving while the loop runs
+            total=total,
+            concurrency=concurrency,
+            batch_size=batch_size,
+            sleep_between_batches=sleep_between_batches,
+            run_one=make_async_runner(api, logger=logger, controller=controller, writer=writer),
+            progress=progress,
+            metric_key="ok",
+            progress_every_n=PROGRESS_EVERY_N,
+            missing_after_chunk=writer.after_flush(missing_after_chunk),
+            t0=t0,
+            skipped=lambda: targets.skipped,
+            controller=controller,
+        )
+
+        add_ok, remaining = await core_arun_retry_passes(
+            failed_ids,
+            concurrency=concurrency,
+            rounds=SECOND_PASSES,
+            run_one_retry=make_async_runner(api, logger=logger, controller=controller, writer=writer),
+            have_in_db=writer.after_flush(db_have_chain_ids),
+            progress=progress,
+            metric_key="ok",
+            t0=t0,
+            controller=controller,
+        )
+    return ok + add_ok, remaining
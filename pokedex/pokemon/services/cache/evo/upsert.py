@@ -4,11 +4,13 @@ Evolution-chain upsert helpers.
 
 - upsert_evo_chain(chain_id): fetch /evolution-chain/<id>/, extract species IDs,
   upsert EvolutionChainCache and (optionally) backfill PokemonCache.evolution_chain_id.
+  Split into fetch_evo_chain (network, no transaction) + write_evo_chain (DB only).
 - safe_upsert_evo_chain(...): resilient wrapper with retries, backoff and logging.
 """
 
 import random
 import time
+from dataclasses import dataclass
 from typing import Callable, List, Optional
 
 from django.db import transaction
@@ -28,8 +30,15 @@ def _model_has_field(model, name: str) -> bool:
     return any(getattr(f, "name", "") == name for f in model._meta.get_fields())
 
 
-@transaction.atomic
-def upsert_evo_chain(chain_id: int) -> None:
+@dataclass
+class EvoChainRecord:
+    """A fetched evolution chain, ready for `write_evo_chain`."""
+    chain_id: int
+    species_ids: List[int]
+
+
+def fetch_evo_chain(chain_id: int) -> EvoChainRecord:
+    """Fetch and validate `/evolution-chain/<id>/`. Network only, no transaction."""
     evo_raw = get_json(url("evolution-chain", chain_id))
     if not evo_raw or "chain" not in evo_raw:
         raise ValueError(f"Malformed evolution-chain payload for id={chain_id}")
@@ -37,7 +46,12 @@ def upsert_evo_chain(chain_id: int) -> None:
     species_ids: List[int] = species_ids_from_raw(evo_raw)
     if not species_ids:
         raise ValueError(f"No species_ids extracted for chain id={chain_id}")
+    return EvoChainRecord(chain_id=chain_id, species_ids=species_ids)
+
 
+@transaction.atomic
+def write_evo_chain(record: EvoChainRecord) -> None:
+    chain_id, species_ids = record.chain_id, record.species_ids
     EvolutionChainCache.objects.update_or_create(
         chain_id=chain_id,
         defaults={"species_ids": species_ids, "root_species_id": species_ids[0]},
@@ -59,6 +73,11 @@ def upsert_evo_chain(chain_id: int) -> None:
             PokemonCache.objects.bulk_update(to_update, ["evolution_chain_id"], batch_size=500)
 
 
+def upsert_evo_chain(chain_id: int) -> None:
+    """Fetch, then write in a short transaction (no lock held during network I/O)."""
+    write_evo_chain(fetch_evo_chain(chain_id))
+
+
 def safe_upsert_evo_chain(
     chain_id: int,
     attempts: int = 4,
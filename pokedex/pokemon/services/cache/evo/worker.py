@@ -1,19 +1,40 @@
 from __future__ import annotations
 """
 ThreadPool worker for evolution-chains.
-Builds a safe runner for upserts with retry + backoff.
+Builds a safe runner for upserts with retry + backoff
+(and its async twin for the asyncio passes).
 """
 
 from concurrent.futures import ThreadPoolExecutor
-from typing import Sequence
-from ..core.worker import make_safe_runner, submit_chunk as _submit
+from typing import Optional, Sequence
+from pokemon.services.api import url
+from ..core.worker import make_async_safe_runner, make_safe_runner, submit_chunk as _submit
+from ..core.aimd import AimdController
 from ..core.constants import LogFn
-from .upsert import upsert_evo_chain
+from ..core.writer import BatchWriter
+from .upsert import fetch_evo_chain, upsert_evo_chain
 
 
 ATTEMPTS_DEFAULT = 4
 
 
-def submit_chunk(ex: ThreadPoolExecutor, ids: Sequence[int], *, logger: LogFn):
-    runner = make_safe_runner(upsert_evo_chain, attempts=ATTEMPTS_DEFAULT, logger=logger)
-    return _submit(ex, ids, runner=runner)
\ No newline at end of file
+def _upsert_fn(writer: Optional[BatchWriter]):
+    """With a writer, workers only fetch and queue; the writer commits in batches."""
+    return writer.stage(fetch_evo_chain) if writer is not None else upsert_evo_chain
+
+
+def submit_chunk(ex: ThreadPoolExecutor, ids: Sequence[int], *, logger: LogFn,
+                 controller: Optional[AimdController] = None, writer: Optional[BatchWriter] = None):
+    runner = make_safe_runner(_upsert_fn(writer), attempts=ATTEMPTS_DEFAULT, logger=logger,
+                              controller=controller)
+    return _submit(ex, ids, runner=runner)
+
+
+def make_async_runner(api, *, attempts: int = ATTEMPTS_DEFAULT, logger: LogFn,
+                      controller: Optional[AimdController] = None, writer: Optional[BatchWriter] = None):
+    """Fetch the chain through `api` (an `AsyncClient`), then upsert it from the cache."""
+    async def _fetch(chain_id: int) -> None:
+        await api.get_json(url("evolution-chain", chain_id))
+
+    return make_async_safe_runner(_fetch, _upsert_fn(writer), attempts=attempts, logger=logger,
+                                  controller=controller)
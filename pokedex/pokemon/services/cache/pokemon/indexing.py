@@ -1,12 +1,12 @@
 from ..core.indexing import (
-    get_total_count as _get_total_count,
+    index_pages as _index_pages,
     iter_index_ids as _iter_index_ids,
 )
 
 
-def get_pokedex_count() -> int:
-    return _get_total_count("pokemon")
+def iter_index_ids(batch_size: int):
+    return _iter_index_ids("pokemon", batch_size)
 
 
-def iter_index_ids(batch_size: int):
-    return _iter_index_ids("pokemon", batch_size)
\ No newline at end of file
+def iter_index_pages(batch_size: int):
+    return _index_pages("pokemon", batch_size)
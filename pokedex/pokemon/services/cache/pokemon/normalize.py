@@ -5,8 +5,8 @@ Pure helpers for shaping PokeAPI payloads.
 These functions have NO Django/DB dependencies.
 """
 
-from typing import Dict, Iterable, List, Tuple
-from pokemon.services.api import get_json
+from typing import Dict, Iterable, List, Sequence, Tuple
+from pokemon.services.api import get_json, get_json_many, url
 
 
 def stat_dict(stats: Iterable[dict]) -> Dict[str, int]:
@@ -50,4 +50,38 @@ def species_payload_for(pokemon_payload: dict) -> dict:
     Network: yes (but cached through services.api).
     """
     species_url = (pokemon_payload.get("species") or {}).get("url")
-    return get_json(species_url) if species_url else {}
\ No newline at end of file
+    return get_json(species_url) if species_url else {}
+
+
+def prefetch_pokemon_payloads(ids_or_names: Sequence[str | int]) -> None:
+    """
+    Warm the API cache for several upserts at once: all `/pokemon/<id>/`
+    payloads in one batch, then their species in a second batch.
+    Failures are ignored here; the per-item upsert reports them.
+
+    Network: yes (concurrent, cached through services.api).
+    """
+    if not ids_or_names:
+        return
+
+    pokemon = get_json_many([url("pokemon", i) for i in ids_or_names])
+    species_urls = [
+        (res.data.get("species") or {}).get("url")
+        for res in pokemon
+        if res.ok and isinstance(res.data, dict)
+    ]
+    get_json_many([u for u in species_urls if u])
+
+
+async def afetch_pokemon_payloads(api, id_or_name: str | int) -> None:
+    """
+    Warm the API cache for one upsert through an `AsyncClient`: the
+    `/pokemon/<id>/` payload, then its species. Errors propagate so the
+    async runner can retry.
+
+    Network: yes (awaited, cached through services.api).
+    """
+    d = await api.get_json(url("pokemon", id_or_name))
+    species_url = (d.get("species") or {}).get("url")
+    if species_url:
+        await api.get_json(species_url)
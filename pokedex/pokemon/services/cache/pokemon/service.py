@@ -3,11 +3,24 @@ from __future__ import annotations
 Bulk Pokédex sync orchestrator built from shared generic steps.
 """
 
+import asyncio
 import time
+from contextlib import closing
+from functools import partial
+from typing import List, Optional, Tuple
+
+from pokemon.services.api.aio import AsyncClient
+from ..core.aimd import AimdController, aimd_controller
+from ..core.writer import BatchWriter
+from ..core.async_steps import (
+    aiter_chunks as core_aiter_chunks,
+    arun_stream_pass as core_arun_stream_pass,
+    arun_retry_passes as core_arun_retry_passes,
+)
 from ..core.steps import (
-    enumerate_ids as core_enumerate_ids,
-    select_targets as core_select_targets,
-    run_main_pass as core_run_main_pass,
+    enumerate_pages as core_enumerate_pages,
+    TargetStream as core_TargetStream,
+    run_stream_pass as core_run_stream_pass,
     run_retry_passes as core_run_retry_passes,
 )
 from ..core.constants import (
@@ -16,13 +29,15 @@ from ..core.constants import (
     SECOND_PASSES,
     UPSERT_ATTEMPTS,
     PROGRESS_EVERY_N,
+    ASYNC_CONCURRENCY_DEFAULT,
     ProgressFn,
     LogFn,
 )
 
-from .indexing import iter_index_ids
+from .indexing import iter_index_pages
 from .dbutils import db_have_ids, missing_after_chunk
-from .worker import submit_chunk
+from .upsert import write_pokemon, write_pokemon_batch
+from .worker import make_async_runner, submit_chunk
 
 
 def sync_all_pokemon(
@@ -33,36 +48,114 @@ def sync_all_pokemon(
     progress: ProgressFn = None,
     *,
     logger: LogFn = None,
+    async_mode: bool = False,
+    concurrency: int = ASYNC_CONCURRENCY_DEFAULT,
 ) -> dict:
     """
     Fetch/refresh ALL Pokémon into the local DB cache.
     Taxonomies are not created here; upsert links to what already exists.
+
+    With `async_mode`, the main and retry passes run on an event loop
+    (`services.api.aio.AsyncClient`) with up to `concurrency` requests in
+    flight instead of `workers` threads.
+
+    Unless settings `POKEAPI_SYNC_CONCURRENCY["ADAPTIVE"]` is off, an AIMD
+    controller (`core.aimd`) starts at `workers` (or a quarter of
+    `concurrency`) and tunes the in-flight limit live; its final value is
+    returned as "limit".
+
+    Workers only fetch and normalize; one `BatchWriter` thread commits the
+    records in set-based batches (`write_pokemon_batch`), so no transaction
+    waits on the network.
     """
-    # 1) enumerate IDs (generic)
-    all_ids, t0 = core_enumerate_ids(iter_index_ids, batch_size, progress)
-    total = len(all_ids)
-    if total == 0:
+    # 1) stream index pages (generic): the first page gives the count, the rest
+    #    arrive concurrently while earlier pages are already being upserted
+    count, pages, t0 = core_enumerate_pages(iter_index_pages, batch_size, progress)
+    if count == 0:
         return {"synced": 0, "skipped": 0, "failed": 0, "total": 0, "elapsed": 0.0}
 
-    # 2) choose targets (generic)
-    existing = db_have_ids(all_ids)
-    targets, skipped = core_select_targets(all_ids, existing, only_missing)
-    if not targets:
-        elapsed = round(time.perf_counter() - t0, 2)
-        return {"synced": 0, "skipped": skipped, "failed": 0, "total": total, "elapsed": elapsed}
+    # 2) choose targets page by page (generic)
+    targets = core_TargetStream(pages, db_have_ids, only_missing)
+
+    # 3+4) main + retry passes (thread pool, or an event loop with `async_mode`)
+    writer = BatchWriter(
+        partial(write_pokemon, logger=logger),
+        batch_fn=partial(write_pokemon_batch, logger=logger),
+        logger=logger,
+    )
+    if async_mode:
+        controller = aimd_controller(max(1, concurrency // 4), max_limit=concurrency)
+        with closing(targets), writer:  # closing: stop pending index fetches on error
+            synced, remaining = asyncio.run(_run_passes_async(
+                targets,
+                total=count,
+                concurrency=concurrency,
+                batch_size=batch_size,
+                sleep_between_batches=sleep_between_batches,
+                progress=progress,
+                logger=logger,
+                t0=t0,
+                writer=writer,
+                controller=controller,
+            ))
+    else:
+        controller = aimd_controller(workers, max_limit=workers)
+        with closing(targets), writer:
+            synced, remaining = _run_passes(
+                targets,
+                total=count,
+                workers=workers,
+                batch_size=batch_size,
+                sleep_between_batches=sleep_between_batches,
+                progress=progress,
+                logger=logger,
+                t0=t0,
+                writer=writer,
+                controller=controller,
+            )
+
+    elapsed = round(time.perf_counter() - t0, 2)
+    return {
+        "synced": synced,
+        "skipped": targets.skipped,
+        "failed": len(remaining),
+        "total": count,
+        "elapsed": elapsed,
+        "limit": controller.limit if controller is not None else None,
+    }
+
 
+def _run_passes(
+    targets: core_TargetStream,
+    *,
+    total: int,
+    workers: int,
+    batch_size: int,
+    sleep_between_batches: float,
+    progress: ProgressFn,
+    logger: LogFn,
+    t0: float,
+    writer: BatchWriter,
+    controller: Optional[AimdController] = None,
+) -> Tuple[int, List[int]]:
+    """Thread-pool passes; returns (synced, remaining_ids)."""
     # 3) main pass (generic runner + Pokémon worker/missing fns)
-    synced, failed_ids, _ = core_run_main_pass(
+    synced, failed_ids, _ = core_run_stream_pass(
         targets,
+        total=total,
+        batches=max(1, (total + batch_size - 1) // batch_size),
         workers=workers,
-        batch_size=batch_size,
         sleep_between_batches=sleep_between_batches,
-        submit_chunk=lambda ex, chunk: submit_chunk(ex, chunk, attempts=UPSERT_ATTEMPTS, logger=logger),
+        submit_chunk=lambda ex, chunk: submit_chunk(
+            ex, chunk, attempts=UPSERT_ATTEMPTS, logger=logger, controller=controller, writer=writer
+        ),
         progress=progress,
         metric_key="synced",
         progress_every_n=PROGRESS_EVERY_N,
-        missing_after_chunk=missing_after_chunk,
+        missing_after_chunk=writer.after_flush(missing_after_chunk),
         t0=t0,
+        skipped=lambda: targets.skipped,
+        controller=controller,
     )
 
     # 4) retry passes (generic)
@@ -71,19 +164,63 @@ def sync_all_pokemon(
         workers=workers,
         rounds=SECOND_PASSES,
         submit_chunk_retry=lambda ex, ids: submit_chunk(
-            ex, ids, attempts=max(1, UPSERT_ATTEMPTS // 2), logger=logger
+            ex, ids, attempts=max(1, UPSERT_ATTEMPTS // 2), logger=logger,
+            controller=controller, writer=writer,
         ),
-        have_in_db=db_have_ids,
+        have_in_db=writer.after_flush(db_have_ids),
         progress=progress,
         metric_key="synced",
         t0=t0,
+        controller=controller,
     )
+    return synced + add_synced, remaining
 
-    elapsed = round(time.perf_counter() - t0, 2)
-    return {
-        "synced": synced + add_synced,
-        "skipped": skipped,
-        "failed": len(remaining),
-        "total": total,
-        "elapsed": elapsed,
-    }
\ No newline at end of file
+
+async def _run_passes_async(
+    targets: core_TargetStream,
+    *,
+    total: int,
+    concurrency: int,
+    batch_size: int,
+    sleep_between_batches: float,
+    progress: ProgressFn,
+    logger: LogFn,
+    t0: float,
+    writer: BatchWriter,
+    controller: Optional[AimdController] = None,
+) -> Tuple[int, List[int]]:
+    """Asyncio passes sharing one `AsyncClient`; returns (synced, remaining_ids)."""
+    async with AsyncClient(concurrency=concurrency) as api:
+        synced, failed_ids, _ = await core_arun_stream_pass(
+            core_aiter_chunks(targets),  # index pages keep arriving while the loop runs
+            total=total,
+            concurrency=concurrency,
+            batch_size=batch_size,
+            sleep_between_batches=sleep_between_batches,
+            run_one=make_async_runner(
+                api, attempts=UPSERT_ATTEMPTS, logger=logger, controller=controller, writer=writer
+            ),
+            progress=progress,
+            metric_key="synced",
+            progress_every_n=PROGRESS_EVERY_N,
+            missing_after_chunk=writer.after_flush(missing_after_chunk),
+            t0=t0,
+            skipped=lambda: targets.skipped,
+            controller=controller,
+        )
+
+        add_synced, remaining = await core_arun_retry_passes(
+            failed_ids,
+            concurrency=concurrency,
+            rounds=SECOND_PASSES,
+            run_one_retry=make_async_runner(
+                api, attempts=max(1, UPSERT_ATTEMPTS // 2), logger=logger,
+                controller=controller, writer=writer,
+            ),
+            have_in_db=writer.after_flush(db_have_ids),
+            progress=progress,
+            metric_key="synced",
+            t0=t0,
+            controller=controller,
+        )
+    return synced + add_synced, remaining
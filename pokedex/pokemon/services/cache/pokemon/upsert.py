@@ -1,9 +1,17 @@
 from __future__ import annotations
 """
 Upsert a single Pokémon into the local cache (DB).
+
+Two stages, so network I/O never runs inside a transaction:
+- fetch_pokemon(id)     : PokeAPI payloads → `PokemonRecord` (no DB writes)
+- write_pokemon(record) : `PokemonRecord` → PokemonCache row + M2M links (DB only)
+
+Bulk syncs write whole batches with `write_pokemon_batch`: set-based, so the
+statement count depends on the batch, not on the number of Pokémon.
 """
 
-from typing import Callable, List, Optional, Sequence, Tuple
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
 
 from django.db import transaction
 from pokemon.models import PokemonCache, Type, Ability, Generation
@@ -32,15 +40,14 @@ def _existing_ids_for(model, slugs: Sequence[str]) -> Tuple[List[int], List[str]
     return found_ids, missing
 
 
-def _generation_from_species(species: dict) -> Tuple[Optional[Generation], Optional[str]]:
+def _generation_for(gen_slug: Optional[str]) -> Tuple[Optional[Generation], Optional[str]]:
     """
-    Find Generation object by slug from species payload. Does NOT create anything.
+    Find Generation object by slug. Does NOT create anything.
 
     Returns
     -------
     (generation_obj_or_none, missing_slug_or_none)
     """
-    gen_slug = ((species.get("generation") or {}).get("name")) or None
     if not gen_slug:
         return None, None
     obj = Generation.objects.filter(slug=gen_slug).first()
@@ -52,59 +59,110 @@ def _warn(log: LogFn, msg: str) -> None:
         log(msg)
 
 
-@transaction.atomic
-def upsert_pokemon_from_api(
-    id_or_name: str | int,
-    *,
-    logger: LogFn = None,
-) -> PokemonCache:
+def _slug_map(model, slugs: Iterable[str]) -> Dict[str, int]:
+    """{slug: id} for the existing rows among `slugs` (one query)."""
+    wanted = set(slugs)
+    if not wanted:
+        return {}
+    return dict(model.objects.filter(slug__in=wanted).values_list("slug", "id"))
+
+
+def _sync_links(m2m, wanted: Dict[int, Set[int]]) -> None:
     """
-    Fetch a Pokémon from PokeAPI and upsert it into the local thin cache.
+    Make the auto-created through table of `m2m` (e.g. `PokemonCache.types`)
+    hold exactly `wanted` ({owner_id: {target_id}}) for the owners listed:
+    one select, at most one delete and one insert.
+    """
+    through = m2m.through
+    src = m2m.field.m2m_field_name() + "_id"
+    dst = m2m.field.m2m_reverse_field_name() + "_id"
 
-    Behavior
-    --------
-    - Does NOT create taxonomies (Type/Ability/Generation). It only links to ones
-      already present in DB. Missing slugs are reported via `logger`.
+    stale: List[int] = []
+    present: Set[Tuple[int, int]] = set()
+    rows = through.objects.filter(**{f"{src}__in": list(wanted)}).values_list("id", src, dst)
+    for row_id, owner, target in rows:
+        if target in wanted[owner]:
+            present.add((owner, target))
+        else:
+            stale.append(row_id)
 
-    Parameters
-    ----------
-    id_or_name : int | str
-        PokeAPI identifier (e.g. 25 or "pikachu").
-    logger : callable | None
-        Optional sink for warnings (e.g. `self.stdout.write`).
+    if stale:
+        through.objects.filter(id__in=stale).delete()
+    new_rows = [
+        through(**{src: owner, dst: target})
+        for owner, targets in wanted.items()
+        for target in targets
+        if (owner, target) not in present
+    ]
+    if new_rows:
+        through.objects.bulk_create(new_rows, ignore_conflicts=True)
 
-    Returns
-    -------
-    PokemonCache
-        The upserted instance.
+
+@dataclass
+class PokemonRecord:
+    """Everything `write_pokemon` needs, normalized from the PokeAPI payloads."""
+    pokeapi_id: int
+    name: str
+    height: Optional[int] = None
+    weight: Optional[int] = None
+    base_stats: Dict[str, int] = field(default_factory=dict)
+    generation_slug: Optional[str] = None
+    is_legendary: bool = False
+    is_mythical: bool = False
+    type_slugs: List[str] = field(default_factory=list)
+    ability_slugs: List[str] = field(default_factory=list)
+
+
+def fetch_pokemon(id_or_name: str | int) -> PokemonRecord:
     """
-    # 1) `/pokemon/<id-or-name>`
-    d = get_json(url("pokemon", id_or_name))
+    Fetch `/pokemon/<id-or-name>` and its species, and normalize them.
 
-    # 2) species → generation/flags
+    Network: yes (cached through services.api). Opens no transaction.
+    """
+    d = get_json(url("pokemon", id_or_name))
     species = species_payload_for(d)
-    gen_obj, missing_gen = _generation_from_species(species)
-    is_legendary = bool(species.get("is_legendary", False))
-    is_mythical = bool(species.get("is_mythical", False))
+    type_slugs, ability_slugs = taxonomy_slugs_from_payload(d)
+    return PokemonRecord(
+        pokeapi_id=d["id"],
+        name=d.get("name") or "",
+        height=d.get("height"),
+        weight=d.get("weight"),
+        base_stats=stat_dict(d.get("stats") or []),
+        generation_slug=((species.get("generation") or {}).get("name")) or None,
+        is_legendary=bool(species.get("is_legendary", False)),
+        is_mythical=bool(species.get("is_mythical", False)),
+        type_slugs=type_slugs,
+        ability_slugs=ability_slugs,
+    )
+
+
+@transaction.atomic
+def write_pokemon(record: PokemonRecord, *, logger: LogFn = None) -> PokemonCache:
+    """
+    Upsert a fetched `PokemonRecord` into the local thin cache.
 
-    # 3) Base row
+    Does NOT create taxonomies (Type/Ability/Generation). It only links to
+    ones already present in DB. Missing slugs are reported via `logger`.
+    """
+    gen_obj, missing_gen = _generation_for(record.generation_slug)
+
+    # Base row
     p, _ = PokemonCache.objects.update_or_create(
-        pokeapi_id=d["id"],
+        pokeapi_id=record.pokeapi_id,
         defaults={
-            "name": d.get("name") or "",
-            "height": d.get("height"),
-            "weight": d.get("weight"),
-            "base_stats": stat_dict(d.get("stats") or []),
+            "name": record.name,
+            "height": record.height,
+            "weight": record.weight,
+            "base_stats": record.base_stats,
             "generation": gen_obj,  # may be None if generation not synced yet
-            "is_legendary": is_legendary,
-            "is_mythical": is_mythical,
+            "is_legendary": record.is_legendary,
+            "is_mythical": record.is_mythical,
         },
     )
 
-    # 4) M2M: link ONLY existing taxonomies
-    type_slugs, ability_slugs = taxonomy_slugs_from_payload(d)
-    type_ids, missing_types = _existing_ids_for(Type, type_slugs)
-    ability_ids, missing_abilities = _existing_ids_for(Ability, ability_slugs)
+    # M2M: link ONLY existing taxonomies
+    type_ids, missing_types = _existing_ids_for(Type, record.type_slugs)
+    ability_ids, missing_abilities = _existing_ids_for(Ability, record.ability_slugs)
 
     if type_ids:
         p.types.set(type_ids)
@@ -126,4 +184,98 @@ def upsert_pokemon_from_api(
     if missing_gen:
         _warn(logger, f"[warn] Missing Generation '{missing_gen}' for Pokémon #{p.pokeapi_id} {p.name}")
 
-    return p
\ No newline at end of file
+    return p
+
+
+_BULK_UPDATE_FIELDS = [
+    "name", "height", "weight", "base_stats", "generation",
+    "is_legendary", "is_mythical", "updated_at",
+]
+
+
+@transaction.atomic
+def write_pokemon_batch(records: Sequence[PokemonRecord], *, logger: LogFn = None) -> int:
+    """
+    Set-based `write_pokemon` for many records; returns the number of rows written.
+
+    A handful of statements per batch instead of ~8 per Pokémon: one lookup
+    per taxonomy, one `INSERT … ON CONFLICT (pokeapi_id) DO UPDATE`, one id
+    lookup, then the type/ability through rows are diffed and changed with a
+    bulk delete + bulk insert. Same linking rules and warnings as
+    `write_pokemon` (later records win on duplicate IDs).
+    """
+    by_id = {r.pokeapi_id: r for r in records}
+    if not by_id:
+        return 0
+    batch = list(by_id.values())
+
+    gens = _slug_map(Generation, (r.generation_slug for r in batch if r.generation_slug))
+    types = _slug_map(Type, (s for r in batch for s in r.type_slugs))
+    abilities = _slug_map(Ability, (s for r in batch for s in r.ability_slugs))
+
+    PokemonCache.objects.bulk_create(
+        [
+            PokemonCache(
+                pokeapi_id=r.pokeapi_id,
+                name=r.name,
+                height=r.height,
+                weight=r.weight,
+                base_stats=r.base_stats,
+                generation_id=gens.get(r.generation_slug) if r.generation_slug else None,
+                is_legendary=r.is_legendary,
+                is_mythical=r.is_mythical,
+            )
+            for r in batch
+        ],
+        update_conflicts=True,
+        unique_fields=["pokeapi_id"],
+        update_fields=_BULK_UPDATE_FIELDS,
+    )
+    pk_for = dict(PokemonCache.objects.filter(pokeapi_id__in=list(by_id)).values_list("pokeapi_id", "id"))
+
+    _sync_links(PokemonCache.types, {
+        pk_for[r.pokeapi_id]: {types[s] for s in r.type_slugs if s in types} for r in batch
+    })
+    _sync_links(PokemonCache.abilities, {
+        pk_for[r.pokeapi_id]: {abilities[s] for s in r.ability_slugs if s in abilities} for r in batch
+    })
+
+    for r in batch:
+        for mt in (s for s in r.type_slugs if s not in types):
+            _warn(logger, f"[warn] Missing Type '{mt}' for Pokémon #{r.pokeapi_id} {r.name}")
+        for ma in (s for s in r.ability_slugs if s not in abilities):
+            _warn(logger, f"[warn] Missing Ability '{ma}' for Pokémon #{r.pokeapi_id} {r.name}")
+        if r.generation_slug and r.generation_slug not in gens:
+            _warn(logger, f"[warn] Missing Generation '{r.generation_slug}' for Pokémon #{r.pokeapi_id} {r.name}")
+
+    return len(batch)
+
+
+def upsert_pokemon_from_api(
+    id_or_name: str | int,
+    *,
+    logger: LogFn = None,
+) -> PokemonCache:
+    """
+    Fetch a Pokémon from PokeAPI and upsert it into the local thin cache.
+
+    Behavior
+    --------
+    - Network first (`fetch_pokemon`), then one short transaction
+      (`write_pokemon`); no lock is held while waiting on PokeAPI.
+    - Does NOT create taxonomies (Type/Ability/Generation). It only links to ones
+      already present in DB. Missing slugs are reported via `logger`.
+
+    Parameters
+    ----------
+    id_or_name : int | str
+        PokeAPI identifier (e.g. 25 or "pikachu").
+    logger : callable | None
+        Optional sink for warnings (e.g. `self.stdout.write`).
+
+    Returns
+    -------
+    PokemonCache
+        The upserted instance.
+    """
+    return write_pokemon(fetch_pokemon(id_or_name), logger=logger)
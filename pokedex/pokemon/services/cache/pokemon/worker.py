@@ -1,9 +1,13 @@
 from __future__ import annotations
 from concurrent.futures import ThreadPoolExecutor
-from typing import Sequence
+from functools import partial
+from typing import Optional, Sequence
 
-from .upsert import upsert_pokemon_from_api
-from ..core.worker import make_safe_runner, submit_chunk as _submit
+from .normalize import afetch_pokemon_payloads
+from .upsert import fetch_pokemon, upsert_pokemon_from_api
+from ..core.worker import make_async_safe_runner, make_safe_runner, submit_chunk as _submit
+from ..core.aimd import AimdController
+from ..core.writer import BatchWriter
 from ..core.constants import LogFn
 
 
@@ -13,10 +17,36 @@ def submit_chunk(
     *,
     attempts: int,
     logger: LogFn,
+    controller: Optional[AimdController] = None,
+    writer: Optional[BatchWriter] = None,
 ):
     """
-    Prepare a resilient runner (retries + backoff) for the Pokémon upsert
-    and submit a chunk of IDs to the executor.
+    Prepare a resilient runner (retries + backoff, gated by the AIMD
+    `controller` if any) for the Pokémon upsert and submit a chunk of IDs
+    to the executor. With a `writer`, workers only fetch and queue records;
+    the writer commits them in batches.
     """
-    runner = make_safe_runner(upsert_pokemon_from_api, attempts=attempts, logger=logger)
-    return _submit(ex, ids, runner=runner)
\ No newline at end of file
+    runner = make_safe_runner(_upsert_fn(writer), attempts=attempts, logger=logger, controller=controller)
+    return _submit(ex, ids, runner=runner)
+
+
+def _upsert_fn(writer: Optional[BatchWriter]):
+    return writer.stage(fetch_pokemon) if writer is not None else upsert_pokemon_from_api
+
+
+def make_async_runner(
+    api,
+    *,
+    attempts: int,
+    logger: LogFn,
+    controller: Optional[AimdController] = None,
+    writer: Optional[BatchWriter] = None,
+):
+    """
+    Async runner for the asyncio passes: fetch the Pokémon and species
+    payloads through `api` (an `AsyncClient`), then upsert from the cache.
+    """
+    return make_async_safe_runner(
+        partial(afetch_pokemon_payloads, api), _upsert_fn(writer),
+        attempts=attempts, logger=logger, controller=controller,
+    )
@@ -8,7 +8,7 @@ def fetch_encounters(pokeapi_id: int) -> List[Dict[str, Any]]:
     Fetch and normalize Pokémon encounter data.
     Returns a list of {location_area, versions:[{version, max_chance}, ...]}.
     """
-    data = get_json(url("pokemon", pokeapi_id) + "encounters")
+    data = get_json(url("pokemon", pokeapi_id) + "encounters", hedge=True)
     out: List[Dict[str, Any]] = []
     for row in data or []:
         loc_name = (row.get("location_area") or {}).get("name")
@@ -1,40 +1,51 @@
 from __future__ import annotations
-from functools import lru_cache
-from typing import List
+from typing import Dict, List, Optional, Sequence
 
-from .types import Group, FetchMoveFn, JSON
+from .types import Group, FetchMoveFn, FetchMovesFn, JSON
 
 
-@lru_cache(maxsize=2048)
-def _default_fetch_move(mid: int) -> JSON:
-    from pokemon.services.api import get_json, url
-    return get_json(url("move", mid))
+def _default_fetch_moves(mids: Sequence[int]) -> Dict[int, JSON]:
+    # One cache query + concurrent upstream misses instead of N sequential lookups.
+    from pokemon.services.api import get_json_many, url
+    results = get_json_many([url("move", mid) for mid in mids])
+    return {mid: res.data for mid, res in zip(mids, results) if res.ok}
 
 
 def annotate_some_moves(
     grouped: List[Group],
     per_group: int = 10,
     *,
-    fetch: FetchMoveFn = _default_fetch_move,
+    fetch: Optional[FetchMoveFn] = None,
+    fetch_many: FetchMovesFn = _default_fetch_moves,
 ) -> List[Group]:
     """
     Annotate first N moves per group with type/power/accuracy/pp/damage_class.
+
+    Move payloads are loaded in one batch via `fetch_many`; pass `fetch` to
+    resolve moves one by one instead (e.g. a custom source).
     """
-    for g in grouped:
-        for i, m in enumerate(g.get("items", ())):
-            if i >= per_group:
-                break
-
-            try:
-                d = fetch(int(m["id"]))
-                m.update({
-                    "type": (d.get("type") or {}).get("name"),
-                    "power": d.get("power"),
-                    "accuracy": d.get("accuracy"),
-                    "pp": d.get("pp"),
-                    "damage_class": (d.get("damage_class") or {}).get("name"),
-                })
-            except Exception:
-                continue
-
-    return grouped
\ No newline at end of file
+    picked = [m for g in grouped for m in list(g.get("items", ()))[:per_group]]
+
+    if fetch is None:
+        try:
+            by_id = fetch_many(list(dict.fromkeys(int(m["id"]) for m in picked)))
+        except Exception:
+            return grouped
+    else:
+        by_id = {}
+
+    for m in picked:
+        try:
+            mid = int(m["id"])
+            d = by_id[mid] if fetch is None else fetch(mid)
+            m.update({
+                "type": (d.get("type") or {}).get("name"),
+                "power": d.get("power"),
+                "accuracy": d.get("accuracy"),
+                "pp": d.get("pp"),
+                "damage_class": (d.get("damage_class") or {}).get("name"),
+            })
+        except Exception:
+            continue
+
+    return grouped
@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import Any, Dict, Callable
+from typing import Any, Dict, Callable, Sequence
 
 
 JSON = Dict[str, Any]
@@ -7,4 +7,5 @@ MoveRow = Dict[str, Any]
 MoveItem = Dict[str, Any]
 Group = Dict[str, Any]
 
-FetchMoveFn = Callable[[int], JSON]
\ No newline at end of file
+FetchMoveFn = Callable[[int], JSON]
+FetchMovesFn = Callable[[Sequence[int]], Dict[int, JSON]]
\ No newline at end of file
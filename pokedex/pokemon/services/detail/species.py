@@ -16,8 +16,8 @@ GENERATION_TO_REGION = {
 
 
 def fetch_species(pokeapi_id: int) -> Dict[str, Any]:
-    """Fetch and cache /pokemon-species/{id}/ payload."""
-    return get_json(url("pokemon-species", pokeapi_id))
+    """Fetch and cache /pokemon-species/{id}/ payload (hedged: interactive path)."""
+    return get_json(url("pokemon-species", pokeapi_id), hedge=True)
 
 
 def pick_english_text(entries: List[Dict[str, Any]], key: str) -> Optional[str]:
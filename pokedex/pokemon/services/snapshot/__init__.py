@@ -0,0 +1,13 @@
+from __future__ import annotations
+"""
+Offline dataset snapshots.
+
+Pack the PokeAPI caches and taxonomy tables into one versioned file
+(`export_snapshot`) and load it into a fresh database without network
+access (`import_snapshot`).
+"""
+
+from .writer import export_snapshot
+from .reader import import_snapshot, SnapshotError
+
+__all__ = ["export_snapshot", "import_snapshot", "SnapshotError"]
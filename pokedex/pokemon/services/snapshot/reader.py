@@ -0,0 +1,140 @@
+from __future__ import annotations
+"""
+Import a snapshot written by `writer.export_snapshot` into the database.
+
+The whole file is verified (format, version, checksums, row counts) before
+anything is written; rows are then bulk-inserted in a single transaction.
+No network access is needed.
+
+Older versions (`READABLE_VERSIONS`) are imported too: tables they do not
+contain are left empty, and columns they lack take their default (or the
+value derived in `tables.DERIVED_COLUMNS`).
+
+Note: `auto_now` timestamps (`fetched_at`, `updated_at`) are set to the
+import time by the ORM.
+"""
+
+import hashlib
+import json
+import zipfile
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+from django.core.management.color import no_style
+from django.db import connection, transaction
+
+from .tables import DERIVED_COLUMNS, SNAPSHOT_MODELS, fields_for, load_value, table_name
+from .writer import FORMAT, MANIFEST, VERSION
+
+BATCH_SIZE = 500
+READABLE_VERSIONS = (1, VERSION)  # 1: before the ApiResourceAlias table / resource column
+
+LogFn = Optional[Callable[[str], None]]
+
+
+class SnapshotError(Exception):
+    """Raised for unreadable, incompatible or corrupted snapshot files."""
+
+
+def read_manifest(zf: zipfile.ZipFile) -> Dict[str, Any]:
+    try:
+        manifest = json.loads(zf.read(MANIFEST))
+    except KeyError:
+        raise SnapshotError("Missing manifest.json — not a snapshot file.") from None
+
+    if manifest.get("format") != FORMAT:
+        raise SnapshotError(f"Unknown snapshot format {manifest.get('format')!r}.")
+    if manifest.get("version") not in READABLE_VERSIONS:
+        raise SnapshotError(
+            f"Unsupported snapshot version {manifest.get('version')!r} "
+            f"(readable: {', '.join(map(str, READABLE_VERSIONS))})."
+        )
+    return manifest
+
+
+def verify(zf: zipfile.ZipFile, manifest: Dict[str, Any]) -> None:
+    """Check every table's checksum and row count."""
+    for model in SNAPSHOT_MODELS:
+        name = table_name(model)
+        meta = manifest["tables"].get(name)
+        if meta is None:
+            if manifest["version"] == VERSION:
+                raise SnapshotError(f"Table {name} missing from snapshot.")
+            continue  # added after this snapshot's version → imported empty
+
+        digest = hashlib.sha256()
+        rows = 0
+        with zf.open(meta["file"]) as fh:
+            for line in fh:
+                digest.update(line)
+                rows += 1
+
+        if digest.hexdigest() != meta["sha256"] or rows != meta["rows"]:
+            raise SnapshotError(f"Checksum mismatch for {name}; the file is corrupted.")
+
+
+def is_empty() -> bool:
+    """True if none of the snapshot tables contain rows."""
+    return not any(model.objects.exists() for model in SNAPSHOT_MODELS)
+
+
+def import_snapshot(path: str | Path, *, replace: bool = False, logger: LogFn = None) -> Dict[str, int]:
+    """
+    Load the snapshot at `path`. Returns {table_label: inserted_rows}.
+
+    Refuses to import into non-empty tables unless `replace` is set, in which
+    case existing rows of all snapshot tables are deleted first.
+    """
+    with zipfile.ZipFile(path) as zf:
+        manifest = read_manifest(zf)
+        verify(zf, manifest)
+
+        if not replace and not is_empty():
+            raise SnapshotError("Target tables are not empty (use replace=True / --replace).")
+
+        counts: Dict[str, int] = {}
+        with transaction.atomic():
+            if replace:
+                for model in reversed(SNAPSHOT_MODELS):
+                    model.objects.all().delete()
+
+            for model in SNAPSHOT_MODELS:
+                name = table_name(model)
+                meta = manifest["tables"].get(name)
+                if meta is None:
+                    counts[name] = 0
+                    continue
+                cols = meta["columns"]
+                fields = fields_for(model, cols)
+                derived = {c: fn for c, fn in DERIVED_COLUMNS.get(model, {}).items() if c not in cols}
+
+                batch = []
+                inserted = 0
+                with zf.open(meta["file"]) as fh:
+                    for line in fh:
+                        values = json.loads(line)
+                        obj = model(**{
+                            c: load_value(f, v) for c, f, v in zip(cols, fields, values)
+                        })
+                        for c, fn in derived.items():
+                            setattr(obj, c, fn(obj))
+                        batch.append(obj)
+                        if len(batch) >= BATCH_SIZE:
+                            model.objects.bulk_create(batch)
+                            inserted += len(batch)
+                            batch = []
+
+                if batch:
+                    model.objects.bulk_create(batch)
+                    inserted += len(batch)
+
+                counts[name] = inserted
+                if logger:
+                    logger(f"[import] {name}: {inserted} rows")
+
+            # Explicit primary keys were inserted; move sequences past them.
+            with connection.cursor() as cursor:
+                for sql in connection.ops.sequence_reset_sql(no_style(), SNAPSHOT_MODELS):
+                    cursor.execute(sql)
+
+    return counts
@@ -0,0 +1,81 @@
+from __future__ import annotations
+"""
+Table registry and row (de)serialization for dataset snapshots.
+
+Rows are stored as JSON arrays in the order of the table's `columns`
+(concrete field attnames, primary key included so FKs/M2M stay valid).
+"""
+
+import base64
+from typing import Any, Callable, Dict, List, Sequence, Type
+
+from django.db import models
+from django.utils.dateparse import parse_date, parse_datetime
+
+from pokemon.models import (
+    Type as PokemonType,
+    Ability,
+    Generation,
+    PokemonCache,
+    EvolutionChainCache,
+    ApiResourceCache,
+    ApiResourceAlias,
+)
+from pokemon.services.api.urls import resource_of
+
+# Insert order (parents before children). Import deletes in reverse order.
+SNAPSHOT_MODELS: List[Type[models.Model]] = [
+    PokemonType,
+    Ability,
+    Generation,
+    PokemonCache,
+    PokemonCache.types.through,
+    PokemonCache.abilities.through,
+    EvolutionChainCache,
+    ApiResourceCache,
+    ApiResourceAlias,
+]
+
+
+# Columns older snapshots lack that can't be left at the field default:
+# {model: {attname: fn(instance) -> value}}. `bulk_create` skips `save()`.
+DERIVED_COLUMNS: Dict[Type[models.Model], Dict[str, Callable[[Any], Any]]] = {
+    ApiResourceCache: {"resource": lambda row: resource_of(row.url)},
+}
+
+
+def table_name(model: Type[models.Model]) -> str:
+    return model._meta.label_lower  # e.g. "pokemon.pokemoncache_types"
+
+
+def columns(model: Type[models.Model]) -> List[str]:
+    return [f.attname for f in model._meta.concrete_fields]
+
+
+def dump_value(field: models.Field, value: Any) -> Any:
+    """Make a DB value JSON-serializable."""
+    if value is None:
+        return None
+    if isinstance(field, models.BinaryField):
+        return base64.b64encode(bytes(value)).decode("ascii")
+    if isinstance(field, (models.DateTimeField, models.DateField)):
+        return value.isoformat()
+    return value
+
+
+def load_value(field: models.Field, value: Any) -> Any:
+    """Inverse of `dump_value`."""
+    if value is None:
+        return None
+    if isinstance(field, models.BinaryField):
+        return base64.b64decode(value)
+    if isinstance(field, models.DateTimeField):
+        return parse_datetime(value)
+    if isinstance(field, models.DateField):
+        return parse_date(value)
+    return value
+
+
+def fields_for(model: Type[models.Model], cols: Sequence[str]) -> List[models.Field]:
+    by_attname = {f.attname: f for f in model._meta.concrete_fields}
+    return [by_attname[c] for c in cols]
@@ -0,0 +1,69 @@
+from __future__ import annotations
+"""
+Export the cached dataset into a single versioned snapshot file.
+
+Layout (zip, deflated):
+- manifest.json        : format/version, creation time, per-table metadata
+- tables/<label>.jsonl : one JSON array per row, in `columns` order
+
+Each table entry in the manifest records its columns, row count and the
+SHA-256 of its member, so imports can verify the file before writing.
+"""
+
+import hashlib
+import json
+import zipfile
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+from django.utils import timezone
+
+from .tables import SNAPSHOT_MODELS, columns, dump_value, fields_for, table_name
+
+FORMAT = "pokedex-snapshot"
+VERSION = 2  # 2: ApiResourceAlias table, ApiResourceCache.resource column
+MANIFEST = "manifest.json"
+
+LogFn = Optional[Callable[[str], None]]
+
+
+def export_snapshot(path: str | Path, *, logger: LogFn = None) -> Dict[str, Any]:
+    """
+    Write all snapshot tables to `path` and return the manifest.
+    """
+    tables: Dict[str, Any] = {}
+
+    with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+        for model in SNAPSHOT_MODELS:
+            name = table_name(model)
+            cols = columns(model)
+            fields = fields_for(model, cols)
+            member = f"tables/{name}.jsonl"
+
+            digest = hashlib.sha256()
+            rows = 0
+            with zf.open(member, "w", force_zip64=True) as out:
+                qs = model.objects.order_by("pk").values_list(*cols)
+                for values in qs.iterator(chunk_size=1000):
+                    line = json.dumps(
+                        [dump_value(f, v) for f, v in zip(fields, values)],
+                        separators=(",", ":"),
+                        ensure_ascii=False,
+                    ).encode("utf-8") + b"\n"
+                    digest.update(line)
+                    out.write(line)
+                    rows += 1
+
+            tables[name] = {"file": member, "columns": cols, "rows": rows, "sha256": digest.hexdigest()}
+            if logger:
+                logger(f"[export] {name}: {rows} rows")
+
+        manifest = {
+            "format": FORMAT,
+            "version": VERSION,
+            "created_at": timezone.now().isoformat(),
+            "tables": tables,
+        }
+        zf.writestr(MANIFEST, json.dumps(manifest, indent=2))
+
+    return manifest
@@ -0,0 +1,101 @@
+import itertools
+import threading
+
+import pytest
+import requests
+
+from pokemon.services.api import rate_limiter
+from pokemon.services.cache.core import AimdController, run_main_pass, run_retry_passes
+from pokemon.services.cache.core import aimd
+
+
+@pytest.fixture(autouse=True)
+def steady_clock(monkeypatch):
+    """Every item takes exactly 0.1s."""
+    ticks = itertools.count(step=0.05)
+    monkeypatch.setattr(aimd, "_clock", lambda: next(ticks))
+
+
+def _http_error(status):
+    response = requests.Response()
+    response.status_code = status
+    return requests.HTTPError(f"{status}", response=response)
+
+
+def _fail(exc):
+    def _raise():
+        raise exc
+    return _raise
+
+
+def test_additive_increase_then_one_multiplicative_cut_per_window():
+    c = AimdController(4, max_limit=8)
+    for _ in range(4 + 5 + 6):  # ≈ one window per step: 4→5→6→7
+        c.call(lambda: None)
+    assert c.limit == 7 and c.increases == 3
+
+    for _ in range(3):  # a burst of 503s inside one window is one signal to act on
+        with pytest.raises(requests.HTTPError):
+            c.call(_fail(_http_error(503)))
+    assert c.limit == 3 and c.decreases == 1 and c.signals == 3
+
+    with pytest.raises(requests.HTTPError):
+        c.call(_fail(_http_error(404)))  # not a congestion signal
+    assert c.stats()["signals"] == 3 and c.in_flight == 0
+
+
+def test_rate_limiter_penalty_counts_as_congestion(monkeypatch):
+    c = AimdController(2)
+    c.call(lambda: None)
+    monkeypatch.setattr(rate_limiter, "penalties", rate_limiter.penalties + 1)
+    c.call(lambda: None)
+    assert c.limit == 1 and c.decreases == 1
+
+
+def test_progress_payloads_carry_the_live_limit():
+    c = AimdController(2, max_limit=4)
+    seen = []
+
+    def submit(ex, chunk):
+        return [ex.submit(lambda: c.call(lambda: True)) for _ in chunk]
+
+    run_main_pass(
+        list(range(1, 9)),
+        workers=99,
+        batch_size=4,
+        sleep_between_batches=0.0,
+        submit_chunk=submit,
+        progress=seen.append,
+        metric_key="synced",
+        progress_every_n=1,
+        missing_after_chunk=lambda chunk: set(),
+        t0=0.0,
+        controller=c,
+    )
+    assert all("limit" in p for p in seen)
+    assert seen[-1]["limit"] == c.limit > 2
+
+
+def test_workers_cap_the_pool_even_with_a_larger_controller():
+    c = AimdController(4, max_limit=32)
+    threads = set()
+
+    def submit(ex, ids):
+        def _one():
+            threads.add(threading.current_thread().name)
+            return c.call(lambda: True)
+        return [ex.submit(_one) for _ in ids]
+
+    run_main_pass(
+        list(range(1, 41)), workers=4, batch_size=20, sleep_between_batches=0.0, submit_chunk=submit,
+        progress=None, metric_key="synced", progress_every_n=1,
+        missing_after_chunk=lambda chunk: set(), t0=0.0, controller=c,
+    )
+    assert len(threads) <= 4
+
+    threads.clear()
+    run_retry_passes(
+        list(range(1, 41)), workers=4, rounds=1, submit_chunk_retry=submit,
+        have_in_db=lambda ids: set(ids), progress=None, metric_key="synced", t0=0.0, controller=c,
+    )
+    assert len(threads) <= 2
@@ -6,11 +6,15 @@ Exposes:
 - FakeSession: captures GET calls and returns a preconfigured FakeResponse.
 - freeze_now: freezes the cache layer's `_now()` for deterministic TTL math.
 - patch_session: patches the API client's `get_session()` to return a FakeSession.
+- url_session: like patch_session, but with a response per URL (UrlSession).
+- clear_memory_cache (autouse): empties the in-process payload cache between tests.
+- reset_circuit_breaker (autouse): closes all circuits between tests.
 """
 
 from __future__ import annotations
 
 import datetime as dt
+import json
 from typing import Any, Dict, List, Optional
 
 import pytest
@@ -55,6 +59,14 @@ class FakeResponse:
         """Return the configured JSON payload."""
         return self._json
 
+    @property
+    def content(self) -> bytes:
+        """The configured JSON payload as a response body."""
+        return json.dumps(self._json).encode("utf-8")
+
+    def close(self) -> None:
+        """Nothing to release."""
+
 
 class FakeSession:
     """
@@ -68,11 +80,43 @@ class FakeSession:
         self.response = response
         self.calls: List[Dict[str, Any]] = []
 
-    def get(self, url: str, timeout: Optional[float] = None, headers: Optional[Dict[str, str]] = None) -> FakeResponse:
+    def get(
+        self,
+        url: str,
+        timeout: Optional[float] = None,
+        headers: Optional[Dict[str, str]] = None,
+        stream: bool = False,
+    ) -> FakeResponse:
         self.calls.append({"url": url, "timeout": timeout, "headers": dict(headers or {})})
         return self.response
 
 
+@pytest.fixture(autouse=True)
+def clear_memory_cache():
+    """
+    Start every test with an empty in-process memory cache so payloads
+    cached by one test never leak into another.
+    """
+    from pokemon.services.api.memory import memory_cache
+
+    memory_cache.clear()
+    yield
+    memory_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def reset_circuit_breaker():
+    """
+    Close every circuit before and after each test, so failures simulated
+    by one test never make another fail fast.
+    """
+    from pokemon.services.api.circuit import circuit_breaker
+
+    circuit_breaker.reset()
+    yield
+    circuit_breaker.reset()
+
+
 @pytest.fixture
 def freeze_now(monkeypatch):
     """
@@ -118,4 +162,26 @@ def patch_session(monkeypatch):
             pass
         return s
 
-    return _factory
\ No newline at end of file
+    return _factory
+
+
+class UrlSession(FakeSession):
+    """FakeSession variant that answers per URL (unknown URLs → 404)."""
+
+    def __init__(self, by_url):
+        super().__init__(FakeResponse(status_code=404, raise_err=True))
+        self.by_url = by_url
+
+    def get(self, url, timeout=None, headers=None, stream=False):
+        super().get(url, timeout=timeout, headers=headers)
+        return self.by_url.get(url, self.response)
+
+
+@pytest.fixture
+def url_session(monkeypatch):
+    def _factory(by_url):
+        s = UrlSession(by_url)
+        monkeypatch.setattr("pokemon.services.api.client.get_session", lambda: s)
+        monkeypatch.setattr("pokemon.services.api.aio.get_session", lambda: s)
+        return s
+    return _factory
@@ -0,0 +1,52 @@
+import asyncio
+
+import httpx
+import pytest
+
+from pokemon.services.api import AsyncClient, url, get_json
+from pokemon.services.api import aio
+
+from .conftest import FakeResponse
+
+
+@pytest.mark.django_db(transaction=True)
+def test_without_httpx_fetches_run_in_threads(monkeypatch, url_session):
+    monkeypatch.setattr(aio, "httpx", None)
+    u = url("pokemon", 25)
+    session = url_session({u: FakeResponse(200, {"id": 25, "name": "pikachu"})})
+
+    async def _run():
+        async with AsyncClient(concurrency=4) as api:
+            payloads = await asyncio.gather(api.get_json(u), api.get_json(u))
+            return payloads, api.stats()
+
+    payloads, stats = asyncio.run(_run())
+    assert [p["name"] for p in payloads] == ["pikachu", "pikachu"]
+    assert (stats["transport"], stats["threaded"], stats["joined"]) == ("thread", 1, 1)
+    assert len(session.calls) == 1
+    assert get_json(u)["name"] == "pikachu"
+
+
+@pytest.mark.django_db(transaction=True)
+def test_httpx_client_shares_cache_and_validators(freeze_now, monkeypatch):
+    u = url("type", 3)
+    seen = []
+
+    def handler(request):
+        seen.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == "t3":
+            return httpx.Response(304)
+        return httpx.Response(200, json={"id": 3, "name": "flying"}, headers={"ETag": "t3"})
+
+    async def _run():
+        async with AsyncClient(concurrency=8, transport=httpx.MockTransport(handler)) as api:
+            first = await asyncio.gather(*(api.get_json(u) for _ in range(5)))
+            aio.memory_cache.clear()
+            monkeypatch.setattr("pokemon.services.api.cache._now", lambda: freeze_now + aio.ttl_for(u) * 2)
+            again = await api.get_json(u)
+            return first, again, api.stats()
+
+    first, again, stats = asyncio.run(_run())
+    assert {p["name"] for p in first} == {"flying"} and again["name"] == "flying"
+    assert seen == [None, "t3"]  # one request for five callers, then a conditional GET
+    assert stats["transport"] == "httpx" and stats["joined"] == 4
@@ -0,0 +1,110 @@
+import datetime as dt
+import json
+
+import pytest
+from django.core.cache import caches
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from pokemon.models import ApiResourceCache
+from pokemon.services.api import url, get_json, memory_cache
+from pokemon.services.api.backends import get_backend
+from pokemon.services.api.revalidate import revalidate_expired
+
+from .conftest import FakeResponse
+
+
+@pytest.fixture(params=["django", "files"])
+def backend(request, settings, tmp_path):
+    if request.param == "django":
+        settings.CACHES = {"api": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+                                   "LOCATION": "pokeapi-tests"}}
+        settings.POKEAPI_CACHE_BACKEND = {"BACKEND": "django", "OPTIONS": {"CACHE": "api"}}
+        caches["api"].clear()
+    else:
+        settings.POKEAPI_CACHE_BACKEND = {"BACKEND": "files", "OPTIONS": {"PATH": str(tmp_path)}}
+    return get_backend()
+
+
+@pytest.mark.django_db
+def test_entries_round_trip_outside_the_database(freeze_now, patch_session, backend):
+    u = url("pokemon-species", 25)
+    session = patch_session(FakeResponse(status_code=200, json_data={"id": 25, "name": "pikachu"},
+                                         headers={"ETag": "e25"}))
+
+    assert get_json(u, ttl=dt.timedelta(hours=1))["name"] == "pikachu"
+    assert ApiResourceCache.objects.count() == 0
+    entry = backend.get(u)
+    assert entry.etag == "e25" and entry.expires_at == freeze_now + dt.timedelta(hours=1)
+
+    memory_cache.clear()
+    assert get_json(u)["name"] == "pikachu"
+    assert len(session.calls) == 1
+
+
+@pytest.mark.django_db
+def test_expired_entries_revalidate_with_validators(freeze_now, patch_session, backend):
+    u = url("pokemon-species", 26)
+    patch_session(FakeResponse(status_code=200, json_data={"id": 26, "name": "raichu"}, headers={"ETag": "e26"}))
+    get_json(u, ttl=dt.timedelta(seconds=-1))
+    memory_cache.clear()
+
+    session = patch_session(FakeResponse(status_code=304))
+    assert get_json(u, ttl=dt.timedelta(hours=2))["name"] == "raichu"
+    assert session.calls[-1]["headers"]["If-None-Match"] == "e26"
+    assert backend.get(u).expires_at == freeze_now + dt.timedelta(hours=2)
+
+
+@pytest.mark.django_db
+def test_name_urls_alias_to_id_entries(freeze_now, patch_session, backend):
+    session = patch_session(FakeResponse(status_code=200, json_data={"id": 25, "name": "pikachu"}))
+    get_json(url("pokemon", "pikachu"))
+    memory_cache.clear()
+
+    assert get_json(url("pokemon", "pikachu"))["id"] == 25
+    assert backend.get(url("pokemon", 25)) is not None
+    assert len(session.calls) == 1
+
+
+@pytest.mark.django_db
+def test_file_backend_revalidates_and_purges(freeze_now, url_session, settings, tmp_path):
+    settings.POKEAPI_CACHE_BACKEND = {"BACKEND": "files", "OPTIONS": {"PATH": str(tmp_path)}}
+    backend = get_backend()
+    old, due = url("move", 1), url("move", 2)
+    for u, expires in ((old, -dt.timedelta(days=60)), (due, -dt.timedelta(minutes=1))):
+        entry = backend.new(u)
+        entry.payload, entry.etag, entry.expires_at = {"name": u}, "e", freeze_now + expires
+        backend.save(entry)
+
+    assert backend.purge_expired(freeze_now - dt.timedelta(days=30)) == 1
+    url_session({due: FakeResponse(status_code=304)})
+    assert revalidate_expired()["not_modified"] == 1
+    assert backend.get(due).expires_at > freeze_now
+
+
+@pytest.mark.django_db
+def test_file_backend_stores_plain_json(freeze_now, settings, tmp_path):
+    settings.POKEAPI_CACHE_BACKEND = {"BACKEND": "files", "OPTIONS": {"PATH": str(tmp_path)}}
+    backend = get_backend()
+    entry = backend.new(url("move", 3))
+    entry.payload, entry.body, entry.expires_at = {"name": "x"}, b"\x00zlib", freeze_now
+    backend.save(entry)
+
+    [path] = (tmp_path / "entries").glob("*/*/*.json")
+    assert json.loads(path.read_text())["expires_at"] == freeze_now.isoformat()
+    again = backend.get(url("move", 3))
+    assert (again.payload, again.body, again.expires_at) == ({"name": "x"}, b"\x00zlib", freeze_now)
+
+    path.write_bytes(b"\x80\x04not json")  # e.g. a planted pickle
+    assert backend.get(url("move", 3)) is None
+
+
+@pytest.mark.django_db
+def test_django_cache_backend_cannot_be_bulk_revalidated(freeze_now, settings):
+    settings.CACHES = {"api": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+    settings.POKEAPI_CACHE_BACKEND = {"BACKEND": "django", "OPTIONS": {"CACHE": "api"}}
+    backend = get_backend()
+
+    assert not backend.can_enumerate and backend.entries_expiring(freeze_now) == []
+    with pytest.raises(CommandError, match="cannot list its entries"):
+        call_command("revalidate_cache", "--quiet")
@@ -2,6 +2,7 @@ import datetime as dt
 import pytest
 from pokemon.models import ApiResourceCache
 from pokemon.services.api import url, get_json
+from pokemon.services.api.cache import bump_expiry, load_row, persist_row
 from .conftest import FakeResponse
 
 
@@ -37,4 +38,17 @@ def test_returns_fresh_cache_without_http(freeze_now, patch_session):
     session = patch_session(FakeResponse(status_code=200, json_data={"id": 999}))
     data = get_json(u)
     assert data == {"id": 1}, "Should return fresh cached payload"
-    assert session.calls == [], "No HTTP call expected when cache is fresh"
\ No newline at end of file
+    assert session.calls == [], "No HTTP call expected when cache is fresh"
+
+@pytest.mark.django_db
+def test_rows_deleted_between_load_and_save(freeze_now):
+    u = url("pokemon", 11)
+    ApiResourceCache.objects.create(url=u, payload={"id": 11}, expires_at=freeze_now)
+    row = load_row(u)
+    ApiResourceCache.objects.filter(url=u).delete()  # e.g. evicted by cache_maintenance
+
+    bump_expiry(row, dt.timedelta(hours=1))  # nothing left to extend
+    assert not ApiResourceCache.objects.filter(url=u).exists()
+
+    persist_row(row, u, {"id": 11, "name": "metapod"}, {"ETag": "e11"}, dt.timedelta(hours=1))
+    assert ApiResourceCache.objects.get(url=u).payload == {"id": 11, "name": "metapod"}
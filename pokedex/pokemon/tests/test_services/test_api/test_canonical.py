@@ -0,0 +1,38 @@
+import pytest
+
+from pokemon.models import ApiResourceAlias, ApiResourceCache
+from pokemon.services.api import url, get_json, get_json_many, memory_cache
+from pokemon.services.api.urls import canonical_url
+
+from .conftest import FakeResponse
+
+
+def test_canonical_url_normalizes_scheme_slash_and_query():
+    assert canonical_url("http://PokeAPI.co:443/api/v2//pokemon?offset=20&limit=10#x") == \
+        "https://pokeapi.co/api/v2/pokemon/?limit=10&offset=20"
+    assert canonical_url(url("pokemon", 25) + "encounters") == "https://pokeapi.co/api/v2/pokemon/25/encounters/"
+    assert canonical_url(url("pokemon", 25)) == url("pokemon", 25)
+
+
+@pytest.mark.django_db
+def test_name_url_is_stored_under_id_url_and_aliased(freeze_now, patch_session):
+    session = patch_session(FakeResponse(status_code=200, json_data={"id": 25, "name": "pikachu"}))
+
+    assert get_json(url("pokemon", "Pikachu"))["id"] == 25
+    assert list(ApiResourceCache.objects.values_list("url", flat=True)) == [url("pokemon", 25)]
+    assert ApiResourceAlias.objects.get(alias=url("pokemon", "pikachu")).target == url("pokemon", 25)
+
+    memory_cache.clear()
+    assert get_json(url("pokemon", 25))["name"] == "pikachu"
+    [res] = get_json_many([url("pokemon", "pikachu")])
+    assert res.url == url("pokemon", "pikachu") and res.data["id"] == 25
+    assert len(session.calls) == 1
+
+
+@pytest.mark.django_db
+def test_query_order_shares_one_row(freeze_now, patch_session):
+    session = patch_session(FakeResponse(status_code=200, json_data={"results": []}))
+    get_json(url("pokemon") + "?offset=0&limit=20")
+    get_json(url("pokemon") + "?limit=20&offset=0")
+    assert ApiResourceCache.objects.count() == 1
+    assert len(session.calls) == 1
@@ -0,0 +1,47 @@
+import pytest
+import requests
+
+from pokemon.services.api import url, get_json
+from pokemon.services.api.cassette import CassetteMiss, cassette_adapter
+
+responses = pytest.importorskip("responses")
+
+
+def _session(settings, mode, path, **extra):
+    settings.POKEAPI_CASSETTE = {"MODE": mode, "PATH": str(path), **extra}
+    s = requests.Session()
+    s.mount("https://", cassette_adapter())
+    return s
+
+
+@responses.activate
+def test_record_then_replay_offline(settings, tmp_path, monkeypatch):
+    u = url("pokemon-species", 25)
+    responses.add(responses.GET, u, json={"id": 25, "name": "pikachu"}, headers={"ETag": "e25"})
+    recorder = _session(settings, "record", tmp_path)
+    assert recorder.get(u).json()["name"] == "pikachu"
+
+    responses.reset()  # nothing reaches the network from here on
+    slept = []
+    monkeypatch.setattr("pokemon.services.api.cassette._sleep", slept.append)
+    replayer = _session(settings, "replay", tmp_path, LATENCY=0.25)
+
+    r = replayer.get(u.replace("https://pokeapi.co", "https://PokeAPI.co"), stream=True)
+    assert r.status_code == 200 and r.headers["ETag"] == "e25"
+    assert r.json() == {"id": 25, "name": "pikachu"}
+    assert replayer.get(u, headers={"If-None-Match": "e25"}).status_code == 304
+    assert slept == [0.25, 0.25]
+    with pytest.raises(CassetteMiss):
+        replayer.get(url("pokemon-species", 26))
+
+
+@pytest.mark.django_db
+def test_get_json_runs_against_a_replayed_corpus(settings, tmp_path, monkeypatch):
+    u = url("type", 3)
+    with responses.RequestsMock() as rsps:
+        rsps.add(responses.GET, u, json={"id": 3, "name": "flying"})
+        _session(settings, "record", tmp_path).get(u)
+
+    replayer = _session(settings, "replay", tmp_path)
+    monkeypatch.setattr("pokemon.services.api.client.get_session", lambda: replayer)
+    assert get_json(u)["name"] == "flying"
@@ -0,0 +1,86 @@
+import datetime as dt
+
+import pytest
+
+from pokemon.models import ApiResourceCache
+from pokemon.services.api import url, get_json, get_json_many, CircuitOpenError, circuit_breaker
+from pokemon.services.api.circuit import CircuitBreaker, CLOSED, HALF_OPEN, OPEN
+from pokemon.services.cache.core import make_safe_runner
+
+from .conftest import FakeResponse
+
+
+def test_breaker_opens_on_failure_rate_and_probes_once(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr("pokemon.services.api.circuit._clock", lambda: now[0])
+    b = CircuitBreaker(window=4, min_calls=4, failure_rate=0.5, reset_timeout=10)
+    u = "https://pokeapi.co/api/v2/pokemon/1/"
+
+    for failed in (False, True, False):
+        b.record(u, failed)
+    b.before(u)  # 1/3 failed, not enough calls yet
+    b.record(u, True)
+    assert b.stats()["hosts"]["pokeapi.co"] == OPEN
+    with pytest.raises(CircuitOpenError):
+        b.before(u)
+    b.before("https://other.example/x/")  # circuits are per host
+
+    now[0] += 10
+    b.before(u)  # the probe
+    assert b.stats()["hosts"]["pokeapi.co"] == HALF_OPEN
+    with pytest.raises(CircuitOpenError):
+        b.before(u)  # everyone else still fails fast
+    b.record(u, False)
+    assert b.stats()["hosts"]["pokeapi.co"] == CLOSED and not b.is_open(u)
+    assert b.stats()["opened"] == 1 and b.stats()["rejected"] == 2
+
+
+@pytest.mark.django_db
+def test_open_circuit_serves_expired_payloads_without_requests(freeze_now, patch_session, monkeypatch):
+    monkeypatch.setattr(circuit_breaker, "min_calls", 2)
+    cached, missing = url("pokemon-species", 1), url("pokemon-species", 2)
+    ApiResourceCache.objects.create(url=cached, payload={"name": "bulbasaur"},
+                                    expires_at=freeze_now - dt.timedelta(days=30))
+    session = patch_session(FakeResponse(status_code=500, raise_err=True))
+
+    for _ in range(2):
+        with pytest.raises(AssertionError):
+            get_json(missing)
+    assert circuit_breaker.is_open(cached)
+
+    assert get_json(cached)["name"] == "bulbasaur"
+    with pytest.raises(CircuitOpenError):
+        get_json(missing)
+    res = {r.url: r for r in get_json_many([cached, missing])}
+    assert res[cached].data["name"] == "bulbasaur"
+    assert isinstance(res[missing].error, CircuitOpenError)
+    assert len(session.calls) == 2
+
+
+@pytest.mark.django_db
+def test_probe_that_raises_unexpectedly_frees_the_half_open_slot(monkeypatch, patch_session):
+    now = [100.0]
+    monkeypatch.setattr("pokemon.services.api.circuit._clock", lambda: now[0])
+    monkeypatch.setattr(circuit_breaker, "min_calls", 1)
+    u = url("pokemon", 1)
+    circuit_breaker.record(u, True)
+    now[0] += circuit_breaker.reset_timeout
+    session = patch_session(FakeResponse())
+    monkeypatch.setattr(session, "get", lambda *a, **kw: (_ for _ in ()).throw(ValueError("boom")))
+
+    with pytest.raises(ValueError):
+        get_json(u)  # the probe dies without an outcome
+    assert circuit_breaker.stats()["hosts"]["pokeapi.co"] == HALF_OPEN
+    circuit_breaker.before(u)  # so the next caller becomes the probe
+
+
+def test_safe_runner_logs_open_circuit_once():
+    logs = []
+
+    def upsert(item_id):
+        raise CircuitOpenError("pokeapi.co", 5.0)
+
+    runner = make_safe_runner(upsert, attempts=3, logger=logs.append)
+    assert runner(7) is False
+    assert logs == ["[safe-runner] id=7 giving up after 1 attempt(s), circuit open: "
+                    "Circuit open for pokeapi.co; retry in 5.0s"]
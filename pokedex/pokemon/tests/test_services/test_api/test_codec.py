@@ -0,0 +1,41 @@
+import datetime as dt
+import pytest
+from django.core.management import call_command
+
+from pokemon.models import ApiResourceCache
+from pokemon.services.api import url, get_json
+from pokemon.services.api.cache import read_payload
+
+from .conftest import FakeResponse
+
+
+PAYLOAD = {"id": 25, "moves": [{"move": {"name": f"m{i}"}} for i in range(200)]}
+
+
+@pytest.mark.django_db
+def test_compact_codec_roundtrip_through_get_json(settings, freeze_now, patch_session):
+    settings.POKEAPI_CACHE_CODEC = "zlib"
+    u = url("pokemon", 25)
+    patch_session(FakeResponse(status_code=200, json_data=PAYLOAD))
+
+    assert get_json(u) == PAYLOAD
+
+    row = ApiResourceCache.objects.get(url=u)
+    assert row.codec == "zlib" and row.payload is None
+    assert len(row.body) < len(str(PAYLOAD))
+    assert read_payload(row) == PAYLOAD
+
+
+@pytest.mark.django_db
+def test_compact_command_rewrites_rows_both_ways(freeze_now, capsys):
+    u = url("pokemon", 1)
+    ApiResourceCache.objects.create(url=u, payload=PAYLOAD, expires_at=freeze_now + dt.timedelta(hours=1))
+
+    call_command("compact_api_cache", codec="zlib")
+    row = ApiResourceCache.objects.get(url=u)
+    assert row.codec == "zlib" and read_payload(row) == PAYLOAD
+    assert "changed=1" in capsys.readouterr().out
+
+    call_command("compact_api_cache", codec="json")
+    row.refresh_from_db()
+    assert row.codec == "" and row.payload == PAYLOAD and row.body is None
@@ -0,0 +1,93 @@
+import io
+import json
+
+import pytest
+
+from pokemon.models import ApiResourceCache
+from pokemon.services.api import decoding, get_json
+from pokemon.services.api.projections import PROJECTIONS, project
+from pokemon.services.api.urls import url
+
+
+POKEMON = {
+    "id": 25,
+    "name": "pikachu",
+    "sprites": {"front_default": "x.png", "other": {"home": {"front_default": "y.png"}}},
+    "stats": [{"base_stat": 35, "effort": 0, "stat": {"name": "hp", "url": "u"}}],
+    "moves": [
+        {
+            "move": {"name": "thunder", "url": "m"},
+            "version_group_details": [
+                {"level_learned_at": 1.5, "move_learn_method": {"name": "level-up", "url": "l"},
+                 "version_group": {"name": "red-blue", "url": "v"}},
+            ],
+        },
+    ],
+    "game_indices": [{"game_index": 84, "version": {"name": "red"}}],
+}
+
+
+class _StreamResponse:
+    """Just enough of a streamed `requests.Response` for `decode_response`."""
+
+    status_code = 200
+
+    def __init__(self, payload, content_length=None):
+        self.body = json.dumps(payload).encode()
+        self.raw = io.BytesIO(self.body)
+        self.headers = {"Content-Length": str(content_length or len(self.body))}
+        self.closed = False
+
+    @property
+    def content(self):
+        return self.body
+
+    def raise_for_status(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+
+def test_loads_dumps_roundtrip():
+    payload = {"name": "flabébé", "ids": [1, 2.5, None, True]}
+    assert decoding.loads(decoding.dumps(payload)) == payload
+    assert b" " not in decoding.dumps({"a": [1, 2]})
+
+
+def test_small_responses_are_decoded_whole(settings):
+    settings.POKEAPI_JSON_STREAMING = {"MIN_BYTES": 10 ** 9}
+    r = _StreamResponse(POKEMON)
+    assert decoding.decode_response(r, url("pokemon", 25)) == POKEMON
+
+
+def test_stream_project_matches_project():
+    fp = io.BytesIO(json.dumps(POKEMON).encode())
+    streamed = decoding.stream_project(fp, PROJECTIONS["pokemon/*"])
+    assert streamed == project(url("pokemon", 25), POKEMON)
+    assert "sprites" not in streamed and "game_indices" not in streamed
+
+
+def test_large_projected_responses_are_streamed(settings):
+    settings.POKEAPI_JSON_STREAMING = {"ENABLED": True, "MIN_BYTES": 1}
+    r = _StreamResponse(POKEMON)
+
+    data = decoding.decode_response(r, url("pokemon", 25))
+    assert data["moves"][0]["move"] == {"name": "thunder", "url": "m"}
+    assert "sprites" not in data
+    assert r.closed
+
+    full = decoding.decode_response(_StreamResponse(POKEMON), url("pokemon", 25), full=True)
+    assert full == POKEMON
+
+
+@pytest.mark.django_db
+def test_client_streams_large_projected_responses(settings, freeze_now, patch_session):
+    settings.POKEAPI_JSON_STREAMING = {"ENABLED": True, "MIN_BYTES": 1}
+    r = _StreamResponse(POKEMON)
+    patch_session(r)
+
+    data = get_json(url("pokemon", 25))
+    assert r.closed  # parsed from `raw`, not from `content`
+    assert data == project(url("pokemon", 25), POKEMON)
+    assert ApiResourceCache.objects.get(url=url("pokemon", 25)).payload == data
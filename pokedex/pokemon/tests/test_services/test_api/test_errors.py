@@ -14,8 +14,9 @@ def test_http_5xx_raises(patch_session):
         get_json(u)
 
 class BadJsonResponse(FakeResponse):
-    def json(self):
-        raise ValueError("bad json")
+    @property
+    def content(self):
+        return b"{bad json"
 
 @pytest.mark.django_db
 def test_bad_json_bubbles_up(patch_session):
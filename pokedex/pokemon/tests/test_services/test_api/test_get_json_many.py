@@ -0,0 +1,46 @@
+import datetime as dt
+import pytest
+
+from pokemon.models import ApiResourceCache
+from pokemon.services.api import url, get_json_many
+
+from .conftest import FakeResponse
+
+
+@pytest.mark.django_db
+def test_results_in_input_order_with_per_url_errors(freeze_now, url_session):
+    fresh, stale, missing, broken = (url("move", i) for i in (1, 2, 3, 4))
+    ApiResourceCache.objects.create(url=fresh, payload={"id": 1}, expires_at=freeze_now + dt.timedelta(hours=1))
+    ApiResourceCache.objects.create(url=stale, payload={"id": 2}, etag="e2",
+                                    expires_at=freeze_now - dt.timedelta(seconds=1))
+    session = url_session({
+        stale: FakeResponse(status_code=304),
+        missing: FakeResponse(status_code=200, json_data={"id": 3}),
+    })
+
+    results = get_json_many([broken, missing, fresh, stale, fresh])
+
+    assert [r.url for r in results] == [broken, missing, fresh, stale, fresh]
+    assert not results[0].ok and isinstance(results[0].error, AssertionError)
+    assert [r.data for r in results[1:]] == [{"id": 3}, {"id": 1}, {"id": 2}, {"id": 1}]
+    assert sorted(c["url"] for c in session.calls) == sorted([broken, missing, stale])
+
+    assert ApiResourceCache.objects.get(url=missing).payload == {"id": 3}
+    assert ApiResourceCache.objects.get(url=stale).expires_at > freeze_now
+
+
+@pytest.mark.django_db
+def test_cache_hits_use_a_single_query(freeze_now, url_session, django_assert_num_queries):
+    urls = [url("move", i) for i in range(1, 6)]
+    for i, u in enumerate(urls, start=1):
+        ApiResourceCache.objects.create(
+            url=u, payload={"id": i}, expires_at=freeze_now + dt.timedelta(hours=1), accessed_at=freeze_now
+        )
+    session = url_session({})
+
+    # Recently read rows are not re-touched, so only the batched SELECT runs.
+    with django_assert_num_queries(1):
+        results = get_json_many(urls)
+
+    assert [r.data["id"] for r in results] == [1, 2, 3, 4, 5]
+    assert session.calls == []
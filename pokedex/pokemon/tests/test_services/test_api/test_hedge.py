@@ -0,0 +1,86 @@
+import threading
+
+import pytest
+
+from pokemon.services.api import url, get_json, get_json_many
+from pokemon.services.api.hedge import Hedger, LatencyTracker
+
+from .conftest import FakeResponse, FakeSession
+
+
+class StallingSession(FakeSession):
+    """The first GET stalls until released; later GETs answer at once."""
+
+    def __init__(self, response):
+        super().__init__(response)
+        self.release = threading.Event()
+        self.stalled = FakeResponse(status_code=200, json_data={"id": 0, "name": "stalled"})
+        self.closed = threading.Event()
+        self.stalled.close = self.closed.set
+
+    def get(self, url, timeout=None, headers=None, stream=False):
+        first = not self.calls
+        super().get(url, timeout=timeout, headers=headers)
+        if first:
+            self.release.wait(5)
+            return self.stalled
+        return self.response
+
+
+def _hedger(**kw):
+    opts = {"percentile": 90, "min_delay": 0.01, "max_delay": 0.05, "window": 10, "min_samples": 3, "workers": 4}
+    return Hedger(**{**opts, **kw})
+
+
+def test_delay_follows_recent_latency_percentile():
+    t = LatencyTracker(window=10)
+    for s in (0.1, 0.2, 0.3, 0.4, 5.0):
+        t.observe(s)
+    assert t.percentile(80) == 0.4 and t.percentile(100) == 5.0
+
+    h = _hedger(max_delay=1.0)
+    assert h.delay() == 1.0  # not enough samples yet
+    for s in (0.001, 0.002, 0.2):
+        h.observe(s)
+    assert h.delay() == 0.2
+
+
+def test_slow_request_is_hedged_and_the_fast_response_wins():
+    h = _hedger()
+    release, calls = threading.Event(), []
+
+    def fn():
+        calls.append(1)
+        if len(calls) == 1:
+            release.wait(5)
+            return "slow"
+        return "fast"
+
+    assert h.call(fn) == "fast"
+    release.set()
+    assert h.call(lambda: "quick") == "quick"
+    assert h.stats()["hedged"] == 1 and h.stats()["hedge_wins"] == 1 and h.stats()["calls"] == 2
+
+
+@pytest.mark.django_db
+def test_get_json_hedge_opt_in(freeze_now, monkeypatch):
+    monkeypatch.setattr("pokemon.services.api.client.hedger", _hedger())
+    session = StallingSession(FakeResponse(status_code=200, json_data={"id": 25, "name": "pikachu"}))
+    monkeypatch.setattr("pokemon.services.api.client.get_session", lambda: session)
+
+    assert get_json(url("pokemon-species", 25), hedge=True)["name"] == "pikachu"
+    assert len(session.calls) == 2
+    session.release.set()
+    assert session.closed.wait(5), "the losing response is closed"
+
+
+@pytest.mark.django_db
+def test_get_json_many_hedges_the_batch(freeze_now, monkeypatch):
+    monkeypatch.setattr("pokemon.services.api.client.hedger", _hedger())
+    session = StallingSession(FakeResponse(status_code=200, json_data={"id": 25, "name": "pikachu"}))
+    monkeypatch.setattr("pokemon.services.api.client.get_session", lambda: session)
+
+    [res] = get_json_many([url("pokemon-species", 25)], hedge=True)
+    assert res.ok and res.data["name"] == "pikachu"
+    assert len(session.calls) == 2
+    session.release.set()
@@ -1,4 +1,5 @@
 import pytest
+import requests
 responses = pytest.importorskip("responses")
 
 from pokemon.services.api import url, get_json
@@ -22,4 +23,15 @@ def test_real_http_layer_behaviour():
 
     # second request → 304 Not Modified, should reuse cached payload
     responses.add(responses.GET, u, status=304)
-    assert get_json(u) == {"id": 25, "name": "pikachu"}
\ No newline at end of file
+    assert get_json(u) == {"id": 25, "name": "pikachu"}
+
+@responses.activate
+@pytest.mark.django_db
+def test_server_errors_are_not_retried_behind_the_circuit_breaker():
+    u = url("pokemon", 26)
+    responses.add(responses.GET, u, status=502)
+    responses.add(responses.GET, u, json={"id": 26}, status=200)
+
+    with pytest.raises(requests.HTTPError):
+        get_json(u)
+    assert len(responses.calls) == 1  # one breaker-gated call, one upstream request
@@ -0,0 +1,106 @@
+import datetime as dt
+
+import pytest
+from django.core.management import call_command
+
+from pokemon.models import ApiResourceCache
+from pokemon.services.api import url, get_json
+from pokemon.services.api.maintenance import (
+    cache_report,
+    evict_expired,
+    evict_oversized,
+    evict_to_budget,
+)
+
+from .conftest import FakeResponse
+
+
+def _row(u, now, *, expires_in, accessed_ago=None, size=10):
+    return ApiResourceCache.objects.create(
+        url=u,
+        payload={"name": "x" * size},
+        expires_at=now + expires_in,
+        accessed_at=None if accessed_ago is None else now - accessed_ago,
+    )
+
+
+@pytest.mark.django_db
+def test_report_groups_rows_by_resource(freeze_now):
+    _row(url("pokemon", 1), freeze_now, expires_in=dt.timedelta(hours=1))
+    _row(url("pokemon", 2), freeze_now, expires_in=-dt.timedelta(hours=1))
+    _row(url("move", 1), freeze_now, expires_in=dt.timedelta(hours=1))
+
+    stats = {s.resource: s for s in cache_report()}
+    assert stats["pokemon"].rows == 2 and stats["pokemon"].expired == 1
+    assert stats["move"].rows == 1 and stats["move"].bytes > 0
+    assert stats["move"].ttl == dt.timedelta(days=7)
+    assert [s.resource for s in cache_report("move")] == ["move"]
+
+
+@pytest.mark.django_db
+def test_evict_expired_respects_grace(freeze_now):
+    _row(url("pokemon", 1), freeze_now, expires_in=-dt.timedelta(days=40))
+    _row(url("pokemon", 2), freeze_now, expires_in=-dt.timedelta(days=1))
+
+    assert evict_expired(dt.timedelta(days=30)) == 1
+    assert list(ApiResourceCache.objects.values_list("url", flat=True)) == [url("pokemon", 2)]
+
+
+@pytest.mark.django_db
+def test_eviction_can_target_one_resource(freeze_now):
+    _row(url("pokemon", 1), freeze_now, expires_in=-dt.timedelta(days=40))
+    _row(url("pokemon", 1, "encounters"), freeze_now, expires_in=-dt.timedelta(days=40))
+    _row(url("pokemon", 2, "encounters"), freeze_now, expires_in=dt.timedelta(days=1), size=100)
+
+    assert evict_expired(dt.timedelta(days=30), resource="pokemon:encounters") == 1
+    assert evict_to_budget(0, resource="pokemon:encounters") == 1
+    assert list(ApiResourceCache.objects.values_list("url", flat=True)) == [url("pokemon", 1)]
+
+
+@pytest.mark.django_db
+def test_evict_oversized_and_lru_budget(freeze_now):
+    hour = dt.timedelta(hours=1)
+    _row(url("pokemon", 1), freeze_now, expires_in=hour, size=5000)
+    _row(url("pokemon", 2), freeze_now, expires_in=hour, accessed_ago=dt.timedelta(days=3))
+    _row(url("pokemon", 3), freeze_now, expires_in=hour, accessed_ago=dt.timedelta(minutes=1))
+    _row(url("pokemon", 4), freeze_now, expires_in=hour)  # never read → evicted first
+
+    assert evict_oversized(1000, dry_run=True) == 1
+    assert ApiResourceCache.objects.count() == 4
+    assert evict_oversized(1000) == 1
+
+    one_row = len('{"name": "%s"}' % ("x" * 10))
+    assert evict_to_budget(one_row) == 2
+    assert list(ApiResourceCache.objects.values_list("url", flat=True)) == [url("pokemon", 3)]
+
+
+@pytest.mark.django_db
+def test_reads_refresh_accessed_at(freeze_now, patch_session):
+    u = url("pokemon", 7)
+    row = _row(u, freeze_now, expires_in=dt.timedelta(hours=1), accessed_ago=dt.timedelta(days=2))
+    patch_session(FakeResponse(status_code=500, raise_err=True))
+
+    get_json(u)
+    row.refresh_from_db()
+    assert row.accessed_at == freeze_now
+
+
+@pytest.mark.django_db
+def test_command_dry_run_deletes_nothing(freeze_now, capsys):
+    _row(url("pokemon", 1), freeze_now, expires_in=-dt.timedelta(days=90))
+
+    call_command("cache_maintenance", "--dry-run")
+    assert "expired=1" in capsys.readouterr().out
+    assert ApiResourceCache.objects.count() == 1
+
+
+@pytest.mark.django_db
+def test_command_dry_run_counts_each_row_once(freeze_now, capsys):
+    _row(url("pokemon", 1), freeze_now, expires_in=-dt.timedelta(days=90), size=5000)  # expired and oversized
+    _row(url("pokemon", 2), freeze_now, expires_in=dt.timedelta(hours=1))
+
+    call_command("cache_maintenance", "--dry-run", "--max-entry-kb", "1", "--max-total-mb", "1")
+    assert "expired=1 oversized=0 lru=0" in capsys.readouterr().out
+
+    call_command("cache_maintenance", "--max-entry-kb", "1", "--max-total-mb", "1", "--no-vacuum")
+    assert "expired=1 oversized=0 lru=0" in capsys.readouterr().out
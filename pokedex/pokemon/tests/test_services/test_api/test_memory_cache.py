@@ -0,0 +1,75 @@
+import datetime as dt
+import pytest
+
+from pokemon.models import ApiResourceCache
+from pokemon.services.api import url, get_json, memory_cache
+from pokemon.services.api.memory import MemoryCache
+
+from .conftest import FakeResponse
+
+
+@pytest.mark.django_db
+def test_second_read_is_served_from_memory(freeze_now, patch_session, django_assert_num_queries):
+    u = url("pokemon-species", 25)
+    ApiResourceCache.objects.create(
+        url=u, payload={"id": 25}, expires_at=freeze_now + dt.timedelta(hours=1)
+    )
+    session = patch_session(FakeResponse(status_code=200, json_data={"id": 999}))
+
+    assert get_json(u) == {"id": 25}
+    with django_assert_num_queries(0):
+        assert get_json(u) == {"id": 25}
+
+    assert session.calls == []
+    assert memory_cache.stats()["hits"] == 1
+
+
+@pytest.mark.django_db
+def test_memory_entry_respects_row_expiry(freeze_now, patch_session, monkeypatch):
+    u = url("pokemon", 4)
+    ApiResourceCache.objects.create(
+        url=u, payload={"id": 4}, etag="e4", expires_at=freeze_now + dt.timedelta(seconds=30)
+    )
+    session = patch_session(FakeResponse(status_code=304))
+    assert get_json(u) == {"id": 4}
+
+    later = freeze_now + dt.timedelta(seconds=31)
+    monkeypatch.setattr("pokemon.services.api.cache._now", lambda: later)
+
+    assert get_json(u) == {"id": 4}
+    assert len(session.calls) == 1, "expired row must be revalidated, not served from memory"
+    assert session.calls[-1]["headers"].get("If-None-Match") == "e4"
+
+
+def test_lru_eviction_by_entries_and_bytes(freeze_now):
+    mc = MemoryCache(max_entries=2, max_bytes=64, ttl=dt.timedelta(minutes=5))
+    mc.set("a", {"v": 1})
+    mc.set("b", {"v": 2})
+    assert mc.get("a") == {"v": 1}  # "a" becomes most recently used
+
+    mc.set("c", {"v": 3})
+    assert mc.get("b") is None
+    assert mc.get("a") == {"v": 1}
+
+    mc.set("big", {"v": "x" * 100})  # larger than the whole budget
+    assert mc.get("big") is None
+    assert mc.stats()["evictions"] == 1
+
+
+@pytest.mark.django_db
+def test_fills_are_sized_without_encoding_the_payload(freeze_now, patch_session, settings, monkeypatch):
+    def no_encode(payload):
+        raise AssertionError("payload re-encoded just to measure it")
+
+    monkeypatch.setattr("pokemon.services.api.memory._sizeof", no_encode)
+    fresh = freeze_now + dt.timedelta(hours=1)
+    ApiResourceCache.objects.create(url=url("type", 1), payload={"id": 1, "name": "normal"}, expires_at=fresh)
+    patch_session(FakeResponse(status_code=200, json_data={"id": 2, "name": "fighting"}))
+
+    assert get_json(url("type", 1))["name"] == "normal"  # db hit: stored JSON length
+    assert get_json(url("type", 2))["name"] == "fighting"  # miss: response body length
+    settings.POKEAPI_CACHE_CODEC = "zlib"
+    assert get_json(url("type", 3))["name"] == "fighting"  # codec row: compressed from those bytes
+    memory_cache.clear()
+    assert get_json(url("type", 3))["name"] == "fighting"  # codec hit: decompressed bytes
+    assert memory_cache.stats()["entries"] == 1 and memory_cache.stats()["bytes"] > 0
@@ -0,0 +1,42 @@
+import datetime as dt
+
+import pytest
+import requests
+
+from pokemon.models import ApiResourceCache
+from pokemon.services.api import url, get_json, get_json_many, CachedHTTPError
+
+from .conftest import FakeResponse
+
+
+@pytest.mark.django_db
+def test_404_is_cached_and_raised_without_upstream(freeze_now, patch_session, settings):
+    settings.POKEAPI_NEGATIVE_TTL = 600
+    u = url("pokemon-species", 10033)
+    session = patch_session(FakeResponse(status_code=404))
+
+    with pytest.raises(requests.HTTPError):
+        get_json(u)
+    row = ApiResourceCache.objects.get(url=u)
+    assert row.status_code == 404 and row.payload is None
+    assert row.expires_at == freeze_now + dt.timedelta(seconds=600)
+
+    with pytest.raises(CachedHTTPError) as exc:
+        get_json(u)
+    assert exc.value.response.status_code == 404
+    assert len(session.calls) == 1
+
+    [res] = get_json_many([u])
+    assert isinstance(res.error, CachedHTTPError)
+    assert len(session.calls) == 1
+
+
+@pytest.mark.django_db
+def test_expired_negative_entry_is_refetched_and_replaced(freeze_now, patch_session):
+    u = url("pokemon-species", 10034)
+    ApiResourceCache.objects.create(url=u, status_code=410, expires_at=freeze_now - dt.timedelta(seconds=1))
+    session = patch_session(FakeResponse(status_code=200, json_data={"id": 10034, "name": "back"}))
+
+    assert get_json(u, allow_stale=True)["name"] == "back"
+    assert len(session.calls) == 1
+    assert ApiResourceCache.objects.get(url=u).status_code == 200
@@ -0,0 +1,65 @@
+import pytest
+
+from pokemon.services.api import url, get_json, get_json_many
+from pokemon.services.api.prefetch import linked_urls, schedule_prefetch
+
+from .conftest import FakeResponse
+
+POKEMON = {
+    "id": 1,
+    "name": "bulbasaur",
+    "species": {"name": "bulbasaur", "url": url("pokemon-species", 1)},
+    "location_area_encounters": "https://pokeapi.co/api/v2/pokemon/1/encounters",
+    "moves": [{"move": {"name": m, "url": url("move", i)}} for i, m in ((13, "razor-wind"), (14, "swords-dance"))],
+}
+
+
+@pytest.fixture
+def prefetched(settings, monkeypatch):
+    """Enable prefetching and capture what would be fetched instead of using threads."""
+    settings.POKEAPI_PREFETCH = {"ENABLED": True}
+    jobs = []
+    monkeypatch.setattr(
+        "pokemon.services.api.client.schedule_prefetch",
+        lambda u, payload, fetch: jobs.extend((v, fetch) for v in linked_urls(u, payload)),
+    )
+    return jobs
+
+
+def test_rules_collect_linked_urls_in_order():
+    assert linked_urls(url("pokemon", 1), POKEMON, limit=3) == [
+        url("pokemon-species", 1),
+        url("pokemon", 1, "encounters"),
+        url("move", 13),
+    ]
+    assert linked_urls(url("pokemon-species", 1), {"evolution_chain": {"url": url("evolution-chain", 1)}}) == [
+        url("evolution-chain", 1)
+    ]
+    assert linked_urls(url("move", 13), {"id": 13}) == []
+
+
+def test_disabled_by_default(settings):
+    settings.POKEAPI_PREFETCH = {}
+    assert schedule_prefetch(url("pokemon", 1), POKEMON, lambda u: None) == 0
+
+
+@pytest.mark.django_db
+def test_fetched_payload_warms_linked_resources(freeze_now, url_session, prefetched):
+    species = url("pokemon-species", 1)
+    session = url_session({
+        url("pokemon", 1): FakeResponse(status_code=200, json_data=POKEMON),
+        species: FakeResponse(status_code=200, json_data={"id": 1, "name": "bulbasaur"}),
+        url("pokemon", 1, "encounters"): FakeResponse(status_code=200, json_data=[]),
+        url("move", 13): FakeResponse(status_code=200, json_data={"id": 13}),
+        url("move", 14): FakeResponse(status_code=200, json_data={"id": 14}),
+    })
+
+    get_json(url("pokemon", 1))
+    assert [u for u, _ in prefetched][:2] == [species, url("pokemon", 1, "encounters")]
+    for u, fetch in list(prefetched):
+        fetch(u)  # run the background fetches inline
+    requested = len(session.calls)
+
+    assert get_json(species)["name"] == "bulbasaur"
+    assert all(r.ok for r in get_json_many([url("move", 13), url("move", 14)]))
+    assert len(session.calls) == requested
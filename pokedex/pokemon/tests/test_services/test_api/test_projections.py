@@ -0,0 +1,65 @@
+import pytest
+
+from pokemon.models import ApiResourceCache
+from pokemon.services.api import url, get_json
+from pokemon.services.api.projections import project, projection_for
+
+from .conftest import FakeResponse
+
+
+POKEMON = {
+    "id": 25,
+    "name": "pikachu",
+    "height": 4,
+    "weight": 60,
+    "species": {"name": "pikachu", "url": "https://pokeapi.co/api/v2/pokemon-species/25/"},
+    "stats": [{"base_stat": 35, "effort": 0, "stat": {"name": "hp", "url": "u"}}],
+    "types": [{"slot": 1, "type": {"name": "electric", "url": "u"}}],
+    "abilities": [{"slot": 1, "is_hidden": False, "ability": {"name": "static", "url": "u"}}],
+    "moves": [{
+        "move": {"name": "thunder", "url": "https://pokeapi.co/api/v2/move/87/"},
+        "version_group_details": [{
+            "level_learned_at": 30,
+            "move_learn_method": {"name": "level-up", "url": "u"},
+            "version_group": {"name": "red-blue", "url": "u"},
+            "order": None,
+        }],
+    }],
+    "game_indices": [{"game_index": 84, "version": {"name": "red", "url": "u"}}] * 20,
+    "sprites": {"front_default": "x"},
+}
+
+
+def test_projection_matching_is_per_segment():
+    assert projection_for(url("pokemon", 25)) == "pokemon/*"
+    assert projection_for(url("pokemon", 25) + "encounters") is None
+    assert projection_for(url("pokemon") + "?limit=1") is None
+    assert projection_for(url("evolution-chain", 1)) is None
+
+
+def test_pokemon_projection_keeps_only_read_fields():
+    out = project(url("pokemon", 25), POKEMON)
+    assert "game_indices" not in out and "sprites" not in out
+    assert out["stats"] == [{"base_stat": 35, "stat": {"name": "hp"}}]
+    assert out["moves"][0]["version_group_details"] == [{
+        "level_learned_at": 30,
+        "move_learn_method": {"name": "level-up"},
+        "version_group": {"name": "red-blue"},
+    }]
+
+
+@pytest.mark.django_db
+def test_persisted_rows_are_projected_unless_full(freeze_now, patch_session):
+    u = url("pokemon", 25)
+    session = patch_session(FakeResponse(status_code=200, json_data=POKEMON, headers={"ETag": "e"}))
+
+    data = get_json(u)
+    row = ApiResourceCache.objects.get(url=u)
+    assert row.projected and row.payload == data
+    assert "game_indices" not in data
+
+    full = get_json(u, full=True)
+    assert full == POKEMON
+    assert "If-None-Match" not in session.calls[-1]["headers"]
+    row.refresh_from_db()
+    assert not row.projected and row.payload == POKEMON
@@ -0,0 +1,76 @@
+import pytest
+
+from pokemon.services.api import url, get_json
+from pokemon.services.api.ratelimit import RateLimiter, parse_retry_after
+
+from .conftest import FakeResponse
+
+
+@pytest.fixture
+def fake_clock(monkeypatch):
+    """Virtual time: `sleep` advances the clock instead of blocking."""
+    t = {"now": 1000.0, "slept": []}
+
+    def _sleep(s):
+        t["slept"].append(s)
+        t["now"] += s
+
+    monkeypatch.setattr("pokemon.services.api.ratelimit._clock", lambda: t["now"])
+    monkeypatch.setattr("pokemon.services.api.ratelimit._sleep", _sleep)
+    return t
+
+
+def test_burst_then_steady_rate(fake_clock):
+    limiter = RateLimiter(rate=10, burst=3)
+    waits = [limiter.acquire() for _ in range(5)]
+    assert waits[:3] == [0.0, 0.0, 0.0]
+    assert waits[3] == pytest.approx(0.1)
+    assert waits[4] == pytest.approx(0.1)
+
+
+def test_penalize_blocks_then_halves_rate(fake_clock):
+    limiter = RateLimiter(rate=10, burst=1, slowdown=60)
+    limiter.penalize(2.0)
+    assert limiter.acquire() == pytest.approx(2.0)
+    assert limiter.acquire() == pytest.approx(0.2)  # half rate while slowed down
+    assert limiter.stats()["penalties"] == 1
+
+
+def test_lease_file_shares_budget_between_limiters(fake_clock, tmp_path):
+    lease = str(tmp_path / "pokeapi.rate")
+    a = RateLimiter(rate=10, burst=1, lease_file=lease)
+    b = RateLimiter(rate=10, burst=1, lease_file=lease)
+    assert a.acquire() == 0.0
+    assert b.acquire() == pytest.approx(0.1)
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0  # in the past
+    assert parse_retry_after("soon") is None
+
+
+class _SequenceSession:
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = 0
+
+    def get(self, url, timeout=None, headers=None, stream=False):
+        self.calls += 1
+        return self.responses.pop(0)
+
+
+@pytest.mark.django_db
+def test_429_pauses_the_shared_limiter_and_retries(freeze_now, monkeypatch, fake_clock):
+    session = _SequenceSession([
+        FakeResponse(status_code=429, headers={"Retry-After": "4"}),
+        FakeResponse(status_code=200, json_data={"id": 1, "name": "bulbasaur"}),
+    ])
+    monkeypatch.setattr("pokemon.services.api.client.get_session", lambda: session)
+    limiter = RateLimiter(rate=100, burst=10)
+    monkeypatch.setattr("pokemon.services.api.client.rate_limiter", limiter)
+
+    assert get_json(url("pokemon", 1))["name"] == "bulbasaur"
+    assert session.calls == 2
+    assert fake_clock["slept"] == [pytest.approx(4.0)]
+    assert limiter.stats()["penalties"] == 1
@@ -0,0 +1,47 @@
+import datetime as dt
+
+import pytest
+from django.core.management import call_command
+
+from pokemon.models import ApiResourceCache
+from pokemon.services.api import url
+from pokemon.services.api.revalidate import revalidate_expired
+
+from .conftest import FakeResponse
+
+
+@pytest.mark.django_db
+def test_expired_rows_are_revalidated_in_bulk(freeze_now, url_session):
+    past = freeze_now - dt.timedelta(minutes=1)
+    same, changed, broken = (url("move", i) for i in (1, 2, 3))
+    ApiResourceCache.objects.create(url=same, payload={"name": "a"}, etag="e1", expires_at=past)
+    ApiResourceCache.objects.create(url=changed, payload={"name": "b"}, etag="e2", expires_at=past)
+    ApiResourceCache.objects.create(url=broken, payload={"name": "c"}, expires_at=past)
+    fresh = ApiResourceCache.objects.create(url=url("move", 4), payload={"name": "d"},
+                                            expires_at=freeze_now + dt.timedelta(days=1))
+    session = url_session({
+        same: FakeResponse(status_code=304),
+        changed: FakeResponse(status_code=200, json_data={"name": "b2"}, headers={"ETag": "e2b"}),
+        broken: FakeResponse(status_code=500, raise_err=True),
+    })
+
+    stats = revalidate_expired(ttl=dt.timedelta(hours=2))
+
+    assert stats == {"checked": 3, "not_modified": 1, "modified": 1, "errors": 1}
+    assert {c["url"] for c in session.calls} == {same, changed, broken}
+    assert next(c for c in session.calls if c["url"] == same)["headers"]["If-None-Match"] == "e1"
+    assert ApiResourceCache.objects.get(url=same).expires_at == freeze_now + dt.timedelta(hours=2)
+    assert ApiResourceCache.objects.get(url=changed).payload == {"name": "b2"}
+    assert ApiResourceCache.objects.get(url=broken).expires_at == past
+    assert fresh.url not in {c["url"] for c in session.calls}
+
+
+@pytest.mark.django_db
+def test_command_reports_counts(freeze_now, url_session, capsys):
+    u = url("move", 1)
+    ApiResourceCache.objects.create(url=u, payload={"name": "a"}, etag="e1",
+                                    expires_at=freeze_now - dt.timedelta(minutes=1))
+    url_session({u: FakeResponse(status_code=304)})
+
+    call_command("revalidate_cache", "--quiet")
+    assert "304=1 200=0 errors=0" in capsys.readouterr().out
@@ -0,0 +1,72 @@
+import threading
+import time
+import pytest
+
+from pokemon.models import ApiResourceCache
+from pokemon.services.api import url, get_json, single_flight
+from pokemon.services.api.singleflight import SingleFlight
+
+from .conftest import FakeResponse, FakeSession
+
+
+def test_concurrent_callers_share_one_call():
+    sf = SingleFlight()
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def work():
+        calls.append(1)
+        started.set()
+        release.wait(2)
+        return {"id": 1}
+
+    out = []
+    leader = threading.Thread(target=lambda: out.append(sf.do("k", work)))
+    leader.start()
+    started.wait(2)
+    followers = [threading.Thread(target=lambda: out.append(sf.do("k", work))) for _ in range(3)]
+    for t in followers:
+        t.start()
+    while sf.stats()["coalesced"] < 3:
+        time.sleep(0.001)
+    release.set()
+    for t in [leader, *followers]:
+        t.join(2)
+
+    assert calls == [1]
+    assert out == [{"id": 1}] * 4
+    assert sf.stats() == {"leaders": 1, "coalesced": 3, "in_flight": 0}
+
+
+def test_leader_error_is_shared_and_key_released():
+    sf = SingleFlight()
+    with pytest.raises(ValueError):
+        sf.do("k", lambda: (_ for _ in ()).throw(ValueError("boom")))
+    assert sf.do("k", lambda: 42) == 42
+    assert sf.stats()["in_flight"] == 0
+
+
+class SlowSession(FakeSession):
+    def get(self, url, timeout=None, headers=None, stream=False):
+        time.sleep(0.2)
+        return super().get(url, timeout=timeout, headers=headers)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_get_json_issues_one_upstream_request_per_url(monkeypatch):
+    u = url("pokemon-species", 1)
+    session = SlowSession(FakeResponse(status_code=200, json_data={"id": 1}))
+    monkeypatch.setattr("pokemon.services.api.client.get_session", lambda: session)
+    single_flight.reset_stats()
+
+    out = []
+    threads = [threading.Thread(target=lambda: out.append(get_json(u))) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(5)
+
+    assert out == [{"id": 1}] * 4
+    assert len(session.calls) == 1
+    assert ApiResourceCache.objects.filter(url=u).count() == 1
+    assert single_flight.stats()["coalesced"] == 3
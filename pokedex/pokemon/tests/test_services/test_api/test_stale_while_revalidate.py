@@ -0,0 +1,63 @@
+import datetime as dt
+import pytest
+
+from pokemon.models import ApiResourceCache
+from pokemon.services.api import url, get_json
+
+from .conftest import FakeResponse
+
+
+@pytest.fixture
+def swr(settings, monkeypatch):
+    """Enable SWR and capture scheduled jobs instead of running them in a thread."""
+    settings.POKEAPI_STALE_WHILE_REVALIDATE = {"ENABLED": True, "MAX_STALE": 3600}
+    jobs = []
+    monkeypatch.setattr(
+        "pokemon.services.api.client.schedule_revalidation",
+        lambda u, fn: jobs.append((u, fn)) or True,
+    )
+    return jobs
+
+
+@pytest.mark.django_db
+def test_stale_row_is_served_immediately_and_revalidated_later(freeze_now, patch_session, swr):
+    u = url("pokemon-species", 25)
+    row = ApiResourceCache.objects.create(
+        url=u, payload={"id": 25}, etag="e25", expires_at=freeze_now - dt.timedelta(minutes=5)
+    )
+    session = patch_session(FakeResponse(status_code=304))
+
+    assert get_json(u, ttl=dt.timedelta(hours=1)) == {"id": 25}
+    assert session.calls == [], "no upstream request on the request path"
+    assert [j[0] for j in swr] == [u]
+
+    swr[0][1]()  # run the background revalidation inline
+    assert session.calls[-1]["headers"].get("If-None-Match") == "e25"
+    row.refresh_from_db()
+    assert row.expires_at == freeze_now + dt.timedelta(hours=1)
+
+
+@pytest.mark.django_db
+def test_rows_beyond_max_stale_block_on_revalidation(freeze_now, patch_session, swr):
+    u = url("pokemon-species", 26)
+    ApiResourceCache.objects.create(
+        url=u, payload={"id": 26}, expires_at=freeze_now - dt.timedelta(hours=2)
+    )
+    session = patch_session(FakeResponse(status_code=200, json_data={"id": 26, "name": "v2"}))
+
+    assert get_json(u) == {"id": 26, "name": "v2"}
+    assert len(session.calls) == 1
+    assert swr == []
+
+
+@pytest.mark.django_db
+def test_allow_stale_false_overrides_settings(freeze_now, patch_session, swr):
+    u = url("pokemon-species", 27)
+    ApiResourceCache.objects.create(
+        url=u, payload={"id": 27}, expires_at=freeze_now - dt.timedelta(minutes=1)
+    )
+    session = patch_session(FakeResponse(status_code=200, json_data={"id": 27, "name": "v2"}))
+
+    assert get_json(u, allow_stale=False) == {"id": 27, "name": "v2"}
+    assert len(session.calls) == 1
+    assert swr == []
@@ -0,0 +1,36 @@
+import datetime as dt
+
+import pytest
+
+from pokemon.models import ApiResourceCache
+from pokemon.services.api import url, get_json, get_json_many
+from pokemon.services.api.policies import DEFAULT_TTL, ttl_for
+
+from .conftest import FakeResponse
+
+
+def test_policy_lookup_by_resource_type(settings):
+    settings.POKEAPI_TTL_POLICIES = {"pokemon": 3600, "berry:index": 60}
+    assert ttl_for(url("pokemon", 25)) == dt.timedelta(hours=1)
+    assert ttl_for(url("type", 3)) == dt.timedelta(days=30)
+    assert ttl_for(url("pokemon") + "?limit=20") == dt.timedelta(hours=6)  # "*:index"
+    assert ttl_for(url("berry")) == dt.timedelta(seconds=60)
+    assert ttl_for(url("berry", 1)) == DEFAULT_TTL
+
+
+@pytest.mark.django_db
+def test_entries_get_the_ttl_and_resource_of_their_type(freeze_now, url_session):
+    url_session({
+        url("type", 3): FakeResponse(status_code=200, json_data={"id": 3, "name": "flying"}),
+        url("pokemon", 1, "encounters"): FakeResponse(status_code=200, json_data=[]),
+    })
+
+    get_json(url("type", 3))
+    get_json_many([url("pokemon", 1, "encounters")])
+    get_json(url("type", 3), ttl=dt.timedelta(minutes=5))  # explicit TTL wins (fresh row → no request)
+
+    rows = {r.url: r for r in ApiResourceCache.objects.all()}
+    assert rows[url("type", 3)].resource == "type"
+    assert rows[url("type", 3)].expires_at == freeze_now + dt.timedelta(days=30)
+    assert rows[url("pokemon", 1, "encounters")].resource == "pokemon:encounters"
+    assert rows[url("pokemon", 1, "encounters")].expires_at == freeze_now + dt.timedelta(days=7)
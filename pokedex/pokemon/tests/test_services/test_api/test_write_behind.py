@@ -0,0 +1,51 @@
+import datetime as dt
+
+import pytest
+
+from pokemon.models import ApiResourceCache
+from pokemon.services.api import url, get_json, memory_cache
+from pokemon.services.api.cache import load_row
+from pokemon.services.api.writebehind import WriteBehind
+
+from .conftest import FakeResponse
+
+
+@pytest.fixture
+def queue(settings, monkeypatch):
+    settings.POKEAPI_WRITE_BEHIND = {"ENABLED": True}
+    wb = WriteBehind(max_queue=2, batch_size=10, flush_interval=60)  # the test flushes, not the thread
+    monkeypatch.setattr("pokemon.services.api.cache.write_behind", wb)
+    return wb
+
+
+@pytest.mark.django_db
+def test_fetched_payloads_are_queued_until_flush(freeze_now, patch_session, queue):
+    u = url("pokemon-species", 25)
+    session = patch_session(FakeResponse(status_code=200, json_data={"id": 25, "name": "pikachu"}))
+
+    assert get_json(u, ttl=dt.timedelta(hours=1))["name"] == "pikachu"
+    assert not ApiResourceCache.objects.filter(url=u).exists()
+    assert load_row(u).etag == "" and queue.stats()["pending"] == 1
+
+    memory_cache.clear()
+    assert get_json(u)["name"] == "pikachu"  # served from the queued entry
+    assert len(session.calls) == 1
+
+    queue.flush()
+    row = ApiResourceCache.objects.get(url=u)
+    assert row.payload["name"] == "pikachu" and row.expires_at == freeze_now + dt.timedelta(hours=1)
+    assert queue.stats()["pending"] == 0 and queue.stats()["batches"] == 1
+
+
+@pytest.mark.django_db
+def test_full_queue_writes_inline(freeze_now, url_session, queue):
+    urls = [url("move", i) for i in (1, 2, 3)]
+    url_session({u: FakeResponse(status_code=200, json_data={"id": i}) for i, u in enumerate(urls, 1)})
+
+    for u in urls:
+        get_json(u)
+
+    assert list(ApiResourceCache.objects.values_list("url", flat=True)) == [urls[2]]
+    assert queue.stats()["inline"] == 1
+    queue.flush()
+    assert ApiResourceCache.objects.count() == 3
@@ -0,0 +1,92 @@
+import asyncio
+import threading
+
+from pokemon.services.cache.core import (
+    TargetStream, aiter_chunks, arun_main_pass, arun_retry_passes, arun_stream_pass,
+)
+
+
+def test_async_passes_respect_concurrency_and_retry_failures():
+    in_flight = {"now": 0, "max": 0}
+    attempts = {}
+
+    async def run_one(item_id):
+        in_flight["now"] += 1
+        in_flight["max"] = max(in_flight["max"], in_flight["now"])
+        await asyncio.sleep(0.001)
+        in_flight["now"] -= 1
+        attempts[item_id] = attempts.get(item_id, 0) + 1
+        return item_id != 7 or attempts[item_id] > 1
+
+    stored = set()
+
+    async def run_and_store(item_id):
+        ok = await run_one(item_id)
+        if ok:
+            stored.add(item_id)
+        return ok
+
+    async def _run():
+        good, failed, done = await arun_main_pass(
+            list(range(1, 41)),
+            concurrency=10,
+            batch_size=5,
+            sleep_between_batches=0.0,
+            run_one=run_and_store,
+            progress=None,
+            metric_key="synced",
+            progress_every_n=10,
+            missing_after_chunk=lambda chunk: set(chunk) - stored,
+            t0=0.0,
+        )
+        add, remaining = await arun_retry_passes(
+            failed,
+            concurrency=10,
+            rounds=2,
+            run_one_retry=run_and_store,
+            have_in_db=lambda ids: set(ids) & stored,
+            progress=None,
+            metric_key="synced",
+            t0=0.0,
+        )
+        return good, failed, done, add, remaining
+
+    good, failed, done, add, remaining = asyncio.run(_run())
+    assert (good, failed, done) == (39, [7], 40)
+    assert (add, remaining) == (1, [])
+    assert in_flight["max"] == 10  # chunks grow to the concurrency limit
+
+
+def test_async_stream_pass_starts_before_the_index_is_read():
+    first_item_done = threading.Event()
+    waited = []
+
+    def pages():  # blocking, like index pages arriving over the network
+        yield [1, 2, 3, 4]
+        waited.append(first_item_done.wait(timeout=5))
+        yield [5, 6, 7, 8]
+
+    stored = {3}
+    targets = TargetStream(pages(), lambda ids: set(ids) & stored, only_missing=True)
+
+    async def run_one(item_id):
+        stored.add(item_id)
+        first_item_done.set()
+        return True
+
+    good, failed, done = asyncio.run(arun_stream_pass(
+        aiter_chunks(targets),
+        total=8,
+        concurrency=2,
+        batch_size=2,
+        sleep_between_batches=0.0,
+        run_one=run_one,
+        progress=None,
+        metric_key="synced",
+        progress_every_n=10,
+        missing_after_chunk=lambda chunk: set(chunk) - stored,
+        t0=0.0,
+        skipped=lambda: targets.skipped,
+    ))
+    assert waited == [True]  # page 2 was still pending while page 1 was being synced
+    assert (good, failed, done, targets.skipped) == (7, [], 7, 1)
@@ -0,0 +1,68 @@
+import threading
+
+import pytest
+
+from pokemon.models import EvolutionChainCache
+from pokemon.services.cache.core import BatchWriter
+from pokemon.services.cache.evo import upsert as evo_upsert
+from pokemon.services.cache.evo.upsert import EvoChainRecord, write_evo_chain
+
+
+def _chain_ids():
+    return set(EvolutionChainCache.objects.values_list("chain_id", flat=True))
+
+
+@pytest.mark.django_db(transaction=True)
+def test_writer_commits_records_in_batches_and_skips_bad_ones():
+    seen_threads = set()
+
+    def write(record):
+        seen_threads.add(threading.current_thread().name)
+        write_evo_chain(record)
+
+    records = [EvoChainRecord(chain_id=i, species_ids=[i * 10, i * 10 + 1]) for i in range(1, 13)]
+    records[4] = EvoChainRecord(chain_id=5, species_ids=[])  # IndexError on root_species_id
+
+    with BatchWriter(write, batch_size=5, flush_interval=5.0) as writer:
+        for r in records:
+            writer.submit(r)
+        have = writer.after_flush(_chain_ids)()
+
+    assert have == set(range(1, 13)) - {5}
+    stats = writer.stats()
+    assert (stats["written"], stats["failed"]) == (11, 1)
+    assert stats["batches"] < len(records)
+    assert seen_threads == {"pokeapi-sync-writer"}
+
+
+@pytest.mark.django_db(transaction=True)
+def test_staged_fetch_writes_only_through_the_writer(monkeypatch):
+    monkeypatch.setattr(
+        evo_upsert, "get_json",
+        lambda u: {"chain": {"species": {"url": "https://pokeapi.co/api/v2/pokemon-species/4/"},
+                             "evolves_to": []}},
+    )
+    with BatchWriter(write_evo_chain) as writer:
+        stage = writer.stage(evo_upsert.fetch_evo_chain)
+        stage(7)
+        writer.flush()
+        assert _chain_ids() == {7}
+
+
+@pytest.mark.django_db(transaction=True)
+def test_rejected_batch_falls_back_to_per_record_writes():
+    def write_all(batch):
+        for r in batch:
+            write_evo_chain(r)
+
+    records = [EvoChainRecord(chain_id=i, species_ids=[i]) for i in (1, 2, 3)]
+    records[1] = EvoChainRecord(chain_id=2, species_ids=[])
+
+    with BatchWriter(write_evo_chain, batch_fn=write_all, batch_size=10, flush_interval=5.0) as writer:
+        for r in records:
+            writer.submit(r)
+        writer.flush()
+        assert _chain_ids() == {1, 3}  # the failed set write was rolled back, then redone per record
+
+    stats = writer.stats()
+    assert (stats["written"], stats["failed"], stats["fallbacks"]) == (2, 1, 1)
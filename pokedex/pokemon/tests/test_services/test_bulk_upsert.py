@@ -0,0 +1,54 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from pokemon.models import Ability, Generation, PokemonCache, Type
+from pokemon.services.cache.pokemon.upsert import PokemonRecord, write_pokemon, write_pokemon_batch
+
+
+@pytest.fixture
+def taxonomies(db):
+    Generation.objects.create(slug="generation-i", name="Generation I")
+    for slug in ("fire", "water", "grass"):
+        Type.objects.create(slug=slug, name=slug.title())
+    for slug in ("blaze", "torrent"):
+        Ability.objects.create(slug=slug, name=slug.title())
+
+
+def _record(i, types=("fire",), abilities=("blaze",), **kw):
+    return PokemonRecord(
+        pokeapi_id=i, name=f"mon-{i}", height=i, weight=10 * i, base_stats={"hp": i},
+        generation_slug="generation-i", type_slugs=list(types), ability_slugs=list(abilities), **kw,
+    )
+
+
+def _links(p):
+    return sorted(p.types.values_list("slug", flat=True)), sorted(p.abilities.values_list("slug", flat=True))
+
+
+def test_batch_write_matches_single_writes_and_replaces_links(taxonomies):
+    write_pokemon(_record(1, types=("fire", "grass")))
+    logs = []
+
+    n = write_pokemon_batch(
+        [_record(1, types=("water",), abilities=("torrent", "levitate"), is_legendary=True), _record(2)],
+        logger=logs.append,
+    )
+
+    assert n == 2
+    p1, p2 = PokemonCache.objects.order_by("pokeapi_id")
+    assert (p1.height, p1.is_legendary, p1.generation.slug) == (1, True, "generation-i")
+    assert _links(p1) == (["water"], ["torrent"])
+    assert _links(p2) == (["fire"], ["blaze"])
+    assert logs == ["[warn] Missing Ability 'levitate' for Pokémon #1 mon-1"]
+
+
+def test_batch_write_costs_the_same_statements_for_any_batch_size(taxonomies):
+    with CaptureQueriesContext(connection) as small:
+        write_pokemon_batch([_record(i) for i in range(1, 3)])
+    with CaptureQueriesContext(connection) as large:
+        write_pokemon_batch([_record(i, types=("water", "grass")) for i in range(1, 301)])
+
+    assert PokemonCache.objects.count() == 300
+    assert len(large.captured_queries) <= len(small.captured_queries) + 4
+    assert len(large.captured_queries) < 20
@@ -0,0 +1,71 @@
+import threading
+from types import SimpleNamespace
+
+from pokemon.services.api import url
+from pokemon.services.cache.core import TargetStream, index_pages, run_stream_pass
+
+
+def _fake_index(monkeypatch, count):
+    requested = []
+
+    def fake_get_json(u):
+        requested.append(u)
+        offset, limit = (int(p.split("=")[1]) for p in u.split("?")[1].split("&"))
+        ids = range(offset + 1, min(count, offset + limit) + 1)
+        return {"count": count, "results": [{"url": url("pokemon", i)} for i in ids]}
+
+    monkeypatch.setattr("pokemon.services.cache.core.indexing.get_json", fake_get_json)
+    return requested
+
+
+def test_index_pages_streams_pages_in_order_without_count_request(monkeypatch):
+    requested = _fake_index(monkeypatch, count=25)
+
+    count, pages = index_pages("pokemon", 10)
+    assert count == 25
+    assert list(pages) == [list(range(1, 11)), list(range(11, 21)), list(range(21, 26))]
+    assert requested[0].endswith("?offset=0&limit=10")  # the first page carries the count
+    assert len(requested) == 3
+
+
+def test_index_workers_close_their_db_connections_and_stop_when_closed(monkeypatch):
+    _fake_index(monkeypatch, count=25)
+    closed = []
+    monkeypatch.setattr("pokemon.services.cache.core.indexing.connections",
+                        SimpleNamespace(close_all=lambda: closed.append(threading.current_thread().name)))
+
+    _, pages = index_pages("pokemon", 10)
+    assert list(pages) == [list(range(1, 11)), list(range(11, 21)), list(range(21, 26))]
+    assert len(closed) == 2 and all(name.startswith("pokeapi-index") for name in closed)
+
+    _, pages = index_pages("pokemon", 10)
+    next(pages)
+    pages.close()  # abandoned early
+    assert list(pages) == []
+
+
+def test_stream_pass_upserts_pages_as_they_arrive(monkeypatch):
+    _fake_index(monkeypatch, count=25)
+    stored = {1, 2, 3}
+
+    def submit(ex, chunk):
+        return [ex.submit(lambda i=i: stored.add(i) or True) for i in chunk]
+
+    _, pages = index_pages("pokemon", 10)
+    targets = TargetStream(pages, lambda ids: set(ids) & stored, only_missing=True)
+    good, failed, done = run_stream_pass(
+        targets,
+        total=25,
+        batches=3,
+        workers=2,
+        sleep_between_batches=0.0,
+        submit_chunk=submit,
+        progress=None,
+        metric_key="synced",
+        progress_every_n=10,
+        missing_after_chunk=lambda chunk: set(chunk) - stored,
+        t0=0.0,
+        skipped=lambda: targets.skipped,
+    )
+    assert (good, failed, done, targets.skipped) == (22, [], 22, 3)
+    assert stored == set(range(1, 26))
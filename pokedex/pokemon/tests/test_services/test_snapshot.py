@@ -0,0 +1,109 @@
+import datetime as dt
+import hashlib
+import json
+import zipfile
+
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from pokemon.models import Ability, ApiResourceCache, EvolutionChainCache, Generation, PokemonCache, Type
+from pokemon.services.snapshot import export_snapshot, import_snapshot, SnapshotError
+
+
+def _seed():
+    fire = Type.objects.create(slug="fire", name="Fire")
+    blaze = Ability.objects.create(slug="blaze", name="Blaze")
+    gen = Generation.objects.create(slug="generation-i", name="Generation I")
+    p = PokemonCache.objects.create(pokeapi_id=4, name="charmander", base_stats={"hp": 39}, generation=gen)
+    p.types.set([fire])
+    p.abilities.set([blaze])
+    EvolutionChainCache.objects.create(chain_id=2, species_ids=[4, 5, 6], root_species_id=4)
+    ApiResourceCache.objects.create(
+        url="https://pokeapi.co/api/v2/pokemon/4/", payload={"id": 4}, etag="e4",
+        expires_at=dt.datetime(2030, 1, 1, tzinfo=dt.timezone.utc),
+    )
+    ApiResourceCache.objects.create(
+        url="https://pokeapi.co/api/v2/move/1/", body=b"\x00\x01binary", codec="zlib",
+    )
+
+
+@pytest.mark.django_db
+def test_export_import_roundtrip(tmp_path):
+    _seed()
+    path = tmp_path / "snap.zip"
+    manifest = export_snapshot(path)
+    assert manifest["tables"]["pokemon.pokemoncache"]["rows"] == 1
+
+    import_snapshot(path, replace=True)
+
+    p = PokemonCache.objects.get(pokeapi_id=4)
+    assert p.generation.slug == "generation-i"
+    assert [t.slug for t in p.types.all()] == ["fire"]
+    assert [a.slug for a in p.abilities.all()] == ["blaze"]
+    assert EvolutionChainCache.objects.get(chain_id=2).species_ids == [4, 5, 6]
+    row = ApiResourceCache.objects.get(url__endswith="/pokemon/4/")
+    assert row.payload == {"id": 4} and row.etag == "e4"
+    assert row.expires_at == dt.datetime(2030, 1, 1, tzinfo=dt.timezone.utc)
+    assert bytes(ApiResourceCache.objects.get(url__endswith="/move/1/").body) == b"\x00\x01binary"
+
+    # sequences continue after imported primary keys
+    assert Type.objects.create(slug="water", name="Water").pk > Type.objects.get(slug="fire").pk
+
+
+@pytest.mark.django_db
+def test_import_rejects_corrupted_file_and_non_empty_db(tmp_path):
+    _seed()
+    path = tmp_path / "snap.zip"
+    export_snapshot(path)
+
+    with pytest.raises(SnapshotError):
+        import_snapshot(path)  # tables not empty
+
+    bad = tmp_path / "bad.zip"
+    with zipfile.ZipFile(path) as src, zipfile.ZipFile(bad, "w") as dst:
+        for item in src.infolist():
+            data = src.read(item)
+            if item.filename == "tables/pokemon.type.jsonl":
+                data = data.replace(b"Fire", b"Fyre")
+            dst.writestr(item, data)
+
+    with pytest.raises(CommandError, match="Checksum"):
+        call_command("import_snapshot", str(bad), replace=True, quiet=True)
+    assert Type.objects.get(slug="fire").name == "Fire"
+
+    manifest = json.loads(zipfile.ZipFile(path).read("manifest.json"))
+    assert manifest["format"] == "pokedex-snapshot" and manifest["version"] == 2
+
+
+@pytest.mark.django_db
+def test_imports_version_1_snapshots_without_newer_tables_and_columns(tmp_path):
+    _seed()
+    path = tmp_path / "snap.zip"
+    export_snapshot(path)
+
+    old = tmp_path / "v1.zip"
+    with zipfile.ZipFile(path) as src, zipfile.ZipFile(old, "w") as dst:
+        manifest = json.loads(src.read("manifest.json"))
+        manifest["version"] = 1
+        del manifest["tables"]["pokemon.apiresourcealias"]
+        api = manifest["tables"]["pokemon.apiresourcecache"]
+        drop = api["columns"].index("resource")
+        del api["columns"][drop]
+        lines = []
+        for line in src.read(api["file"]).splitlines(keepends=True):
+            values = json.loads(line)
+            del values[drop]
+            lines.append(json.dumps(values).encode("utf-8") + b"\n")
+        data = b"".join(lines)
+        api["sha256"] = hashlib.sha256(data).hexdigest()
+        for item in src.infolist():
+            if item.filename == api["file"]:
+                dst.writestr(item, data)
+            elif item.filename.startswith("tables/") and "apiresourcealias" not in item.filename:
+                dst.writestr(item, src.read(item))
+        dst.writestr("manifest.json", json.dumps(manifest))
+
+    counts = import_snapshot(old, replace=True)
+    assert counts["pokemon.apiresourcealias"] == 0
+    assert ApiResourceCache.objects.get(url__endswith="/move/1/").resource == "move"
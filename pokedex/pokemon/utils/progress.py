@@ -62,6 +62,7 @@ class ProgressPrinter:
     batches: int       total number of batches
     rate: float        items per second
     eta: int|float     estimated seconds remaining
+    limit: int         live AIMD in-flight limit (optional)
     """
 
     def __init__(self, enabled: bool = True, stream: Optional[TextIO] = None):
@@ -105,12 +106,14 @@ class ProgressPrinter:
         batches = state.get("batches", 0)
         rate = float(state.get("rate", 0.0))
         eta = int(state.get("eta", 0.0))
+        limit = state.get("limit")
 
         phase_label = f"{phase} {batch}/{batches}" if batch and batches else phase
         msg = (
             f"\r[{phase_label}] {percent:3d}% | "
             f"done {done}/{total} | ok {synced} | fail {failed} | "
             f"skip {skipped} | {rate:.1f}/s | ETA {eta}s"
+            + (f" | limit {limit}" if limit else "")
         )
         self.stream.write(msg)
         self.stream.flush()
@@ -9,7 +9,7 @@ from pokemon.services.cache.evo.lookup import ensure_chain_for_species
 from pokemon.selectors import evo_display_from_ids
 from favorites.models import Favorite
 
-from pokemon.services.api import get_json, url
+from pokemon.services.api import get_json, get_json_many, url
 from pokemon.services.detail import (
     fetch_species,
     normalize_species,
@@ -26,13 +26,24 @@ class PokemonDetailView(TemplateView):
     template_name = "detail.html"
 
     # ---------- helpers ----------
+    def _warm_cache(self, any_id: int) -> None:
+        # One batch instead of several sequential lookups; errors (e.g. no
+        # species for a variety id) are handled by the individual fetches below.
+        # Hedged like those fetches: this batch is what actually hits upstream.
+        # Encounters are read by species id, only known once the species is
+        # resolved, so they are not part of the batch.
+        get_json_many([
+            url("pokemon-species", any_id),
+            url("pokemon", any_id),
+        ], hedge=True)
+
     def _resolve_species(self, any_id: int) -> int:
         try:
             spec = fetch_species(any_id)  # už je to species id
             return int(spec.get("id") or any_id), spec
 
         except Exception:
-            raw = get_json(url("pokemon", any_id))
+            raw = get_json(url("pokemon", any_id), hedge=True)
             spec_url = (raw.get("species") or {}).get("url")
 
             if not spec_url:
@@ -66,6 +77,7 @@ class PokemonDetailView(TemplateView):
     # ---------- GET ----------
     def get(self, request, pokeapi_id: int, *args, **kwargs):
         any_id = int(pokeapi_id)
+        self._warm_cache(any_id)
         species_id, species_raw = self._resolve_species(any_id)
 
         p = (
@@ -91,7 +103,7 @@ class PokemonDetailView(TemplateView):
 
         evolution_chain = self._evolution_list(species_id)
 
-        pokemon_raw = get_json(url("pokemon", any_id))
+        pokemon_raw = get_json(url("pokemon", any_id), hedge=True)
         req_vg = request.GET.get("vg") or None
         grouped, available_vgs, active_vg = extract_pokemon_moves(pokemon_raw, version_group=req_vg)
         grouped = annotate_some_moves(grouped, per_group=10)